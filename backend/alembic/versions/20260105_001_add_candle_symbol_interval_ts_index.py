@@ -0,0 +1,35 @@
+"""Add (symbol_id, interval, timestamp DESC) index on candle
+
+Revision ID: 20260105_001
+Revises: 4f93daae7d5c
+Create Date: 2026-01-05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260105_001'
+down_revision: Union[str, Sequence[str], None] = '4f93daae7d5c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Latest-price lookups fetch the newest 2 candles per (symbol, interval);
+    # this lets Postgres answer them with a single backward index scan.
+    op.create_index(
+        'ix_candles_symbol_interval_ts_desc',
+        'candle',
+        ['symbol_id', 'interval', sa.text('timestamp DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_candles_symbol_interval_ts_desc', table_name='candle')
@@ -0,0 +1,41 @@
+"""Add (user_id, symbol count DESC, updated_at DESC) index on user_watchlists
+
+Revision ID: 20260106_001
+Revises: 20260105_001
+Create Date: 2026-01-06
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260106_001'
+down_revision: Union[str, Sequence[str], None] = '20260105_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The watchlist endpoints pick a user's primary watchlist with
+    # ORDER BY coalesce(array_length(symbols, 1), 0) DESC, updated_at DESC LIMIT 1;
+    # indexing the same expressions turns that into a single index probe
+    # instead of a sort over all of the user's rows.
+    op.create_index(
+        'ix_user_watchlists_user_primary',
+        'user_watchlists',
+        [
+            'user_id',
+            sa.text('coalesce(array_length(symbols, 1), 0) DESC'),
+            sa.text('updated_at DESC'),
+        ],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_watchlists_user_primary', table_name='user_watchlists')
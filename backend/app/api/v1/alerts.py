@@ -10,7 +10,7 @@ from app.models.alert import Alert
 from app.models.alert_trigger import AlertTrigger
 from app.models.symbol import Symbol
 from app.schemas.alert import AlertCreate, AlertUpdate, AlertResponse, AlertTrigger as AlertTriggerSchema
-from app.core.enums import AlertCondition
+from app.core.enums import AlertCondition, alert_condition_from_str
 from app.services.indicator_registry.registry import get_registry
 from app.api.decorators import public_endpoint
 
@@ -80,7 +80,7 @@ async def create_alert(
     """
     # Validate condition is a valid AlertCondition
     try:
-        AlertCondition(alert_in.condition)
+        alert_condition_from_str(alert_in.condition)
     except ValueError:
         logger.warning(f"Invalid condition: {alert_in.condition}")
         raise HTTPException(
@@ -309,7 +309,7 @@ async def update_alert(
     # Validate condition if provided
     if alert_in.condition is not None:
         try:
-            AlertCondition(alert_in.condition)
+            alert_condition_from_str(alert_in.condition)
             alert.condition = alert_in.condition.value if isinstance(alert_in.condition, AlertCondition) else alert_in.condition
         except ValueError:
             raise HTTPException(
@@ -1,11 +1,14 @@
 import logging
 import time
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, Request
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from typing import List, Optional, Union, Dict, Any
 from datetime import datetime, timezone, timedelta
 import asyncio
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,8 @@ from app.services.incremental_worker import IncrementalUpdateWorker
 from app.services.alert_engine import AlertEngine
 from app.services.providers import YFinanceProvider
 from app.services.market_schedule import MarketSchedule
+from app.services.worker_manager import WorkerManager
+from app.services.cache import LRUCache, generate_cache_key
 from app.core.config import settings
 from app.api.decorators import public_endpoint
 # T020a: Performance logging
@@ -37,6 +42,15 @@ MAX_RANGE_DAYS = {
     "1wk": 365 * 10  # 10 years - matches backend CHUNK_POLICIES
 }
 
+# Short-lived cache of serialized GET /candles responses. Dashboards and multiple
+# tabs poll the same symbol/interval/"now-ish" range; a hit skips DB/provider work
+# and re-serialization entirely. Concurrent misses for the same key are coalesced
+# onto a single in-flight fetch.
+CANDLES_RESPONSE_TTL_SECONDS = 2
+_candles_response_cache = LRUCache(max_size=1024, ttl_seconds=CANDLES_RESPONSE_TTL_SECONDS)
+_candles_inflight: Dict[str, asyncio.Future] = {}
+_candles_adapter = TypeAdapter(List[CandleResponse])
+
 # --- Helper Functions ---
 def interval_to_timedelta(interval: str) -> timedelta:
     """Converts an interval string (e.g., '1m', '1h', '1d') to a timedelta object."""
@@ -66,6 +80,16 @@ def validate_interval_range(interval: str, from_ts: Optional[datetime], to_ts: O
             detail=f"Range too large for {interval}: max {max_days} days, got {days:.1f} days"
         )
 
+def floor_to_interval(ts: Optional[datetime], interval: str) -> Optional[datetime]:
+    """Round a timestamp down to its interval boundary (used for cache key reuse)."""
+    if ts is None:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    step = int(interval_to_timedelta(interval).total_seconds())
+    epoch = int(ts.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % step, tz=timezone.utc)
+
 # --- Dependency Providers ---
 
 def get_orchestrator(request: Request) -> DataOrchestrator:
@@ -76,9 +100,14 @@ def get_orchestrator_ws(websocket: WebSocket) -> DataOrchestrator:
     """Dependency to get the singleton DataOrchestrator from app state (WebSocket routes)."""
     return websocket.app.state.orchestrator
 
-def get_backfill_worker(orchestrator: DataOrchestrator = Depends(get_orchestrator)) -> BackfillWorker:
+def get_worker_manager(request: Request) -> WorkerManager:
+    """Dependency to get the singleton WorkerManager from app state."""
+    return request.app.state.worker_manager
+
+def get_backfill_worker(request: Request, orchestrator: DataOrchestrator = Depends(get_orchestrator)) -> BackfillWorker:
     """Dependency to get a BackfillWorker instance."""
-    backfill_service = BackfillService()
+    # Reuse the app-wide provider rather than building one per request
+    backfill_service = BackfillService(provider=request.app.state.yf_provider)
     return BackfillWorker(backfill_service, orchestrator, AsyncSessionLocal)
 
 def get_incremental_worker(db: AsyncSession = Depends(get_db), orchestrator: DataOrchestrator = Depends(get_orchestrator)) -> IncrementalUpdateWorker:
@@ -107,19 +136,17 @@ async def _get_price_for_symbol(symbol_str: str, interval: str, orchestrator: Da
             return {"symbol": symbol_str, "error": "Invalid ticker symbol"}
 
         try:
-            latest_candle_q = await db.execute(
-                select(Candle).where(Candle.symbol_id == symbol_obj.id, Candle.interval == interval)
-                .order_by(desc(Candle.timestamp)).limit(1)
+            # Latest and previous candle in one round trip (served by ix_candles_symbol_interval_ts_desc)
+            recent_q = await db.execute(
+                select(Candle.close, Candle.timestamp)
+                .where(Candle.symbol_id == symbol_obj.id, Candle.interval == interval)
+                .order_by(desc(Candle.timestamp)).limit(2)
             )
-            latest_candle = latest_candle_q.scalars().first()
-
-            if latest_candle:
-                prev_candle_q = await db.execute(
-                    select(Candle).where(Candle.symbol_id == symbol_obj.id, Candle.interval == interval,
-                                         Candle.timestamp < latest_candle.timestamp)
-                    .order_by(desc(Candle.timestamp)).limit(1)
-                )
-                prev_candle = prev_candle_q.scalars().first()
+            recent = recent_q.all()
+
+            if recent:
+                latest_candle = recent[0]
+                prev_candle = recent[1] if len(recent) > 1 else None
                 change = latest_candle.close - prev_candle.close if prev_candle else 0
                 change_percent = (change / prev_candle.close) * 100 if prev_candle and prev_candle.close else 0
                 return {
@@ -166,28 +193,58 @@ async def get_candles(
     if interval.endswith("w") and not interval.endswith("wk"):
         interval = interval[:-1] + "wk"
 
-    # DEBUG: Log first 5 candle timestamps to check for non-midnight times on 1d
-    if interval == '1d':
-        result = await db.execute(select(Symbol).filter(Symbol.ticker == symbol.upper()))
-        symbol_obj = result.scalars().first()
-        if symbol_obj:
-            check_result = await db.execute(
-                select(Candle)
-                .where(Candle.symbol_id == symbol_obj.id)
-                .where(Candle.interval == '1d')
-                .order_by(Candle.timestamp.desc())
-                .limit(10)
-            )
-            sample_candles = check_result.scalars().all()
-            print(f"\n========== DEBUG {symbol} 1d timestamps ==========")
-            for c in sample_candles:
-                ts_str = c.timestamp.isoformat() if hasattr(c.timestamp, 'isoformat') else str(c.timestamp)
-                print(f"  {ts_str}")
-            print(f"==============================\n")
-
     # Validate range before orchestrator call (prevents 500 errors for large intraday requests)
     validate_interval_range(interval, from_ts, to_ts)
 
+    cache_key = generate_cache_key(
+        symbol.upper(), interval, from_ts, floor_to_interval(to_ts, interval), local_only
+    )
+    cached_body = _candles_response_cache.get(cache_key)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
+    # Another request is already fetching this key - share its result. If
+    # that request is cancelled (client hung up) its future is cancelled
+    # too, and we fetch ourselves rather than fail with it.
+    while (inflight := _candles_inflight.get(cache_key)) is not None:
+        try:
+            body = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if inflight.cancelled() and not asyncio.current_task().cancelling():
+                continue
+            raise
+        return Response(content=body, media_type="application/json")
+
+    future = asyncio.get_running_loop().create_future()
+    _candles_inflight[cache_key] = future
+    try:
+        body = await _fetch_candles_body(symbol, interval, from_ts, to_ts, local_only, db, orchestrator)
+        _candles_response_cache.set(cache_key, body)
+        future.set_result(body)
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved so unshared failures aren't logged as unhandled
+        raise
+    except asyncio.CancelledError:
+        # Our own cancellation isn't the followers' failure: release them
+        # to retry instead of handing them the CancelledError
+        future.cancel()
+        raise
+    finally:
+        _candles_inflight.pop(cache_key, None)
+
+    return Response(content=body, media_type="application/json")
+
+async def _fetch_candles_body(
+    symbol: str,
+    interval: str,
+    from_ts: Optional[datetime],
+    to_ts: Optional[datetime],
+    local_only: bool,
+    db: AsyncSession,
+    orchestrator: DataOrchestrator
+) -> bytes:
+    """Fetch candles for get_candles and return the serialized List[CandleResponse] body."""
     # Auto-create symbol if it doesn't exist (helps new users get started with default symbols like SPY)
     from app.services.watchlist import get_or_create_symbol
     symbol_obj = await get_or_create_symbol(db, symbol.upper())
@@ -210,7 +267,7 @@ async def get_candles(
         )
         if not candles_data:
             raise HTTPException(status_code=404, detail="No data available")
-        return candles_data
+        return _candles_adapter.dump_json(_candles_adapter.validate_python(candles_data))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -219,13 +276,13 @@ async def get_candles(
 async def trigger_backfill(
     request: BackfillRequest,
     db: AsyncSession = Depends(get_db),
-    worker: BackfillWorker = Depends(get_backfill_worker)
+    worker: BackfillWorker = Depends(get_backfill_worker),
+    worker_manager: WorkerManager = Depends(get_worker_manager)
 ):
     job = await worker.backfill_service.create_job(
         db=db, symbol=request.symbol.upper(), interval=request.interval.lower(),
         start_date=request.start_date, end_date=request.end_date
     )
-    from app.main import worker_manager
     worker_manager.start_task(f"backfill_{job.id}", worker.run_job(job.id))
     return {
         "status": "pending", "job_id": job.id,
@@ -237,9 +294,9 @@ async def trigger_backfill(
 async def update_latest(
     symbol: str = Query(..., description="Ticker symbol"),
     interval: str = Query("1h", description="Timeframe"),
-    worker: IncrementalUpdateWorker = Depends(get_incremental_worker)
+    worker: IncrementalUpdateWorker = Depends(get_incremental_worker),
+    worker_manager: WorkerManager = Depends(get_worker_manager)
 ):
-    from app.main import worker_manager
     worker_manager.start_task(f"update_{symbol}_{interval}", worker.run_update(symbol, interval))
     return {"status": "success", "message": f"Incremental update for {symbol} ({interval}) triggered"}
 
@@ -318,14 +375,15 @@ async def websocket_endpoint(
                 current_candle_key = (latest_candle['timestamp'], latest_candle['close'])
 
                 if last_sent_candle_key != current_candle_key:
-                    await websocket.send_json({
-                        "timestamp": latest_candle['timestamp'].isoformat(),
-                        "open": latest_candle['open'],
-                        "high": latest_candle['high'],
-                        "low": latest_candle['low'],
-                        "close": latest_candle['close'],
-                        "volume": latest_candle['volume'],
-                    })
+                    # Compact positional payload: [timestamp, open, high, low, close, volume]
+                    await websocket.send_text(orjson.dumps([
+                        latest_candle['timestamp'].isoformat(),
+                        latest_candle['open'],
+                        latest_candle['high'],
+                        latest_candle['low'],
+                        latest_candle['close'],
+                        latest_candle['volume'],
+                    ]).decode())
                     last_sent_candle_key = current_candle_key
                     logger.info(f"WebSocket sent update for {symbol} ({interval}): {latest_candle['timestamp']} - Close: {latest_candle['close']}")
 
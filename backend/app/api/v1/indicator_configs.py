@@ -12,22 +12,31 @@ Endpoints:
 
 Feature: 001-indicator-storage
 """
+import re
 import uuid
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, validator
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
-from app.services.auth_middleware import get_current_user
+from app.services.auth_middleware import get_current_user, resolve_user_id
 from app.models.indicator_config import IndicatorConfig
-from app.models.user import User
-from app.services.indicator_registry import get_registry
+from app.services.indicator_registry import get_registry, validate_indicator_params
 
 router = APIRouter()
 
+
+@lru_cache(maxsize=1)
+def _valid_indicator_names_lower(registry_version: int) -> frozenset:
+    """Lowercased registry names, rebuilt only when the registry changes."""
+    return frozenset(name.lower() for name in get_registry()._indicators)
+
+
 # =============================================================================
 # Pydantic Schemas
 # =============================================================================
@@ -60,11 +69,10 @@ class IndicatorConfigCreate(BaseModel):
     def validate_indicator_name(cls, v):
         """Validate indicator name against registry."""
         registry = get_registry()
-        valid_names = set(registry._indicators.keys())
         # Try case-insensitive match
         v_lower = v.lower()
-        if v_lower not in [name.lower() for name in valid_names]:
-            raise ValueError(f"Invalid indicator_name '{v}'. Valid names: {sorted(valid_names)}")
+        if v_lower not in _valid_indicator_names_lower(registry.version):
+            raise ValueError(f"Invalid indicator_name '{v}'. Valid names: {sorted(registry._indicators)}")
         return v_lower
 
     @validator('indicator_category')
@@ -93,93 +101,69 @@ class IndicatorConfigResponse(BaseModel):
     display_name: str
     style: Dict[str, Any]
     is_visible: bool
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
 
 
-# =============================================================================
-# Validation Helper (T021a: Indicator parameter validation)
-# =============================================================================
-
-def validate_indicator_params(indicator_name: str, params: Dict[str, Any]) -> None:
+# Columns needed to build IndicatorConfigResponse
+_RESPONSE_COLUMNS = (
+    IndicatorConfig.id,
+    IndicatorConfig.uuid,
+    IndicatorConfig.indicator_name,
+    IndicatorConfig.indicator_category,
+    IndicatorConfig.indicator_params,
+    IndicatorConfig.display_name,
+    IndicatorConfig.style,
+    IndicatorConfig.is_visible,
+    IndicatorConfig.created_at,
+    IndicatorConfig.updated_at,
+)
+
+
+def _to_response(config: Any) -> IndicatorConfigResponse:
+    """Build a response from an IndicatorConfig (or a _RESPONSE_COLUMNS row)
+    without re-running validation.
+
+    Rows coming out of indicator_configs were validated on the way in, so
+    model_construct() skips the per-field checks (N times for the list endpoint).
+    Endpoints return the dump as an ORJSONResponse so FastAPI does not
+    validate it a second time against response_model, which is kept for
+    the OpenAPI schema only.
     """
-    Validate indicator parameters against the indicator registry.
+    return IndicatorConfigResponse.model_construct(
+        id=config.id,
+        uuid=str(config.uuid),
+        indicator_name=config.indicator_name,
+        indicator_category=config.indicator_category,
+        indicator_params=config.indicator_params,
+        display_name=config.display_name,
+        style=config.style,
+        is_visible=config.is_visible,
+        created_at=config.created_at,
+        updated_at=config.updated_at,
+    )
 
-    Rejects invalid configs with 400 error (FR-009).
 
-    Args:
-        indicator_name: Indicator type name
-        params: Parameter values to validate
+_UUID_RE = re.compile(
+    r'\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z', re.I
+)
 
-    Raises:
-        HTTPException: 400 if parameters are invalid
-    """
-    registry = get_registry()
-    indicator = registry.get(indicator_name)
-    if not indicator:
-        indicator = registry.get_by_base_name(indicator_name)
 
-    if not indicator:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Indicator '{indicator_name}' not found in registry"
-        )
+def _parse_config_uuid(config_uuid: str) -> uuid.UUID:
+    """Parse a canonical hyphenated UUID path parameter.
 
-    param_defs = indicator.parameter_definitions
-
-    # Check for unknown parameters
-    unknown_params = set(params.keys()) - set(param_defs.keys())
-    if unknown_params:
+    Raises:
+        HTTPException: 400 if the value is not a canonical UUID string
+    """
+    if not _UUID_RE.match(config_uuid):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Unknown parameters for {indicator_name}: {sorted(unknown_params)}. "
-                   f"Valid parameters: {sorted(param_defs.keys())}"
+            detail="Invalid UUID format"
         )
-
-    # Validate each parameter
-    for param_name, param_value in params.items():
-        if param_name not in param_defs:
-            continue
-
-        param_def = param_defs[param_name]
-
-        # Type validation
-        expected_type = param_def.type
-        if expected_type == "integer":
-            if not isinstance(param_value, int):
-                try:
-                    params[param_name] = int(param_value)
-                except (ValueError, TypeError):
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Parameter '{param_name}' must be an integer, got {type(param_value).__name__}"
-                    )
-        elif expected_type == "float":
-            if not isinstance(param_value, (int, float)):
-                try:
-                    params[param_name] = float(param_value)
-                except (ValueError, TypeError):
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Parameter '{param_name}' must be a number, got {type(param_value).__name__}"
-                    )
-
-        # Range validation
-        if hasattr(param_def, 'min') and param_def.min is not None:
-            if params[param_name] < param_def.min:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Parameter '{param_name}' must be >= {param_def.min}, got {params[param_name]}"
-                )
-        if hasattr(param_def, 'max') and param_def.max is not None:
-            if params[param_name] > param_def.max:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Parameter '{param_name}' must be <= {param_def.max}, got {params[param_name]}"
-                )
+    return uuid.UUID(config_uuid)
 
 
 # =============================================================================
@@ -190,7 +174,7 @@ def validate_indicator_params(indicator_name: str, params: Dict[str, Any]) -> No
 async def get_indicator_configs(
     db: AsyncSession = Depends(get_db),
     user: dict = Depends(get_current_user),
-) -> List[IndicatorConfigResponse]:
+) -> ORJSONResponse:
     """
     Retrieve all indicator configurations for the authenticated user.
 
@@ -199,41 +183,24 @@ async def get_indicator_configs(
 
     Performance Target: <2 seconds (SC-001)
     """
-    # Get user ID from Firebase token
-    result = await db.execute(
-        select(User).where(User.firebase_uid == user['uid'])
-    )
-    db_user = result.scalar_one_or_none()
+    user_id = await resolve_user_id(db, user['uid'])
 
-    if db_user is None:
+    if user_id is None:
         # New user - no indicators stored yet
-        return []
-
-    user_id = db_user.id
+        return ORJSONResponse([])
 
     # Query all indicators for this user
+    # Select plain columns: rows expose the same attributes as the ORM object
+    # but skip identity-map/InstanceState setup for every config
+    # Fetch every row before building the response: the session may be closed
+    # while the body is sent, and DB errors must surface as an error response
     result = await db.execute(
-        select(IndicatorConfig)
+        select(*_RESPONSE_COLUMNS)
         .where(IndicatorConfig.user_id == user_id)
         .order_by(IndicatorConfig.created_at)
     )
-    indicators = result.scalars().all()
-
-    return [
-        IndicatorConfigResponse(
-            id=ind.id,
-            uuid=str(ind.uuid),
-            indicator_name=ind.indicator_name,
-            indicator_category=ind.indicator_category,
-            indicator_params=ind.indicator_params,
-            display_name=ind.display_name,
-            style=ind.style,
-            is_visible=ind.is_visible,
-            created_at=ind.created_at.isoformat(),
-            updated_at=ind.updated_at.isoformat(),
-        )
-        for ind in indicators
-    ]
+
+    return ORJSONResponse([_to_response(row).model_dump() for row in result])
 
 
 @router.post("", response_model=IndicatorConfigResponse, status_code=status.HTTP_201_CREATED)
@@ -241,7 +208,7 @@ async def create_indicator_config(
     config: IndicatorConfigCreate,
     db: AsyncSession = Depends(get_db),
     user: dict = Depends(get_current_user),
-) -> IndicatorConfigResponse:
+) -> ORJSONResponse:
     """
     Create a new indicator configuration.
 
@@ -251,19 +218,14 @@ async def create_indicator_config(
     Performance Target: <500ms (typical config)
     """
     # Get user ID from Firebase token
-    result = await db.execute(
-        select(User).where(User.firebase_uid == user['uid'])
-    )
-    db_user = result.scalar_one_or_none()
+    user_id = await resolve_user_id(db, user['uid'])
 
-    if db_user is None:
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User profile not found. Please sign in again."
         )
 
-    user_id = db_user.id
-
     # T021a: Validate indicator parameters
     validate_indicator_params(config.indicator_name, config.indicator_params)
 
@@ -283,17 +245,9 @@ async def create_indicator_config(
     await db.commit()
     await db.refresh(new_config)
 
-    return IndicatorConfigResponse(
-        id=new_config.id,
-        uuid=str(new_config.uuid),
-        indicator_name=new_config.indicator_name,
-        indicator_category=new_config.indicator_category,
-        indicator_params=new_config.indicator_params,
-        display_name=new_config.display_name,
-        style=new_config.style,
-        is_visible=new_config.is_visible,
-        created_at=new_config.created_at.isoformat(),
-        updated_at=new_config.updated_at.isoformat(),
+    return ORJSONResponse(
+        _to_response(new_config).model_dump(),
+        status_code=status.HTTP_201_CREATED,
     )
 
 
@@ -303,7 +257,7 @@ async def update_indicator_config(
     config: IndicatorConfigUpdate,
     db: AsyncSession = Depends(get_db),
     user: dict = Depends(get_current_user),
-) -> IndicatorConfigResponse:
+) -> ORJSONResponse:
     """
     Update an existing indicator configuration.
 
@@ -312,29 +266,17 @@ async def update_indicator_config(
 
     Performance Target: <500ms
     """
-    # Get user ID from Firebase token
-    result = await db.execute(
-        select(User).where(User.firebase_uid == user['uid'])
-    )
-    db_user = result.scalar_one_or_none()
+    # Parse UUID
+    config_uuid_parsed = _parse_config_uuid(config_uuid)
 
-    if db_user is None:
+    user_id = await resolve_user_id(db, user['uid'])
+
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User profile not found. Please sign in again."
         )
 
-    user_id = db_user.id
-
-    # Parse UUID
-    try:
-        config_uuid_parsed = uuid.UUID(config_uuid)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid UUID format"
-        )
-
     # Find the indicator configuration
     result = await db.execute(
         select(IndicatorConfig)
@@ -370,18 +312,7 @@ async def update_indicator_config(
     await db.commit()
     await db.refresh(existing_config)
 
-    return IndicatorConfigResponse(
-        id=existing_config.id,
-        uuid=str(existing_config.uuid),
-        indicator_name=existing_config.indicator_name,
-        indicator_category=existing_config.indicator_category,
-        indicator_params=existing_config.indicator_params,
-        display_name=existing_config.display_name,
-        style=existing_config.style,
-        is_visible=existing_config.is_visible,
-        created_at=existing_config.created_at.isoformat(),
-        updated_at=existing_config.updated_at.isoformat(),
-    )
+    return ORJSONResponse(_to_response(existing_config).model_dump())
 
 
 @router.delete("/{config_uuid}", status_code=status.HTTP_204_NO_CONTENT)
@@ -398,29 +329,17 @@ async def delete_indicator_config(
 
     Performance Target: <500ms
     """
-    # Get user ID from Firebase token
-    result = await db.execute(
-        select(User).where(User.firebase_uid == user['uid'])
-    )
-    db_user = result.scalar_one_or_none()
+    # Parse UUID
+    config_uuid_parsed = _parse_config_uuid(config_uuid)
+
+    user_id = await resolve_user_id(db, user['uid'])
 
-    if db_user is None:
+    if user_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User profile not found. Please sign in again."
         )
 
-    user_id = db_user.id
-
-    # Parse UUID
-    try:
-        config_uuid_parsed = uuid.UUID(config_uuid)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid UUID format"
-        )
-
     # Find the indicator configuration
     result = await db.execute(
         select(IndicatorConfig)
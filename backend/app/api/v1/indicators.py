@@ -6,11 +6,17 @@ This module provides REST API endpoints for:
 - Fetching full indicator metadata for frontend rendering
 """
 
+import asyncio
 import time
+from collections import defaultdict
+from functools import lru_cache
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Any, Dict, Optional, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, List, Tuple
+import orjson
 import pandas as pd
 import numpy as np
 import logging
@@ -18,8 +24,13 @@ from datetime import datetime, timezone, timedelta
 
 from app.db.session import get_db
 from app.models.symbol import Symbol
-from app.services.indicator_registry import get_registry
-from app.services.watchlist import get_or_create_symbol
+from app.services.indicator_registry import (
+    Indicator,
+    get_registry,
+    resolve_indicator,
+    validate_indicator_params,
+)
+from app.services.watchlist import resolve_symbol, resolve_symbols
 from app.schemas.indicator import (
     IndicatorOutput,
     IndicatorInfo,
@@ -31,7 +42,10 @@ from app.schemas.indicator import (
     BatchIndicatorResponse,
 )
 from app.services.orchestrator import DataOrchestrator
+from app.services.indicator_service import CANDLE_VALUE_COLUMNS, candles_to_arrays, candles_to_frame
 from app.core.config import settings
+from app.core.intervals import get_interval_seconds
+from app.core.performance_config import get_cache_ttl_for_interval
 from app.api.decorators import public_endpoint
 # T020b: Performance logging
 from app.services.performance import performance_logger
@@ -39,6 +53,66 @@ from app.services.performance import performance_logger
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Concurrent indicator requests for the same candle window share one
+# orchestrator.get_candles call instead of each hitting the DB/provider.
+_candles_inflight: Dict[Tuple[int, str, datetime, int], asyncio.Future] = {}
+
+
+# --- Helper Functions ---
+
+async def _get_candles_shared(
+    orchestrator: DataOrchestrator,
+    db: AsyncSession,
+    symbol_id: int,
+    ticker: str,
+    interval: str,
+    start: datetime,
+    end: datetime,
+) -> List[Dict[str, Any]]:
+    """orchestrator.get_candles, coalescing identical concurrent fetches.
+
+    Requests are keyed by (symbol_id, interval, start, end bucket), where the
+    end bucket is the candle period containing `end`, so "latest" requests
+    arriving within the same period share a fetch. Callers must treat the
+    returned list as read-only.
+    """
+    step = get_interval_seconds(interval)
+    key = (symbol_id, interval, start, int(end.timestamp() // step))
+
+    # Join an in-flight fetch; if its request is cancelled, fetch ourselves
+    while (inflight := _candles_inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if inflight.cancelled() and not asyncio.current_task().cancelling():
+                continue
+            raise
+
+    future = asyncio.get_running_loop().create_future()
+    _candles_inflight[key] = future
+    try:
+        candles_data = await orchestrator.get_candles(
+            db=db,
+            symbol_id=symbol_id,
+            ticker=ticker,
+            interval=interval,
+            start=start,
+            end=end
+        )
+        future.set_result(candles_data)
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved so unshared failures aren't logged as unhandled
+        raise
+    except asyncio.CancelledError:
+        # Release followers to retry rather than cancelling them with us
+        future.cancel()
+        raise
+    finally:
+        _candles_inflight.pop(key, None)
+
+    return candles_data
+
 
 # --- Dependency Providers ---
 
@@ -47,6 +121,18 @@ def get_orchestrator(request: Request) -> DataOrchestrator:
     return request.app.state.orchestrator
 
 
+@lru_cache(maxsize=1)
+def _indicator_list_body(registry_version: int) -> bytes:
+    """Encoded GET /indicators body, rebuilt only when the registry changes."""
+    return orjson.dumps(jsonable_encoder(get_registry().list_indicators()))
+
+
+@lru_cache(maxsize=1)
+def _supported_indicators_body(registry_version: int) -> bytes:
+    """Encoded GET /indicators/supported body, rebuilt only when the registry changes."""
+    return orjson.dumps(jsonable_encoder(get_registry().list_indicators_with_metadata()))
+
+
 @router.get("/", response_model=List[Dict[str, Any]])
 @public_endpoint
 async def list_indicators():
@@ -56,8 +142,8 @@ async def list_indicators():
     Returns basic info about each indicator including name, description, and parameters.
     For full metadata, use GET /indicators/supported.
     """
-    registry = get_registry()
-    return registry.list_indicators()
+    body = _indicator_list_body(get_registry().version)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/supported", response_model=List[Dict[str, Any]])
@@ -77,11 +163,12 @@ async def list_indicators_with_metadata():
     """
     registry = get_registry()
     try:
-        return registry.list_indicators_with_metadata()
+        body = _supported_indicators_body(registry.version)
     except Exception as e:
         logger.error(f"Error listing indicators with metadata: {e}")
         # Fallback to basic list if metadata not available
-        return registry.list_indicators()
+        body = _indicator_list_body(registry.version)
+    return Response(content=body, media_type="application/json")
 
 
 def _calculate_warmup_period(indicator_name: str, params: Dict[str, Any]) -> int:
@@ -98,6 +185,16 @@ def _calculate_warmup_period(indicator_name: str, params: Dict[str, Any]) -> int
     Returns:
         Number of periods needed for warm-up (minimum 10)
     """
+    numeric_items = tuple(sorted(
+        (k, v) for k, v in params.items() if isinstance(v, (int, float))
+    ))
+    return _warmup_cached(indicator_name.lower(), numeric_items)
+
+
+@lru_cache(maxsize=512)
+def _warmup_cached(indicator_name: str, items: Tuple[Tuple[str, Any], ...]) -> int:
+    """Memoized body of _calculate_warmup_period, keyed on hashable numeric params."""
+    params = dict(items)
     warmup = 0
 
     # Use the actual normalized keys that exist in indicator_params
@@ -198,14 +295,17 @@ async def get_indicator(
 
     Example: from=2023-01-01T00:00:00Z&to=2024-01-01T00:00:00Z
     """
-    import json
-
     # Normalize inputs
     interval = interval.lower()
     if interval == "1w":
         interval = "1wk"
     indicator_name = indicator_name.lower()
 
+    # Normalize the range to aware UTC once; every later comparison, cache key
+    # and fetch bound uses these values
+    from_ts = _as_utc(from_ts)
+    to_ts = _as_utc(to_ts)
+
     # Validate date range order (only validate order - don't enforce MAX_RANGE_DAYS like candles endpoint)
     # Indicators can have wider ranges (currently defaults to 1990)
     # The orchestrator/provider has hard caps (10,000 bar limit) that will apply
@@ -269,12 +369,12 @@ async def get_indicator(
     # Parse legacy JSON params and merge (query params take precedence)
     if params:
         try:
-            json_params = json.loads(params)
+            json_params = orjson.loads(params)
             # Only add JSON params that weren't already provided via query params
             for key, value in json_params.items():
                 if key not in indicator_params:
                     indicator_params[key] = value
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             raise HTTPException(status_code=400, detail="Invalid params JSON string")
 
     # Validate interval
@@ -286,14 +386,30 @@ async def get_indicator(
         )
 
     # FEATURE 014 T019: Check indicator cache first
-    from app.services.cache import get_indicator_result, cache_indicator_result
+    from app.services.cache import (
+        get_indicator_body,
+        get_indicator_result,
+        cache_indicator_body,
+        cache_indicator_result,
+        generate_shared_indicator_key,
+        get_shared_response,
+        set_shared_response,
+        generate_indicator_series_key,
+        get_indicator_series,
+        cache_indicator_series,
+    )
+
+    # Normalized once; reused for every cache key, lookup and the response
+    symbol_u = symbol.upper()
+    params_key = tuple(sorted(indicator_params.items()))
 
     try:
         cached_result = get_indicator_result(
-            symbol=symbol.upper(),
+            symbol=symbol_u,
             interval=interval,
             indicator_name=indicator_name,
             params=indicator_params,
+            params_key=params_key,
             from_ts=from_ts,
             to_ts=to_ts
         )
@@ -306,24 +422,67 @@ async def get_indicator(
                 category="cache",
                 context={"symbol": symbol, "indicator": indicator_name}
             )
-            return cached_result
+            # Serialized alongside the result unless it was cached by the batch endpoint
+            cached_body = get_indicator_body(
+                symbol=symbol_u,
+                interval=interval,
+                indicator_name=indicator_name,
+                params=indicator_params,
+                params_key=params_key,
+                from_ts=from_ts,
+                to_ts=to_ts
+            )
+            if cached_body is not None:
+                return Response(content=cached_body, media_type="application/json")
+            return _indicator_response(cached_result)
 
         logger.info(f"Indicator cache miss for {symbol}/{indicator_name}")
     except Exception as e:
         # T022: Graceful error handling for cache failures - fallback to DB
         logger.warning(f"Cache get failed for {symbol}/{indicator_name}: {e}, falling back to calculation")
 
-    # 1. Fetch or create Symbol (auto-creates in Symbol table for price lookups)
-    db_symbol = await get_or_create_symbol(db, symbol.upper())
+    # 1. Get indicator from registry - try by instance name first, then by base name.
+    # Unknown indicators and bad parameters fail before any DB or provider work.
+    indicator = resolve_indicator(indicator_name)
+    if not indicator:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Indicator '{indicator_name}' not found. Available: {list(get_registry()._indicators.keys())}"
+        )
+
+    # 2. Validate indicator parameters (coerces values in place)
+    validate_indicator_params(indicator_name, indicator_params)
+
+    # Shared (Redis) cache: serialized responses reused across worker processes.
+    # Keyed on the coerced params so equivalent spellings ("20", 20) share an entry.
+    # The bucket rolls over each candle period so open-ended requests refresh.
+    shared_key = generate_shared_indicator_key(
+        symbol=symbol_u,
+        interval=interval,
+        indicator_name=indicator_name,
+        params=indicator_params,
+        from_ts=from_ts,
+        to_ts=to_ts,
+        bucket=int(time.time() // get_interval_seconds(interval)),
+    )
+    shared_body = await get_shared_response(shared_key)
+    if shared_body is not None:
+        logger.info(f"Indicator shared cache hit for {symbol}/{indicator_name}")
+        return Response(content=shared_body, media_type="application/json")
+
+    # 3. Fetch or create Symbol (auto-creates in Symbol table for price lookups)
+    db_symbol = await resolve_symbol(db, symbol_u)
     if not db_symbol:
         raise HTTPException(status_code=404, detail=f"Invalid ticker symbol: {symbol}")
 
-    # 2. Determine fetch range
+    # 4. Determine fetch range
     # IMPORTANT: When from_ts is provided, use it directly WITHOUT adding warmup.
     # The frontend chart already fetches 700 candles (200 + 500 warmup), so all
     # indicators should use the exact same range to hit the candle cache.
     # Warmup is still applied when filtering the OUTPUT, not the fetch range.
-    end = to_ts if to_ts else datetime.now(timezone.utc)
+    # One clock read per request, reused for the fetch range and calculated_at
+    now_utc = datetime.now(timezone.utc)
+    end = to_ts if to_ts else now_utc
 
     if from_ts:
         # Use the exact requested range - no warmup adjustment for cache hit!
@@ -333,8 +492,9 @@ async def get_indicator(
         # Default behavior: fetch all data from 1990
         start = datetime(1990, 1, 1, tzinfo=timezone.utc)
 
-    # 3. Fetch candles
-    candles_data = await orchestrator.get_candles(
+    # 5. Fetch candles
+    candles_data = await _get_candles_shared(
+        orchestrator,
         db=db,
         symbol_id=db_symbol.id,
         ticker=db_symbol.ticker,
@@ -346,130 +506,64 @@ async def get_indicator(
     if not candles_data:
         raise HTTPException(status_code=404, detail="No candles found for symbol/interval")
 
-    # 4. Convert to DataFrame and prepare
-    df = pd.DataFrame(candles_data)
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df = df.sort_values("timestamp")
-    df = df.drop_duplicates(subset=["timestamp"], keep="first")
-
-    # Limit data points if requested
-    if limit and len(df) > limit:
-        df = df.tail(limit)
-
-    # 5. Get indicator from registry - try by instance name first, then by base name
-    registry = get_registry()
-    indicator = registry.get(indicator_name)
-    if not indicator:
-        # Try looking up by base name for dynamic parameter configuration
-        indicator = registry.get_by_base_name(indicator_name)
-    if not indicator:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Indicator '{indicator_name}' not found. Available: {list(registry._indicators.keys())}"
-        )
-
-    # 5.5 Validate indicator parameters
-    param_defs = indicator.parameter_definitions
-    for param_name, param_value in indicator_params.items():
-        if param_name not in param_defs:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid parameter '{param_name}' for indicator '{indicator_name}'. "
-                       f"Valid parameters: {list(param_defs.keys())}"
-            )
-
-        param_def = param_defs[param_name]
-
-        # Type validation
-        expected_type = param_def.type
-        if expected_type == "integer":
-            if not isinstance(param_value, int):
-                try:
-                    indicator_params[param_name] = int(param_value)
-                except (ValueError, TypeError):
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Parameter '{param_name}' must be an integer, got {type(param_value).__name__}"
-                    )
-        elif expected_type == "float":
-            if not isinstance(param_value, (int, float)):
-                try:
-                    indicator_params[param_name] = float(param_value)
-                except (ValueError, TypeError):
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Parameter '{param_name}' must be a number, got {type(param_value).__name__}"
-                    )
-
-        # Range validation
-        if hasattr(param_def, 'min') and param_def.min is not None:
-            if indicator_params[param_name] < param_def.min:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Parameter '{param_name}' must be >= {param_def.min}, got {indicator_params[param_name]}"
-                )
-        if hasattr(param_def, 'max') and param_def.max is not None:
-            if indicator_params[param_name] > param_def.max:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Parameter '{param_name}' must be <= {param_def.max}, got {indicator_params[param_name]}"
-                )
+    # Series computed from these exact candles (same last bar and count) are
+    # reused even when the request-level cache entry has expired
+    series_key = generate_indicator_series_key(
+        symbol_id=db_symbol.id,
+        interval=interval,
+        indicator_name=indicator_name,
+        params_key=tuple(sorted(indicator_params.items())),
+        last_candle=candles_data[-1],
+        n_candles=len(candles_data),
+        window=(limit, from_ts, to_ts),
+    )
 
-    # 6. Calculate indicator
+    # 6. Prepare DataFrame, calculate and extract series in a worker thread
+    # so the pandas work doesn't block the event loop
     try:
-        # T020b: Instrument only the expensive operation with performance logging
-        calc_start_time = time.time()
-        df_result = indicator.calculate(df, **indicator_params)
-        duration_ms = (time.time() - calc_start_time) * 1000
-        performance_logger.record(
-            operation=f"calculate_{indicator_name}",
-            duration_ms=duration_ms,
-            category="calculation",
-            context={"symbol": symbol, "interval": interval}
-        )
+        metadata = indicator.cached_metadata
+        series = get_indicator_series(series_key)
+        if series is not None:
+            timestamps, data = series
+            duration_ms = 0.0
+        else:
+            timestamps, data, duration_ms = await asyncio.to_thread(
+                _compute_indicator_sync,
+                candles_data,
+                indicator,
+                indicator_params,
+                limit,
+                from_ts,
+                to_ts,
+            )
+            cache_indicator_series(series_key, (timestamps, data), symbol=symbol_u)
+            # T020b: Instrument only the expensive operation with performance logging
+            performance_logger.record(
+                operation=f"calculate_{indicator_name}",
+                duration_ms=duration_ms,
+                category="calculation",
+                context={"symbol": symbol, "interval": interval}
+            )
 
-        # 7. Filter results to requested range (apply both bounds)
-        # This ensures indicators match the candle window exactly
-        if from_ts:
-            df_result = df_result[df_result['timestamp'] >= from_ts]
-        if to_ts:
-            df_result = df_result[df_result['timestamp'] <= to_ts]
-
-        # 8. Convert result to standardized output format
-        # Get metadata from indicator
-        metadata = indicator.metadata
-
-        # Collect all series data
-        data: Dict[str, List[Optional[float]]] = {}
-        for series_meta in metadata.series_metadata:
-            field = series_meta.field
-            if field in df_result.columns:
-                data[field] = _clean_series(df_result[field])
-
-        # Convert timestamps to Unix timestamps (seconds)
-        timestamps = [
-            int(ts.replace(tzinfo=timezone.utc).timestamp())
-            for ts in df_result["timestamp"]
-        ]
-
-        # 9. Build and return the result
+        # 7. Build and return the result
         result = IndicatorOutput(
-            symbol=symbol.upper(),
+            symbol=symbol_u,
             interval=interval,
             timestamps=timestamps,
             data=data,
             metadata=metadata,
-            calculated_at=datetime.utcnow(),
+            calculated_at=now_utc.replace(tzinfo=None),
             data_points=len(timestamps)
         )
 
         # T020: Cache the result after calculation
         try:
             cache_indicator_result(
-                symbol=symbol.upper(),
+                symbol=symbol_u,
                 interval=interval,
                 indicator_name=indicator_name,
                 params=indicator_params,
+                params_key=params_key,
                 result=result,
                 from_ts=from_ts,
                 to_ts=to_ts
@@ -487,47 +581,332 @@ async def get_indicator(
             context={"symbol": symbol, "indicator": indicator_name, "cached": False}
         )
 
-        return result
+        async def publish(body: bytes) -> None:
+            # Later hits return these bytes as-is, skipping re-serialization
+            try:
+                cache_indicator_body(
+                    symbol=symbol_u,
+                    interval=interval,
+                    indicator_name=indicator_name,
+                    params=indicator_params,
+                    params_key=params_key,
+                    body=body,
+                    from_ts=from_ts,
+                    to_ts=to_ts
+                )
+            except Exception as e:
+                logger.warning(f"Failed to cache indicator body for {symbol}/{indicator_name}: {e}")
+            await set_shared_response(shared_key, body, get_cache_ttl_for_interval(interval))
 
+        return await _published_indicator_response(result, publish)
+
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error calculating {indicator_name}: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("Error calculating %s", indicator_name)
         raise HTTPException(
             status_code=500,
             detail=f"Error calculating indicator: {str(e)}"
         )
 
 
-def _clean_series(series: pd.Series) -> List[Optional[float]]:
-    """Clean a pandas series for JSON serialization.
+def _clean_series_block(df: pd.DataFrame, fields: List[str]) -> Dict[str, List[Optional[float]]]:
+    """Extract indicator series for JSON serialization in one NumPy pass.
 
-    Replaces NaN and Inf with None for JSON compatibility.
+    All fields are pulled as a single float64 block; NaN and Inf become None.
+    Non-numeric values are coerced to NaN (and thus None).
     """
-    import math
-    cleaned = []
-    for x in series:
-        if pd.isna(x) or not math.isfinite(x):
-            cleaned.append(None)
-        elif isinstance(x, (float, np.floating)):
-            cleaned.append(float(x))
-        elif isinstance(x, (int, np.integer)):
-            cleaned.append(float(x))
-        else:
-            try:
-                val = float(x)
-                if math.isfinite(val):
-                    cleaned.append(val)
-                else:
-                    cleaned.append(None)
-            except (TypeError, ValueError):
-                cleaned.append(None)
-    return cleaned
+    if not fields:
+        return {}
+    block = df[fields]
+    if not all(pd.api.types.is_float_dtype(dtype) for dtype in block.dtypes):
+        block = block.apply(pd.to_numeric, errors="coerce")
+    return _clean_values(block.to_numpy(dtype=np.float64, na_value=np.nan).T, fields)
+
+
+def _clean_values(values: np.ndarray, fields: List[str]) -> Dict[str, List[Optional[float]]]:
+    """Convert a (fields x rows) float64 block to JSON lists, NaN/Inf -> None."""
+    missing = ~np.isfinite(values)
+    n_missing = int(np.count_nonzero(missing))
+    if n_missing * 4 > values.size:
+        # Sparse series (signals, markers): mask in an object array instead
+        # of patching most of the elements one by one
+        out = values.astype(object)
+        out[missing] = None
+        return dict(zip(fields, out.tolist()))
+    out = values.tolist()
+    # Non-finite values are usually just the warm-up head, so patch only those
+    rows, cols = np.nonzero(missing)
+    for row, col in zip(rows.tolist(), cols.tolist()):
+        out[row][col] = None
+    return dict(zip(fields, out))
+
+
+def _unix_seconds(timestamps: pd.Series) -> List[int]:
+    """Convert a datetime series to Unix timestamps (seconds) in one vectorized pass.
+
+    Naive values are treated as UTC. Columns that are already datetime64
+    (the case for candles_to_frame output) are not parsed again.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps, utc=True)
+    ns = timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+    return (ns // 1_000_000_000).tolist()
+
+
+def _coerced_params(indicator: Indicator, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a coerced copy of batch params, validated by Indicator.validate_params.
+
+    The caller's dict is left untouched so cache keys stay as requested.
+    Names the indicator doesn't declare are passed through unchecked, as
+    the batch endpoint has always done.
+
+    Raises:
+        ValueError: If any parameter fails type coercion or range checks
+    """
+    known = {name: value for name, value in params.items() if name in indicator.param_names}
+    indicator.validate_params(known, coerce=True)
+    return {**params, **known}
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a request bound to an aware UTC datetime (naive values are UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _slice_time_range(
+    df: pd.DataFrame,
+    from_ts: Optional[datetime],
+    to_ts: Optional[datetime],
+) -> pd.DataFrame:
+    """Restrict a timestamp-ordered frame to [from_ts, to_ts] by binary search.
+
+    Relies on the orchestrator's ordering guarantee, so one positional slice
+    replaces two boolean-mask passes. Timestamps and bounds are compared as
+    naive-UTC datetime64[ns] values.
+    """
+    if not from_ts and not to_ts:
+        return df
+    lo, hi = _time_range_bounds(df["timestamp"].to_numpy(dtype="datetime64[ns]"), from_ts, to_ts)
+    return df.iloc[lo:hi]
+
+
+def _time_range_bounds(
+    ts: np.ndarray,
+    from_ts: Optional[datetime],
+    to_ts: Optional[datetime],
+) -> Tuple[int, int]:
+    """Positional [lo, hi) bounds of [from_ts, to_ts] in a sorted datetime64[ns] array."""
+    lo = int(np.searchsorted(ts, _datetime64_utc(from_ts), side="left")) if from_ts else 0
+    hi = int(np.searchsorted(ts, _datetime64_utc(to_ts), side="right")) if to_ts else len(ts)
+    return lo, hi
+
+
+def _datetime64_utc(value: datetime) -> np.datetime64:
+    """Convert a bound to naive-UTC datetime64[ns] for direct array comparison."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(value, "ns")
+
+
+def _compute_indicator_sync(
+    candles_data: List[Dict[str, Any]],
+    indicator: Indicator,
+    indicator_params: Dict[str, Any],
+    limit: Optional[int],
+    from_ts: Optional[datetime],
+    to_ts: Optional[datetime],
+) -> Tuple[List[int], Dict[str, List[Optional[float]]], float]:
+    """CPU-bound part of get_indicator; runs in a worker thread.
+
+    Returns:
+        (timestamps, data, calculation duration in ms)
+    """
+    # Candles come back from the orchestrator ordered by timestamp and unique
+    # per (symbol, interval, timestamp), so no sort/dedup pass is needed
+    if indicator.supports_array_io:
+        # Array-native indicators never need the DataFrame
+        ts, columns = candles_to_arrays(candles_data)
+        return _compute_indicator_arrays(ts, columns, indicator, indicator_params, limit, from_ts, to_ts)
+
+    df = candles_to_frame(candles_data)
+    return _compute_indicator_frame(df, indicator, indicator_params, limit, from_ts, to_ts)
+
+
+def _compute_indicator_frame(
+    df: pd.DataFrame,
+    indicator: Indicator,
+    indicator_params: Dict[str, Any],
+    limit: Optional[int],
+    from_ts: Optional[datetime],
+    to_ts: Optional[datetime],
+) -> Tuple[List[int], Dict[str, List[Optional[float]]], float]:
+    """Calculate an indicator on a prepared candle frame (see _compute_indicator_sync).
+
+    Some indicator implementations add columns to their input in place, so
+    callers sharing one frame across indicators must pass a copy.
+    """
+    if indicator.supports_array_io:
+        ts = df["timestamp"].to_numpy(dtype="datetime64[ns]")
+        columns = {key: df[key].to_numpy() for key in CANDLE_VALUE_COLUMNS if key in df.columns}
+        return _compute_indicator_arrays(ts, columns, indicator, indicator_params, limit, from_ts, to_ts)
+
+    # Limit data points if requested
+    if limit and len(df) > limit:
+        df = df.tail(limit)
+
+    calc_start_time = time.time()
+    df_result = indicator.calculate(df, **indicator_params)
+    duration_ms = (time.time() - calc_start_time) * 1000
+
+    # Filter results to requested range (apply both bounds)
+    # This ensures indicators match the candle window exactly
+    df_result = _slice_time_range(df_result, from_ts, to_ts)
+
+    # Collect all series data
+    columns = set(df_result.columns)
+    fields = [field for field in indicator.series_fields if field in columns]
+    data = _clean_series_block(df_result, fields)
+
+    # Convert timestamps to Unix timestamps (seconds)
+    timestamps = _unix_seconds(df_result["timestamp"])
+
+    return timestamps, data, duration_ms
+
+
+def _compute_indicator_arrays(
+    ts: np.ndarray,
+    columns: Dict[str, np.ndarray],
+    indicator: Indicator,
+    indicator_params: Dict[str, Any],
+    limit: Optional[int],
+    from_ts: Optional[datetime],
+    to_ts: Optional[datetime],
+) -> Tuple[List[int], Dict[str, List[Optional[float]]], float]:
+    """Array I/O path of _compute_indicator_frame for indicators with supports_array_io.
+
+    Takes naive-UTC datetime64[ns] timestamps and float64 candle columns; no
+    DataFrame is built, filtered or re-extracted.
+    """
+    if limit and len(ts) > limit:
+        ts = ts[-limit:]
+        columns = {key: values[-limit:] for key, values in columns.items()}
+
+    calc_start_time = time.time()
+    outputs = indicator.calculate_arrays(columns, **indicator_params)
+    duration_ms = (time.time() - calc_start_time) * 1000
+
+    lo, hi = _time_range_bounds(ts, from_ts, to_ts)
+
+    fields = [field for field in indicator.series_fields if field in outputs]
+    values = np.empty((len(fields), hi - lo), dtype=np.float64)
+    for row, field in enumerate(fields):
+        values[row] = outputs[field][lo:hi]
+    data = _clean_values(values, fields)
+
+    timestamps = (ts[lo:hi].view(np.int64) // 1_000_000_000).tolist()
+    return timestamps, data, duration_ms
+
+
+# Responses with at least this many values (timestamps plus every series) are
+# streamed in chunks instead of being encoded into one buffer.
+_STREAM_MIN_VALUES = 20000
+_STREAM_CHUNK_POINTS = 1024
+
+
+def _iter_json_array(values: List[Any]) -> Iterator[bytes]:
+    """Encode a list as a JSON array, _STREAM_CHUNK_POINTS items per chunk."""
+    yield b"["
+    for start in range(0, len(values), _STREAM_CHUNK_POINTS):
+        chunk = orjson.dumps(values[start:start + _STREAM_CHUNK_POINTS])[1:-1]
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]"
+
+
+def _iter_indicator_json(result: IndicatorOutput) -> Iterator[bytes]:
+    """Encode an IndicatorOutput as the same JSON document as model_dump().
+
+    The scalar fields go out first, followed by the timestamps and each
+    series in chunks, read straight from the model so neither the full body
+    nor a dumped copy of the arrays sits in memory.
+    """
+    payload = result.model_dump(exclude={"timestamps", "data"})
+
+    yield orjson.dumps(payload)[:-1] + b',"timestamps":'
+    yield from _iter_json_array(result.timestamps)
+    yield b',"data":{'
+    for i, (field, values) in enumerate(result.data.items()):
+        yield (b"," if i else b"") + orjson.dumps(field) + b":"
+        yield from _iter_json_array(values)
+    yield b"}}"
+
+
+# Streamed bodies larger than this are sent but not published to the caches,
+# so streaming keeps peak memory below the full body size
+_PUBLISH_MAX_BYTES = 2 * 1024 * 1024
+
+
+async def _publish_streamed(
+    chunks: Iterator[bytes],
+    publish: Callable[[bytes], Awaitable[None]],
+    max_bytes: int = _PUBLISH_MAX_BYTES,
+) -> AsyncIterator[bytes]:
+    """Stream chunks and hand the joined body to ``publish`` at the end.
+
+    Chunks are only kept while the body stays within max_bytes; larger
+    bodies are not published.
+    """
+    parts: Optional[List[bytes]] = []
+    size = 0
+    for chunk in chunks:
+        if parts is not None:
+            size += len(chunk)
+            if size <= max_bytes:
+                parts.append(chunk)
+            else:
+                parts = None
+        yield chunk
+    if parts is not None:
+        await publish(b"".join(parts))
+
+
+def _is_large(result: IndicatorOutput) -> bool:
+    return len(result.timestamps) * (len(result.data) + 1) >= _STREAM_MIN_VALUES
+
+
+def _indicator_response(result: IndicatorOutput) -> Response:
+    """Serialize an already-validated IndicatorOutput straight to orjson.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder walk over the (up to 10k-point) data arrays. Large
+    results are streamed in chunks rather than encoded in one buffer.
+    """
+    if _is_large(result):
+        return StreamingResponse(_iter_indicator_json(result), media_type="application/json")
+    return ORJSONResponse(result.model_dump())
+
+
+async def _published_indicator_response(
+    result: IndicatorOutput, publish: Callable[[bytes], Awaitable[None]]
+) -> Response:
+    """Build the response for a fresh result and publish its serialized body."""
+    if _is_large(result):
+        return StreamingResponse(
+            _publish_streamed(_iter_indicator_json(result), publish),
+            media_type="application/json",
+        )
+    response = _indicator_response(result)
+    await publish(response.body)
+    return response
 
 
 @router.post("/batch", response_model=BatchIndicatorResponse)
 async def calculate_batch_indicators(
-    request: Dict[str, Any],
+    batch_request: BatchIndicatorRequest,
     db: AsyncSession = Depends(get_db),
     orchestrator: DataOrchestrator = Depends(get_orchestrator),
 ):
@@ -551,287 +930,91 @@ async def calculate_batch_indicators(
     - Maximum 10 requests per batch (FR-010)
     - Maximum processing time: 5 seconds (FR-014)
     """
-    import asyncio
     from app.services.cache import get_indicator_result, cache_indicator_result
 
     start_time = time.time()
+    # One clock read for the whole batch (fetch ranges and calculated_at)
+    now_utc = datetime.now(timezone.utc)
+    calculated_at = now_utc.replace(tzinfo=None)
     results = []
     errors = []
     cache_hits = 0
     cache_misses = 0
 
     # T033: Validate request (1-10 items) - Pydantic handles this via schema
-    try:
-        batch_request = BatchIndicatorRequest(**request)
-    except Exception as e:
-        raise HTTPException(status_code=422, detail=str(e))
-
-    # For deduplication (T036): Track processed request signatures
-    processed_signatures: Dict[str, Any] = {}
-    request_tasks = []
-
-    async def process_single_indicator(
-        idx: int,
-        req: IndicatorRequest,
-    ) -> Optional[IndicatorOutput]:
-        """T035, T038 [US2]: Process a single indicator request.
+    # (the typed body parameter is validated by FastAPI before we get here)
 
-        Returns IndicatorOutput on success, None on failure.
-        Errors are collected separately.
-        """
-        nonlocal cache_hits, cache_misses
-
-        try:
-            # T036: Create request signature for deduplication
-            params = req.params or {}
-            req_signature = f"{req.symbol}:{req.interval}:{req.indicator_name}:{sorted(params.items())}"
-
-            # T036: Check if this exact request was already processed
-            if req_signature in processed_signatures:
-                logger.debug(f"Duplicate request detected: {req_signature}, reusing cached result")
-                return processed_signatures[req_signature]
-
-            # T034: Check cache first
-            cached = get_indicator_result(
-                symbol=req.symbol.upper(),
-                interval=req.interval,
-                indicator_name=req.indicator_name,
-                params=params,
-                from_ts=req.from_ts,
-                to_ts=req.to_ts
-            )
-
-            if cached is not None:
-                cache_hits += 1
-                logger.info(f"Batch: Cache hit for {req.symbol}/{req.indicator_name}")
-                processed_signatures[req_signature] = cached
-                return cached
-
-            cache_misses += 1
-            logger.info(f"Batch: Cache miss for {req.symbol}/{req.indicator_name}")
-
-            # Fetch symbol from database
-            db_symbol = await get_or_create_symbol(db, req.symbol.upper())
-            if not db_symbol:
-                raise ValueError(f"Invalid ticker symbol: {req.symbol}")
-
-            # Determine fetch range
-            end = req.to_ts if req.to_ts else datetime.now(timezone.utc)
-            start = req.from_ts if req.from_ts else datetime(1990, 1, 1, tzinfo=timezone.utc)
-
-            # Fetch candles
-            candles_data = await orchestrator.get_candles(
-                db=db,
-                symbol_id=db_symbol.id,
-                ticker=db_symbol.ticker,
-                interval=req.interval,
-                start=start,
-                end=end
-            )
-
-            if not candles_data:
-                raise ValueError("No candles found for symbol/interval")
-
-            # Convert to DataFrame
-            df = pd.DataFrame(candles_data)
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
-            df = df.sort_values("timestamp")
-            df = df.drop_duplicates(subset=["timestamp"], keep="first")
-
-            # Get indicator from registry
-            registry = get_registry()
-            indicator = registry.get(req.indicator_name)
-            if not indicator:
-                indicator = registry.get_by_base_name(req.indicator_name)
-            if not indicator:
-                raise ValueError(f"Indicator '{req.indicator_name}' not found")
-
-            # Calculate
-            df_result = indicator.calculate(df, **params)
-
-            # Filter results to requested range (for consistency with single endpoint)
-            # This ensures indicators match the candle window exactly
-            if req.from_ts:
-                df_result = df_result[df_result['timestamp'] >= req.from_ts]
-            if req.to_ts:
-                df_result = df_result[df_result['timestamp'] <= req.to_ts]
-
-            # Build output
-            metadata = indicator.metadata
-            data = {}
-            for series_meta in metadata.series_metadata:
-                field = series_meta.field
-                if field in df_result.columns:
-                    data[field] = _clean_series(df_result[field])
-
-            timestamps = [
-                int(ts.replace(tzinfo=timezone.utc).timestamp())
-                for ts in df_result["timestamp"]
-            ]
-
-            result = IndicatorOutput(
-                symbol=req.symbol.upper(),
-                interval=req.interval,
-                indicator_name=req.indicator_name,
-                timestamps=timestamps,
-                data=data,
-                metadata=metadata,
-                calculated_at=datetime.utcnow(),
-                data_points=len(timestamps)
-            )
-
-            # Cache the result
-            cache_indicator_result(
-                symbol=req.symbol.upper(),
-                interval=req.interval,
-                indicator_name=req.indicator_name,
-                params=params,
-                result=result,
-                from_ts=req.from_ts,
-                to_ts=req.to_ts
-            )
-
-            # T036: Store in processed signatures for deduplication
-            processed_signatures[req_signature] = result
-
-            return result
-
-        except Exception as e:
-            logger.error(f"Error processing indicator {req.indicator_name} for {req.symbol}: {e}")
-            # Return None for error - caller will add to errors list
-            return None
-
-    async def process_single_indicator_with_candles(
-        idx: int,
-        req: IndicatorRequest,
-        candles_data: Any,
-        db_symbol: Any,
-    ) -> Optional[IndicatorOutput]:
-        """Process a single indicator using pre-fetched candles (optimized)."""
-        nonlocal cache_hits, cache_misses
-
-        try:
-            params = req.params or {}
-            req_signature = f"{req.symbol}:{req.interval}:{req.indicator_name}:{sorted(params.items())}"
-
-            # Check if this exact request was already processed
-            if req_signature in processed_signatures:
-                logger.debug(f"Duplicate request detected: {req_signature}, reusing cached result")
-                return processed_signatures[req_signature]
-
-            # Check cache first
-            cached = get_indicator_result(
-                symbol=req.symbol.upper(),
-                interval=req.interval,
-                indicator_name=req.indicator_name,
-                params=params,
-                from_ts=req.from_ts,
-                to_ts=req.to_ts
-            )
-
-            if cached is not None:
-                cache_hits += 1
-                logger.info(f"Batch: Cache hit for {req.symbol}/{req.indicator_name}")
-                processed_signatures[req_signature] = cached
-                return cached
+    for req in batch_request.requests:
+        req.from_ts = _as_utc(req.from_ts)
+        req.to_ts = _as_utc(req.to_ts)
 
+    # T036: Duplicate requests (same signature) reuse the first occurrence's output
+    signatures = [
+        (
+            req.symbol.upper(), req.interval, req.indicator_name,
+            tuple(sorted((req.params or {}).items())), req.from_ts, req.to_ts,
+        )
+        for req in batch_request.requests
+    ]
+    first_index: Dict[Tuple[Any, ...], int] = {}
+    outputs: List[Any] = [None] * len(batch_request.requests)
+    pending: List[int] = []
+
+    # T034: Check the cache for every request before any DB work
+    for idx, (req, signature) in enumerate(zip(batch_request.requests, signatures)):
+        if signature in first_index:
+            logger.debug(f"Duplicate request detected: {signature}, reusing result")
+            continue
+        first_index[signature] = idx
+
+        cached = get_indicator_result(
+            symbol=signature[0],
+            interval=req.interval,
+            indicator_name=req.indicator_name,
+            params=req.params or {},
+            params_key=signature[3],
+            from_ts=req.from_ts,
+            to_ts=req.to_ts
+        )
+        if cached is not None:
+            cache_hits += 1
+            logger.info(f"Batch: Cache hit for {req.symbol}/{req.indicator_name}")
+            outputs[idx] = cached
+        else:
             cache_misses += 1
             logger.info(f"Batch: Cache miss for {req.symbol}/{req.indicator_name}")
+            pending.append(idx)
+
+    # Misses with the same (symbol, interval, from_ts, to_ts) share one candle
+    # fetch; unknown indicators fail here without fetching anything
+    resolved: Dict[int, Indicator] = {}
+    request_groups: Dict[Tuple[Any, ...], List[int]] = defaultdict(list)
+    for idx in pending:
+        indicator = resolve_indicator(batch_request.requests[idx].indicator_name)
+        if not indicator:
+            logger.error(f"Indicator '{batch_request.requests[idx].indicator_name}' not found")
+            continue
+        resolved[idx] = indicator
+        symbol_u, interval, _, _, from_ts, to_ts = signatures[idx]
+        request_groups[(symbol_u, interval, from_ts, to_ts)].append(idx)
+
+    # Symbol rows for every group, existing ones loaded in a single query
+    db_symbols = (
+        await resolve_symbols(db, [key[0] for key in request_groups])
+        if request_groups else {}
+    )
 
-            # Convert to DataFrame (using shared candles)
-            df = pd.DataFrame(candles_data)
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
-            df = df.sort_values("timestamp")
-            df = df.drop_duplicates(subset=["timestamp"], keep="first")
-
-            # Get indicator from registry
-            registry = get_registry()
-            indicator = registry.get(req.indicator_name)
-            if not indicator:
-                indicator = registry.get_by_base_name(req.indicator_name)
-            if not indicator:
-                raise ValueError(f"Indicator '{req.indicator_name}' not found")
-
-            # Calculate
-            df_result = indicator.calculate(df, **params)
-
-            # Filter results to requested range
-            if req.from_ts:
-                df_result = df_result[df_result['timestamp'] >= req.from_ts]
-            if req.to_ts:
-                df_result = df_result[df_result['timestamp'] <= req.to_ts]
-
-            # Build output
-            metadata = indicator.metadata
-            data = {}
-            for series_meta in metadata.series_metadata:
-                field = series_meta.field
-                if field in df_result.columns:
-                    data[field] = _clean_series(df_result[field])
-
-            timestamps = [
-                int(ts.replace(tzinfo=timezone.utc).timestamp())
-                for ts in df_result["timestamp"]
-            ]
-
-            result = IndicatorOutput(
-                symbol=req.symbol.upper(),
-                interval=req.interval,
-                indicator_name=req.indicator_name,
-                timestamps=timestamps,
-                data=data,
-                metadata=metadata,
-                calculated_at=datetime.utcnow(),
-                data_points=len(timestamps)
-            )
-
-            # Cache the result
-            cache_indicator_result(
-                symbol=req.symbol.upper(),
-                interval=req.interval,
-                indicator_name=req.indicator_name,
-                params=params,
-                result=result,
-                from_ts=req.from_ts,
-                to_ts=req.to_ts
-            )
-
-            # Store in processed signatures for deduplication
-            processed_signatures[req_signature] = result
-
-            return result
-
-        except Exception as e:
-            logger.error(f"Error processing indicator {req.indicator_name} for {req.symbol}: {e}")
-            return None
-
-    # OPTIMIZATION: Group requests by (symbol, interval, from_ts, to_ts) to share candles
-    # This prevents fetching the same candle data multiple times
-    from collections import defaultdict
-
-    # Group requests that can share candles
-    request_groups: Dict[str, List[tuple[int, IndicatorRequest]]] = defaultdict(list)
-    for idx, req in enumerate(batch_request.requests):
-        # Create fetch signature - requests with same signature can share candles
-        fetch_signature = f"{req.symbol.upper()}:{req.interval}:{req.from_ts}:{req.to_ts}"
-        request_groups[fetch_signature].append((idx, req))
-
-    # Pre-fetch candles for each group, then process indicators
-    candles_cache: Dict[str, Any] = {}
-
-    async def fetch_candles_for_group(
-        req: IndicatorRequest,
-        db: AsyncSession
-    ) -> Optional[tuple[Any, Any]]:
-        """Fetch candles for a request. Returns (candles_data, db_symbol) or None."""
-        db_symbol = await get_or_create_symbol(db, req.symbol.upper())
+    async def fetch_candles_for_group(req: IndicatorRequest) -> Optional[pd.DataFrame]:
+        """Fetch a group's candles as a DataFrame, or None if there are none."""
+        db_symbol = db_symbols.get(req.symbol.upper())
         if not db_symbol:
             return None
 
-        end = req.to_ts if req.to_ts else datetime.now(timezone.utc)
+        end = req.to_ts if req.to_ts else now_utc
         start = req.from_ts if req.from_ts else datetime(1990, 1, 1, tzinfo=timezone.utc)
 
-        candles_data = await orchestrator.get_candles(
+        candles_data = await _get_candles_shared(
+            orchestrator,
             db=db,
             symbol_id=db_symbol.id,
             ticker=db_symbol.ticker,
@@ -843,54 +1026,78 @@ async def calculate_batch_indicators(
         if not candles_data:
             return None
 
-        return (candles_data, db_symbol)
+        # Build the DataFrame once per group; every indicator in it reuses it
+        return await asyncio.to_thread(candles_to_frame, candles_data)
 
-    # Fetch candles for each unique group
-    for fetch_signature, reqs_in_group in request_groups.items():
-        _, first_req = reqs_in_group[0]
-        candles_result = await fetch_candles_for_group(first_req, db)
-        candles_cache[fetch_signature] = candles_result
+    async def compute_indicator(
+        req: IndicatorRequest,
+        params_key: Tuple[Tuple[str, Any], ...],
+        indicator: Indicator,
+        candles_frame: pd.DataFrame,
+    ) -> IndicatorOutput:
+        """T035 [US2]: Calculate one indicator on its group's shared candle frame."""
+        params = req.params or {}
+        # Shallow copy: indicators may add columns, but share the OHLCV arrays
+        timestamps, data, _ = await asyncio.to_thread(
+            _compute_indicator_frame,
+            candles_frame.copy(deep=False),
+            indicator,
+            _coerced_params(indicator, params),
+            None,
+            req.from_ts,
+            req.to_ts,
+        )
 
-    # Now process all indicators using the shared candles
-    # T035: Process all requests in parallel using asyncio.gather
-    # T037: Timeout protection - wrap with asyncio.wait_for
-    try:
-        # Initialize outputs array
-        all_outputs = [None] * len(batch_request.requests)
-
-        # Create tasks for valid requests, tracking their indices
-        task_indices = []
-        tasks = []
-        for idx, req in enumerate(batch_request.requests):
-            fetch_signature = f"{req.symbol.upper()}:{req.interval}:{req.from_ts}:{req.to_ts}"
-            cached_value = candles_cache.get(fetch_signature, (None, None))
-
-            # Handle case where cached value is None (fetch failed) vs tuple (success)
-            if cached_value is None:
-                candles_data, db_symbol = None, None
-            else:
-                candles_data, db_symbol = cached_value
+        result = IndicatorOutput(
+            symbol=req.symbol.upper(),
+            interval=req.interval,
+            indicator_name=req.indicator_name,
+            timestamps=timestamps,
+            data=data,
+            metadata=indicator.cached_metadata,
+            calculated_at=calculated_at,
+            data_points=len(timestamps)
+        )
 
-            if candles_data is None:
-                # No candles available - mark as failed
-                all_outputs[idx] = None
-            else:
-                task_indices.append(idx)
-                tasks.append(process_single_indicator_with_candles(
-                    idx, req, candles_data, db_symbol
-                ))
+        cache_indicator_result(
+            symbol=req.symbol.upper(),
+            interval=req.interval,
+            indicator_name=req.indicator_name,
+            params=params,
+            params_key=params_key,
+            result=result,
+            from_ts=req.from_ts,
+            to_ts=req.to_ts
+        )
+        return result
+
+    # T035: Candle fetches share the request's DB session, so groups are fetched
+    # one after another; each group's calculations start in worker threads as
+    # soon as its candles arrive and overlap with the remaining fetches.
+    task_indices: List[int] = []
+    tasks: List[asyncio.Task] = []
+    for indices in request_groups.values():
+        first_req = batch_request.requests[indices[0]]
+        try:
+            candles_frame = await fetch_candles_for_group(first_req)
+        except Exception as e:
+            logger.error(f"Error fetching candles for {first_req.symbol} ({first_req.interval}): {e}")
+            candles_frame = None
+        if candles_frame is None:
+            # T038: Outputs stay None and are reported as failures
+            continue
+        for idx in indices:
+            task_indices.append(idx)
+            tasks.append(asyncio.create_task(compute_indicator(
+                batch_request.requests[idx], signatures[idx][3], resolved[idx], candles_frame
+            )))
 
-        # T037: Add 5-second timeout protection
+    # T037: Timeout protection - wrap with asyncio.wait_for
+    try:
         task_results = await asyncio.wait_for(
             asyncio.gather(*tasks, return_exceptions=True),
             timeout=5.0
         )
-
-        # Map results back to their original indices
-        for task_idx, result in zip(task_indices, task_results):
-            all_outputs[task_idx] = result
-
-        outputs = all_outputs
     except asyncio.TimeoutError:
         logger.error("Batch processing timed out after 5 seconds")
         raise HTTPException(
@@ -898,6 +1105,16 @@ async def calculate_batch_indicators(
             detail="Batch processing timeout (5 seconds exceeded)"
         )
 
+    for idx, result in zip(task_indices, task_results):
+        if isinstance(result, Exception):
+            req = batch_request.requests[idx]
+            logger.error(f"Error processing indicator {req.indicator_name} for {req.symbol}: {result}")
+            result = None
+        outputs[idx] = result
+
+    for idx, signature in enumerate(signatures):
+        outputs[idx] = outputs[first_index[signature]]
+
     # T038: Separate results and errors (partial failure handling)
     for idx, output in enumerate(outputs):
         # batch_request.requests is a list of IndicatorRequest objects
@@ -952,13 +1169,16 @@ async def calculate_batch_indicators(
         f"{total_duration_ms:.1f}ms"
     )
 
-    return BatchIndicatorResponse(
+    # Results are already validated IndicatorOutput models; serialize them
+    # directly rather than letting response_model re-validate every array
+    batch_response = BatchIndicatorResponse(
         results=results,
         errors=errors,
         total_duration_ms=total_duration_ms,
         cache_hits=cache_hits,
         cache_misses=cache_misses
     )
+    return ORJSONResponse(batch_response.model_dump())
 
 
 @router.get("/cache/stats", response_model=Dict[str, Any])
@@ -13,14 +13,15 @@ from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from app.services.auth_middleware import get_current_user
+from app.services.auth_middleware import get_current_user_id
 from app.services.merge_util import upsert_alert, upsert_watchlist, upsert_layouts, upsert_indicator_configs
-from app.db.session import AsyncSessionLocal
+from app.db.session import get_db
 from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.alert import Alert
 from app.models.user_watchlist import UserWatchlist
 from app.models.layout import Layout
-from app.models.user import User
+from app.models.indicator_config import IndicatorConfig
 
 router = APIRouter()
 
@@ -107,7 +108,8 @@ class MergeStatus(BaseModel):
 @router.post("/sync", response_model=MergeResponse)
 async def merge_guest_data(
     request: MergeRequest,
-    user: dict = Depends(get_current_user),
+    user_id: Optional[int] = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Merge guest localStorage data with cloud data.
@@ -120,38 +122,29 @@ async def merge_guest_data(
 
     Watchlists merge symbols arrays (deduplicated) but use same timestamp logic.
     """
-    # Get user ID from Firebase token
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            select(User).where(User.firebase_uid == user['uid'])
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User profile not found. Please sign in again.",
         )
-        db_user = result.scalar_one_or_none()
 
-        if db_user is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User profile not found. Please sign in again.",
-            )
+    # Merge alerts
+    alerts_data = [alert.model_dump() for alert in request.alerts]
+    # Need to map symbol names to symbol_ids for alerts
+    # For now, we'll store the symbol name and handle mapping later
+    alerts_stats = await upsert_alert(db, user_id, alerts_data)
 
-        user_id = db_user.id
+    # Merge watchlist
+    watchlist_data = request.watchlist.model_dump()
+    watchlist_stats = await upsert_watchlist(db, user_id, watchlist_data)
 
-        # Merge alerts
-        alerts_data = [alert.model_dump() for alert in request.alerts]
-        # Need to map symbol names to symbol_ids for alerts
-        # For now, we'll store the symbol name and handle mapping later
-        alerts_stats = await upsert_alert(db, user_id, alerts_data)
+    # Merge layouts
+    layouts_data = [layout.model_dump() for layout in request.layouts]
+    layouts_stats = await upsert_layouts(db, user_id, layouts_data)
 
-        # Merge watchlist
-        watchlist_data = request.watchlist.model_dump()
-        watchlist_stats = await upsert_watchlist(db, user_id, watchlist_data)
-
-        # Merge layouts
-        layouts_data = [layout.model_dump() for layout in request.layouts]
-        layouts_stats = await upsert_layouts(db, user_id, layouts_data)
-
-        # Merge indicators
-        indicators_data = [indicator.model_dump() for indicator in request.indicators]
-        indicators_stats = await upsert_indicator_configs(db, user_id, indicators_data)
+    # Merge indicators
+    indicators_data = [indicator.model_dump() for indicator in request.indicators]
+    indicators_stats = await upsert_indicator_configs(db, user_id, indicators_data)
 
     return MergeResponse(
         message="Merge completed successfully",
@@ -165,53 +158,27 @@ async def merge_guest_data(
 
 
 @router.get("/status", response_model=MergeStatus)
-async def get_merge_status(user: dict = Depends(get_current_user)):
+async def get_merge_status(
+    user_id: Optional[int] = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db),
+):
     """
     Get merge status (counts of stored entities for user).
 
     Returns the number of alerts, watchlists, and layouts stored in the cloud.
     """
-    async with AsyncSessionLocal() as db:
-        # Get user ID from Firebase token
-        result = await db.execute(
-            select(User).where(User.firebase_uid == user['uid'])
-        )
-        db_user = result.scalar_one_or_none()
-
-        if db_user is None:
-            # New user - no data stored yet
-            return MergeStatus(alerts=0, watchlists=0, layouts=0)
-
-        user_id = db_user.id
-
-        # Count alerts
-        alerts_result = await db.execute(
-            select(func.count(Alert.id)).where(Alert.user_id == user_id)
+    if user_id is None:
+        # New user - no data stored yet
+        return MergeStatus(alerts=0, watchlists=0, layouts=0, indicators=0)
+
+    # All four counts in one round trip
+    counts = (await db.execute(
+        select(
+            select(func.count(Alert.id)).where(Alert.user_id == user_id).scalar_subquery().label("alerts"),
+            select(func.count(UserWatchlist.id)).where(UserWatchlist.user_id == user_id).scalar_subquery().label("watchlists"),
+            select(func.count(Layout.id)).where(Layout.user_id == user_id).scalar_subquery().label("layouts"),
+            select(func.count(IndicatorConfig.id)).where(IndicatorConfig.user_id == user_id).scalar_subquery().label("indicators"),
         )
-        alerts_count = alerts_result.scalar() or 0
+    )).one()
 
-        # Count watchlists
-        watchlists_result = await db.execute(
-            select(func.count(UserWatchlist.id)).where(UserWatchlist.user_id == user_id)
-        )
-        watchlists_count = watchlists_result.scalar() or 0
-
-        # Count layouts
-        layouts_result = await db.execute(
-            select(func.count(Layout.id)).where(Layout.user_id == user_id)
-        )
-        layouts_count = layouts_result.scalar() or 0
-
-        # Count indicators
-        from app.models.indicator_config import IndicatorConfig
-        indicators_result = await db.execute(
-            select(func.count(IndicatorConfig.id)).where(IndicatorConfig.user_id == user_id)
-        )
-        indicators_count = indicators_result.scalar() or 0
-
-    return MergeStatus(
-        alerts=alerts_count,
-        watchlists=watchlists_count,
-        layouts=layouts_count,
-        indicators=indicators_count,
-    )
+    return MergeStatus(**counts._mapping)
@@ -16,11 +16,13 @@ All endpoints follow FR-AUTHZ requirements:
 Base URL: /api/v1/notifications
 """
 
+import asyncio
 import logging
 from typing import Optional, Dict, Any
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
@@ -39,18 +41,17 @@ from app.schemas.notification import (
     TelegramTestResult,
     SendNotificationRequest,
     SendNotificationResponse,
-    NotificationType,
     DeliveryStatus,
 )
-from app.services.auth_middleware import get_current_user
+from app.services.auth_middleware import get_current_user, get_current_user_profile
 from app.services.notification_service import (
     get_user_preference,
     create_or_update_preference,
     get_telegram_config,
     get_alert_notification_settings as get_alert_notification_settings_svc,
     create_or_update_alert_settings,
-    get_notification_history,
-    log_notification_delivery,
+    get_notification_history as get_notification_history_svc,
+    record_notification_delivery,
 )
 from app.services.telegram_service import (
     validate_telegram_credentials,
@@ -62,6 +63,12 @@ from app.api.dependencies import check_notification_ownership
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Upper bound for /telegram/validate's Bot API round trip
+TELEGRAM_VALIDATE_TIMEOUT_SECONDS = 5.0
+
+# Validates whole history pages straight from ORM rows (enum coercion included)
+_deliveries_adapter = TypeAdapter(list[NotificationDeliveryResponse])
+
 
 # =============================================================================
 # Settings Endpoints
@@ -69,7 +76,7 @@ router = APIRouter()
 
 @router.get("/settings", response_model=NotificationSettingsResponse)
 async def get_notification_settings(
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user_profile),
     db: AsyncSession = Depends(get_db),
 ) -> NotificationSettingsResponse:
     """
@@ -97,7 +104,7 @@ async def get_notification_settings(
 @router.patch("/settings", response_model=NotificationPreferenceResponse)
 async def update_notification_settings(
     settings_update: NotificationPreferenceUpdate,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user_profile),
     db: AsyncSession = Depends(get_db),
 ) -> NotificationPreferenceResponse:
     """
@@ -177,7 +184,7 @@ async def get_alert_notification_settings(
 @router.post("/alert-settings", response_model=AlertNotificationSettingsResponse, status_code=201)
 async def create_alert_notification_settings(
     settings_in: AlertNotificationSettingsCreate,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user_profile),
     db: AsyncSession = Depends(get_db),
 ) -> AlertNotificationSettingsResponse:
     """
@@ -256,7 +263,7 @@ async def update_alert_notification_settings(
 @router.post("/telegram/validate", response_model=TelegramValidationResult)
 async def validate_telegram(
     credentials: TelegramCredentialsValidate,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user_profile),
 ) -> TelegramValidationResult:
     """
     Validate Telegram credentials without saving.
@@ -264,9 +271,13 @@ async def validate_telegram(
     Tests connectivity to Telegram Bot API and verifies the bot token.
     """
     try:
-        is_valid, bot_username, error = await validate_telegram_credentials(
-            credentials.telegram_token,
-            credentials.telegram_chat_id,
+        # Bound the whole round trip so a slow Bot API can't hold the request
+        is_valid, bot_username, error = await asyncio.wait_for(
+            validate_telegram_credentials(
+                credentials.telegram_token,
+                credentials.telegram_chat_id,
+            ),
+            timeout=TELEGRAM_VALIDATE_TIMEOUT_SECONDS,
         )
 
         return TelegramValidationResult(
@@ -274,6 +285,12 @@ async def validate_telegram(
             bot_username=bot_username,
             error_message=error,
         )
+    except asyncio.TimeoutError:
+        logger.warning(f"Telegram validation timed out for user {user.id}")
+        return TelegramValidationResult(
+            valid=False,
+            error_message="Telegram API request timed out",
+        )
     except Exception as e:
         logger.error(f"Telegram validation error for user {user.id}: {e}")
         return TelegramValidationResult(
@@ -284,7 +301,7 @@ async def validate_telegram(
 
 @router.post("/telegram/test", response_model=TelegramTestResult)
 async def test_telegram(
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user_profile),
     db: AsyncSession = Depends(get_db),
 ) -> TelegramTestResult:
     """
@@ -307,32 +324,16 @@ async def test_telegram(
             "🔔 Test notification from PolishedCharts - Your Telegram integration is working!",
         )
 
-        # Log successful delivery
-        await log_notification_delivery(
-            db,
-            alert_id=user.id,  # Using user.id as pseudo alert_id for test messages
-            trigger_id=0,  # 0 indicates test message
-            user_id=user.id,
-            notification_type=NotificationType.TELEGRAM,
-            status=DeliveryStatus.SENT,
-            message="Test notification from PolishedCharts",
-        )
+        # Test messages aren't tied to an alert trigger, so they get no
+        # notification_deliveries row (alert_trigger_id is a required FK)
+        logger.info(f"Telegram test message sent for user {user.id}")
 
         return TelegramTestResult(
             success=True,
             message_id=str(message_id),
         )
     except TelegramError as e:
-        # Log failed delivery
-        await log_notification_delivery(
-            db,
-            alert_id=user.id,
-            trigger_id=0,
-            user_id=user.id,
-            notification_type=NotificationType.TELEGRAM,
-            status=DeliveryStatus.FAILED,
-            error_message=str(e),
-        )
+        logger.warning(f"Telegram test message failed for user {user.id}: {e}")
 
         return TelegramTestResult(
             success=False,
@@ -348,7 +349,7 @@ async def test_telegram(
 async def get_notification_history(
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user_profile),
     db: AsyncSession = Depends(get_db),
 ) -> NotificationDeliveryListResponse:
     """
@@ -356,25 +357,11 @@ async def get_notification_history(
 
     Paginated list of all notification deliveries for the user.
     """
-    items, total = await get_notification_history(db, user.id, limit=limit, offset=offset)
-
-    # Convert to response format
-    item_responses = []
-    for item in items:
-        item_responses.append(NotificationDeliveryResponse(
-            id=item.id,
-            alert_trigger_id=item.alert_trigger_id,
-            alert_id=item.alert_id,
-            user_id=item.user_id,
-            notification_type=NotificationType(item.notification_type),
-            status=DeliveryStatus(item.status),
-            triggered_at=item.triggered_at,
-            message=item.message,
-            error_message=item.error_message,
-            # These would need a join to populate - simplified for now
-            alert_name=None,
-            symbol=None,
-        ))
+    items, total = await get_notification_history_svc(db, user.id, limit=limit, offset=offset)
+
+    # Convert to response format; alert_name/symbol would need a join to
+    # populate and stay at their None defaults for now
+    item_responses = _deliveries_adapter.validate_python(items, from_attributes=True)
 
     return NotificationDeliveryListResponse(
         items=item_responses,
@@ -391,7 +378,7 @@ async def get_notification_history(
 @router.post("/send", response_model=SendNotificationResponse)
 async def send_notification(
     request: SendNotificationRequest,
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user_profile),
     db: AsyncSession = Depends(get_db),
 ) -> SendNotificationResponse:
     """
@@ -419,8 +406,7 @@ async def send_notification(
         logger.error(f"Failed to send notification: {e}")
 
         # Log the failed delivery
-        await log_notification_delivery(
-            db,
+        await record_notification_delivery(
             alert_id=user.id,  # Would need to fetch from alert_trigger
             trigger_id=request.alert_trigger_id,
             user_id=user.id,
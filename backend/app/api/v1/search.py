@@ -13,11 +13,18 @@ from pydantic import BaseModel, Field
 from app.api.decorators import public_endpoint
 from app.db.session import get_db
 from app.services.search import SearchService
+from app.services.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Typeahead issues the same prefixes ("A", "AA", "AAP", ...) over and over
+# across users; results are case-insensitive, so cache them by upper-cased
+# query. ticker_universe is only reseeded offline, so a short TTL is enough.
+SEARCH_CACHE_TTL_SECONDS = 60
+_search_cache = LRUCache(max_size=4096, ttl_seconds=SEARCH_CACHE_TTL_SECONDS)
+
 
 # --- Request/Response Schemas ---
 
@@ -55,11 +62,17 @@ async def search_symbols(
 
     **Frontend Debouncing**: Client should debounce input at 300ms (per AC-001)
     """
+    cache_key = q.upper()
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     service = SearchService(db)
 
     try:
         logger.info(f"[{request.url.path}] Search request: query='{q}'")
         results = await service.search_tickers(q)
+        _search_cache.set(cache_key, results)
         logger.info(f"[{request.url.path}] Search returned {len(results)} results for query='{q}'")
         return results
     except ValueError as e:
@@ -6,12 +6,14 @@ historical data backfill.
 """
 import asyncio
 import logging
+import re
 from datetime import datetime, timezone
-from uuid import UUID
+from typing import Optional, Tuple
+import uuid
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy import select, update, func, true, any_, case, exists, bindparam, ARRAY, Text
+from sqlalchemy.orm import aliased, load_only
 from pydantic import BaseModel, Field, field_validator
 
 from app.db.session import get_db
@@ -25,6 +27,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# T029: crypto ticker formats (*-USD, */USD) are not backfillable
+_CRYPTO_SUFFIX_RE = re.compile(r'[-/]USD$')
+
 
 # --- Request/Response Schemas ---
 
@@ -39,10 +44,8 @@ class WatchlistAddRequest(BaseModel):
         symbol = v.strip().upper()
 
         # T029: Reject crypto ticker formats (*-USD, */USD)
-        if '-' in symbol and symbol.endswith('-USD'):
-            raise ValueError("Crypto tickers with -USD format not supported in watchlist add/backfill")
-        if '/' in symbol and symbol.endswith('/USD'):
-            raise ValueError("Crypto tickers with /USD format not supported in watchlist add/backfill")
+        if _CRYPTO_SUFFIX_RE.search(symbol):
+            raise ValueError("Crypto tickers with -USD or /USD format not supported in watchlist add/backfill")
 
         return symbol
 
@@ -51,7 +54,7 @@ class WatchlistEntry(BaseModel):
     """Watchlist entry schema for per-user watchlist."""
     id: int
     symbol: str
-    added_at: str
+    added_at: datetime
     sort_order: int
 
     model_config = {"from_attributes": True}
@@ -82,7 +85,7 @@ class WatchlistReorderRequest(BaseModel):
         if not v:
             raise ValueError("ordered_symbols cannot be empty")
         # Normalize to uppercase
-        return [sym.strip().upper() for sym in v]
+        return list(map(str.upper, map(str.strip, v)))
 
 
 class ErrorResponse(BaseModel):
@@ -90,6 +93,69 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+# --- Helpers ---
+
+# How a user's "primary" watchlist is picked when they have several
+_PRIMARY_WATCHLIST_ORDER = (
+    # First priority: most symbols (empty arrays have NULL length, sort last)
+    func.coalesce(func.array_length(UserWatchlist.symbols, 1), 0).desc(),
+    # Second priority: most recently updated
+    UserWatchlist.updated_at.desc(),
+)
+
+
+def _stored_symbols():
+    """The watchlist row's symbols unnested, for correlated subqueries in
+    UPDATE ... WHERE clauses (legacy rows may hold mixed-case symbols)."""
+    return func.unnest(UserWatchlist.symbols).column_valued("symbol")
+
+
+async def _load_user_and_watchlist(
+    db: AsyncSession, firebase_uid: str, for_update: bool = False
+) -> Tuple[Optional[User], Optional[UserWatchlist]]:
+    """Load the user and their primary watchlist in one round trip.
+
+    The watchlist is outer-joined, so a user without one comes back as
+    (user, None); an unknown uid gives (None, None). When a user has several
+    watchlists, non-empty ones win, then the most recently updated.
+
+    With for_update=True the user row and the watchlist row are locked until
+    the transaction ends, which serializes concurrent watchlist writes for
+    the same user.
+
+    Only User.id and the watchlist's id and symbols are loaded; the writes
+    themselves are done with UPDATE statements.
+    """
+    # Pick the primary watchlist per user inside a LATERAL subquery so the
+    # (user_id, symbol count DESC, updated_at DESC) index answers it with a
+    # single probe instead of sorting every watchlist the user owns.
+    primary = (
+        select(UserWatchlist)
+        .where(UserWatchlist.user_id == User.id)
+        .order_by(*_PRIMARY_WATCHLIST_ORDER)
+        .limit(1)
+    )
+    if for_update:
+        # Locking the watchlist row makes Postgres re-read its latest version
+        # if we had to wait for a concurrent writer
+        primary = primary.with_for_update()
+    primary = primary.lateral()
+    watchlist = aliased(UserWatchlist, primary)
+    stmt = (
+        select(User, watchlist)
+        .outerjoin(watchlist, true())
+        .where(User.firebase_uid == firebase_uid)
+        .options(load_only(User.id), load_only(watchlist.id, watchlist.symbols))
+    )
+    if for_update:
+        stmt = stmt.with_for_update(of=User)
+    result = await db.execute(stmt)
+    row = result.first()
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
 # --- API Endpoints ---
 
 @router.get("", response_model=list[WatchlistEntry], tags=["watchlist"])
@@ -101,49 +167,30 @@ async def list_watchlist(
 
     Returns all symbols in the user's personal watchlist.
     """
-    # Get user from database - use first() to avoid MultipleResultsFound error
-    result = await db.execute(
-        select(User).where(User.firebase_uid == user['uid']).limit(1)
-    )
-    db_user = result.first()
-    db_user = db_user[0] if db_user else None
-
-    if db_user is None:
-        return []
-
-    # Get user's watchlist - prioritize non-empty watchlists, then by updated_at
+    # Only the columns the response is built from
     result = await db.execute(
-        select(UserWatchlist)
-        .where(UserWatchlist.user_id == db_user.id)
-        .order_by(
-            func.coalesce(func.array_length(UserWatchlist.symbols, 1), 0).desc(),
-            UserWatchlist.updated_at.desc()
-        )
+        select(UserWatchlist.sort_order, UserWatchlist.symbols, UserWatchlist.created_at)
+        .join(User, User.id == UserWatchlist.user_id)
+        .where(User.firebase_uid == user['uid'])
+        .order_by(*_PRIMARY_WATCHLIST_ORDER)
         .limit(1)
     )
-    watchlist = result.first()
-    watchlist = watchlist[0] if watchlist else None
+    row = result.first()
 
-    if watchlist is None or not (watchlist.sort_order or watchlist.symbols):
+    if row is None or not (row.sort_order or row.symbols):
         return []
 
     # Convert sort_order array to WatchlistEntry format (respect user's custom order)
     # Fall back to symbols array if sort_order is empty
-    display_order = watchlist.sort_order or watchlist.symbols or []
-    sort_order_map = {sym.upper(): idx for idx, sym in enumerate(display_order)}
-    entries = []
-    for symbol in display_order:
-        symbol_upper = symbol.upper()
-        # Use sort_order index + 1 for the sort_order field (1-indexed)
-        sort_idx = sort_order_map.get(symbol_upper, 0)
-        entries.append(WatchlistEntry(
-            id=sort_idx + 1,
-            symbol=symbol_upper,
-            added_at=watchlist.created_at.isoformat() if watchlist.created_at else datetime.now(timezone.utc).isoformat(),
-            sort_order=sort_idx + 1
-        ))
-
-    print(f"[DEBUG] GET /watchlist returning {len(entries)} entries for user {user['uid']}")
+    display_order = row.sort_order or row.symbols
+    added_at = row.created_at or datetime.now(timezone.utc)
+    # sort_order (and id) is the 1-indexed position in display order
+    entries = [
+        WatchlistEntry(id=idx, symbol=symbol.upper(), added_at=added_at, sort_order=idx)
+        for idx, symbol in enumerate(display_order, start=1)
+    ]
+
+    logger.debug("GET /watchlist returning %d entries for user %s", len(entries), user['uid'])
 
     return entries
 
@@ -160,14 +207,11 @@ async def add_to_watchlist(
     Returns 200 with status "already_present" if ticker already in watchlist.
     """
     from fastapi import status
-    from fastapi.responses import JSONResponse
+    from fastapi.responses import ORJSONResponse
 
-    # Get or create user - use first() to avoid MultipleResultsFound error
-    result = await db.execute(
-        select(User).where(User.firebase_uid == user['uid']).limit(1)
-    )
-    db_user = result.first()
-    db_user = db_user[0] if db_user else None
+    # Get or create user along with their watchlist (locked so concurrent
+    # first adds can't each create a watchlist)
+    db_user, watchlist = await _load_user_and_watchlist(db, user['uid'], for_update=True)
 
     if db_user is None:
         db_user = User(
@@ -181,22 +225,6 @@ async def add_to_watchlist(
         await db.commit()
         await db.refresh(db_user)
 
-    # Get user's watchlist - prioritize non-empty watchlists, then by updated_at
-    # This ensures we get the watchlist with actual symbols, not empty ones
-    result = await db.execute(
-        select(UserWatchlist)
-        .where(UserWatchlist.user_id == db_user.id)
-        .order_by(
-            # First priority: most symbols (empty arrays have NULL length, sort last)
-            func.coalesce(func.array_length(UserWatchlist.symbols, 1), 0).desc(),
-            # Second priority: most recently updated
-            UserWatchlist.updated_at.desc()
-        )
-        .limit(1)
-    )
-    watchlist = result.first()
-    watchlist = watchlist[0] if watchlist else None
-
     now = datetime.now(timezone.utc)
 
     # Validate symbol and create entry in Symbol table for price lookups
@@ -208,6 +236,12 @@ async def add_to_watchlist(
             detail=f"Invalid ticker symbol: {request.symbol}"
         )
 
+    if watchlist is None:
+        # Re-read under the user row lock: a concurrent first add may have
+        # created the watchlist while we were waiting for it (or, for a new
+        # user, after the commit above released it)
+        _, watchlist = await _load_user_and_watchlist(db, user['uid'], for_update=True)
+
     if watchlist is None:
         watchlist = UserWatchlist(
             user_id=db_user.id,
@@ -219,37 +253,42 @@ async def add_to_watchlist(
         )
         db.add(watchlist)
         await db.commit()
-        return JSONResponse(
+        return ORJSONResponse(
             content={"status": "added", "symbol": request.symbol},
             status_code=status.HTTP_201_CREATED
         )
 
-    # Check if symbol already exists
-    symbols = watchlist.symbols or []
-    if request.symbol in symbols:
-        return JSONResponse(
+    # Append in one conditional UPDATE: the WHERE clause skips rows that
+    # already hold the symbol (in any case), so no row back means it was
+    # already present.
+    stored = _stored_symbols()
+    added = await db.execute(
+        update(UserWatchlist)
+        .where(
+            UserWatchlist.id == watchlist.id,
+            ~exists().where(func.upper(stored) == request.symbol),
+        )
+        .values(
+            symbols=func.array_append(UserWatchlist.symbols, request.symbol),
+            # Preserve custom sort_order - only append new symbol to the end
+            # This fixes the bug where reordering was lost when adding new symbols
+            sort_order=case(
+                (any_(UserWatchlist.sort_order) == request.symbol, UserWatchlist.sort_order),
+                else_=func.array_append(UserWatchlist.sort_order, request.symbol),
+            ),
+            updated_at=now,
+        )
+        .returning(UserWatchlist.id)
+        .execution_options(synchronize_session=False)
+    )
+    if added.first() is None:
+        return ORJSONResponse(
             content={"status": "already_present", "symbol": request.symbol},
             status_code=status.HTTP_200_OK
         )
-
-    # Add symbol
-    symbols.append(request.symbol)
-    watchlist.symbols = symbols
-    
-    # Preserve custom sort_order - only append new symbol to the end
-    # This fixes the bug where reordering was lost when adding new symbols
-    sort_order = watchlist.sort_order or []
-    if request.symbol not in sort_order:
-        sort_order.append(request.symbol)
-    watchlist.sort_order = sort_order
-    
-    watchlist.updated_at = now
-    # Flag mutable columns as modified so SQLAlchemy persists them
-    flag_modified(watchlist, "symbols")
-    flag_modified(watchlist, "sort_order")
     await db.commit()
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={"status": "added", "symbol": request.symbol},
         status_code=status.HTTP_201_CREATED
     )
@@ -262,52 +301,56 @@ async def update_watchlist_order(
     user: dict = Depends(get_current_user)
 ):
     """Update the order of watchlist entries for the authenticated user."""
-    # Get user from database - use first() to avoid MultipleResultsFound error
-    result = await db.execute(
-        select(User).where(User.firebase_uid == user['uid']).limit(1)
+    ordered = bindparam("ordered", request.ordered_symbols, type_=ARRAY(Text))
+
+    # Write the new order in one UPDATE of the user's primary watchlist. The
+    # set check runs in Postgres against the row being updated, so there's
+    # no read-validate-write round trip (or race) on the happy path.
+    primary_id = (
+        select(UserWatchlist.id)
+        .join(User, User.id == UserWatchlist.user_id)
+        .where(User.firebase_uid == user['uid'])
+        .order_by(*_PRIMARY_WATCHLIST_ORDER)
+        .limit(1)
+        .scalar_subquery()
     )
-    db_user = result.first()
-    db_user = db_user[0] if db_user else None
+    stored = _stored_symbols()
+    # Case-insensitive set of stored symbols (NULL for an empty watchlist)
+    stored_upper = select(func.array_agg(func.upper(stored))).scalar_subquery()
+    updated = await db.execute(
+        update(UserWatchlist)
+        .where(
+            UserWatchlist.id == primary_id,
+            # Same set of symbols: each array contains the other
+            stored_upper.op("@>")(ordered),
+            stored_upper.op("<@")(ordered),
+        )
+        .values(sort_order=ordered, updated_at=datetime.now(timezone.utc))
+        .returning(UserWatchlist.id)
+        .execution_options(synchronize_session=False)
+    )
+    if updated.first() is not None:
+        await db.commit()
+        return {"status": "success"}
+
+    # Nothing updated: work out why for the error response
+    db_user, watchlist = await _load_user_and_watchlist(db, user['uid'])
 
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get user's watchlist - prioritize non-empty watchlists, then by updated_at
-    result = await db.execute(
-        select(UserWatchlist)
-        .where(UserWatchlist.user_id == db_user.id)
-        .order_by(
-            func.coalesce(func.array_length(UserWatchlist.symbols, 1), 0).desc(),
-            UserWatchlist.updated_at.desc()
-        )
-        .limit(1)
-    )
-    watchlist = result.first()
-    watchlist = watchlist[0] if watchlist else None
-
     if watchlist is None:
         raise HTTPException(status_code=404, detail="Watchlist not found")
 
     # Normalize both sides to uppercase for case-insensitive comparison
     existing_symbols = {sym.upper() for sym in (watchlist.symbols or [])}
-    requested_symbols = {sym.upper() for sym in request.ordered_symbols}
-
-    if existing_symbols != requested_symbols:
-        missing = existing_symbols - requested_symbols
-        extra = requested_symbols - existing_symbols
-        raise HTTPException(
-            status_code=400,
-            detail=f"All watchlist symbols must be included in the reorder request. Missing: {missing}, Extra: {extra}"
-        )
-
-    # Update order with uppercase symbols for consistency
-    watchlist.sort_order = [sym.upper() for sym in request.ordered_symbols]
-    watchlist.updated_at = datetime.now(timezone.utc)
-    # Flag mutable column as modified so SQLAlchemy persists it
-    flag_modified(watchlist, "sort_order")
-    await db.commit()
-
-    return {"status": "success"}
+    requested_symbols = set(request.ordered_symbols)
+    missing = existing_symbols - requested_symbols
+    extra = requested_symbols - existing_symbols
+    raise HTTPException(
+        status_code=400,
+        detail=f"All watchlist symbols must be included in the reorder request. Missing: {missing}, Extra: {extra}"
+    )
 
 
 @router.delete("/{symbol}", status_code=204, tags=["watchlist"])
@@ -317,43 +360,24 @@ async def remove_from_watchlist(
     user: dict = Depends(get_current_user)
 ):
     """Remove a symbol from the user's watchlist."""
-    # Get user from database - use first() to avoid MultipleResultsFound error
-    result = await db.execute(
-        select(User).where(User.firebase_uid == user['uid']).limit(1)
-    )
-    db_user = result.first()
-    db_user = db_user[0] if db_user else None
+    db_user, watchlist = await _load_user_and_watchlist(db, user['uid'], for_update=True)
 
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get user's watchlist - prioritize non-empty watchlists, then by updated_at
-    result = await db.execute(
-        select(UserWatchlist)
-        .where(UserWatchlist.user_id == db_user.id)
-        .order_by(
-            func.coalesce(func.array_length(UserWatchlist.symbols, 1), 0).desc(),
-            UserWatchlist.updated_at.desc()
-        )
-        .limit(1)
-    )
-    watchlist = result.first()
-    watchlist = watchlist[0] if watchlist else None
-
     if watchlist is None or not watchlist.symbols:
         raise HTTPException(status_code=404, detail="Watchlist not found")
 
-    # Remove symbol
+    # Remove symbol from both arrays server-side (sort_order kept in step)
     symbol_upper = symbol.upper()
-    symbols = [s for s in watchlist.symbols if s != symbol_upper]
-    watchlist.symbols = symbols
-
-    # Update sort_order to match
-    sort_order = [s for s in watchlist.sort_order if s != symbol_upper]
-    watchlist.sort_order = sort_order
-
-    watchlist.updated_at = datetime.now(timezone.utc)
-    # Flag mutable columns as modified so SQLAlchemy persists them
-    flag_modified(watchlist, "symbols")
-    flag_modified(watchlist, "sort_order")
+    await db.execute(
+        update(UserWatchlist)
+        .where(UserWatchlist.id == watchlist.id)
+        .values(
+            symbols=func.array_remove(UserWatchlist.symbols, symbol_upper),
+            sort_order=func.array_remove(UserWatchlist.sort_order, symbol_upper),
+            updated_at=datetime.now(timezone.utc),
+        )
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
@@ -1,3 +1,4 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -11,7 +12,10 @@ class Settings(BaseSettings):
     POSTGRES_SERVER: str = "localhost"
     DATABASE_URL: Optional[str] = None
 
-    @property
+    # Optional shared cache for indicator responses (disabled when unset)
+    REDIS_URL: Optional[str] = None
+
+    @cached_property
     def async_database_url(self) -> str:
         if self.DATABASE_URL:
             return self.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
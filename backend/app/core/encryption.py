@@ -33,6 +33,7 @@ import base64
 import logging
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -73,10 +74,14 @@ class EncryptionResult:
     ciphertext_b64: str  # base64(nonce || ciphertext || tag)
 
 
+@lru_cache(maxsize=1)
 def _get_encryption_key() -> bytes:
     """
     Retrieve and validate the encryption key from environment.
 
+    The validated key is cached for the life of the process (failures are
+    not cached); call reset_encryption_key_cache() after changing the env var.
+
     Returns:
         32-byte encryption key
 
@@ -100,6 +105,22 @@ def _get_encryption_key() -> bytes:
     return key_bytes
 
 
+@lru_cache(maxsize=1)
+def _get_cipher() -> AESGCM:
+    """Return a shared AESGCM instance for the configured key.
+
+    AESGCM objects are safe to reuse across calls, so the key setup is only
+    paid once.
+    """
+    return AESGCM(_get_encryption_key())
+
+
+def reset_encryption_key_cache() -> None:
+    """Drop the cached key and cipher so the next call re-reads the env var."""
+    _get_encryption_key.cache_clear()
+    _get_cipher.cache_clear()
+
+
 def encrypt(plaintext: str) -> EncryptionResult:
     """
     Encrypt plaintext using AES-256-GCM.
@@ -121,10 +142,9 @@ def encrypt(plaintext: str) -> EncryptionResult:
     if not plaintext:
         raise ValueError("Cannot encrypt empty plaintext")
 
-    key = _get_encryption_key()
+    aesgcm = _get_cipher()
     nonce = os.urandom(NONCE_LENGTH)
 
-    aesgcm = AESGCM(key)
     ciphertext_with_tag = aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
 
     # Format: nonce || ciphertext || tag
@@ -160,11 +180,12 @@ def decrypt(encrypted_b64: str) -> str:
         raise DecryptionError("Cannot decrypt empty input")
 
     try:
-        key = _get_encryption_key()
+        aesgcm = _get_cipher()
 
-        # Decode base64
-        combined = base64.b64decode(encrypted_b64)
+        # Decode base64; slicing the memoryview below does not copy
+        combined = memoryview(base64.b64decode(encrypted_b64))
 
+        # The ciphertext may be empty, so this also guarantees a full tag
         if len(combined) < NONCE_LENGTH + TAG_LENGTH:
             raise DecryptionError(
                 f"Invalid ciphertext length: {len(combined)} bytes, "
@@ -175,13 +196,6 @@ def decrypt(encrypted_b64: str) -> str:
         nonce = combined[:NONCE_LENGTH]
         ciphertext_with_tag = combined[NONCE_LENGTH:]
 
-        # Verify tag length
-        if len(ciphertext_with_tag) < TAG_LENGTH:
-            raise DecryptionError(
-                f"Invalid tag length: expected at least {TAG_LENGTH} bytes"
-            )
-
-        aesgcm = AESGCM(key)
         plaintext = aesgcm.decrypt(nonce, ciphertext_with_tag, None)
 
         logger.info("Decrypted data successfully")
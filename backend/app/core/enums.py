@@ -1,6 +1,7 @@
 """Enumerations for the TradingAlert application."""
 
 from enum import Enum
+from functools import lru_cache
 
 
 class AlertTriggerMode(str, Enum):
@@ -57,26 +58,43 @@ class AlertCondition(str, Enum):
     CRSI_BAND_EXTREMES = "crsi_band_extremes"
 
     @classmethod
-    def price_conditions(cls) -> set:
+    def price_conditions(cls) -> frozenset:
         """Return set of price-based alert conditions."""
-        return {
-            cls.ABOVE,
-            cls.BELOW,
-            cls.CROSSES_UP,
-            cls.CROSSES_DOWN,
-        }
+        return _PRICE_CONDITIONS
 
     @classmethod
-    def indicator_conditions(cls) -> set:
+    def indicator_conditions(cls) -> frozenset:
         """Return set of indicator-based alert conditions."""
-        return {
-            cls.INDICATOR_ABOVE_UPPER,
-            cls.INDICATOR_BELOW_LOWER,
-            cls.INDICATOR_CROSSES_UPPER,
-            cls.INDICATOR_CROSSES_LOWER,
-            cls.INDICATOR_TURNS_POSITIVE,
-            cls.INDICATOR_TURNS_NEGATIVE,
-            cls.INDICATOR_SLOPE_BULLISH,
-            cls.INDICATOR_SLOPE_BEARISH,
-            cls.INDICATOR_SIGNAL_CHANGE,
-        }
+        return _INDICATOR_CONDITIONS
+
+
+# Built once; the classmethods above hand out these shared immutable sets
+_PRICE_CONDITIONS = frozenset({
+    AlertCondition.ABOVE,
+    AlertCondition.BELOW,
+    AlertCondition.CROSSES_UP,
+    AlertCondition.CROSSES_DOWN,
+})
+
+_INDICATOR_CONDITIONS = frozenset({
+    AlertCondition.INDICATOR_ABOVE_UPPER,
+    AlertCondition.INDICATOR_BELOW_LOWER,
+    AlertCondition.INDICATOR_CROSSES_UPPER,
+    AlertCondition.INDICATOR_CROSSES_LOWER,
+    AlertCondition.INDICATOR_TURNS_POSITIVE,
+    AlertCondition.INDICATOR_TURNS_NEGATIVE,
+    AlertCondition.INDICATOR_SLOPE_BULLISH,
+    AlertCondition.INDICATOR_SLOPE_BEARISH,
+    AlertCondition.INDICATOR_SIGNAL_CHANGE,
+})
+
+
+@lru_cache(maxsize=None)
+def alert_condition_from_str(value: str) -> AlertCondition:
+    """AlertCondition(value), cached per string.
+
+    Raises:
+        ValueError: If value is not a valid condition (failures aren't cached)
+    """
+    return AlertCondition(value)
+
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 # Map user-provided or provider-specific intervals to canonical names
 # e.g. '60m' -> '1h'
@@ -57,13 +57,54 @@ LOOKBACK_CAPS: Dict[str, timedelta] = {
     "3mo": timedelta(days=365 * 20),
 }
 
+# Same tables in whole seconds, for timestamp arithmetic without timedelta
+INTERVAL_SECONDS: Dict[str, int] = {k: int(v.total_seconds()) for k, v in INTERVAL_DELTAS.items()}
+LOOKBACK_SECONDS: Dict[str, int] = {k: int(v.total_seconds()) for k, v in LOOKBACK_CAPS.items()}
+
+# Fallbacks for intervals without an entry above
+DEFAULT_INTERVAL_DELTA = timedelta(days=1)
+DEFAULT_LOOKBACK_CAP = timedelta(days=365)
+_DEFAULTS = (
+    DEFAULT_INTERVAL_DELTA,
+    DEFAULT_LOOKBACK_CAP,
+    int(DEFAULT_INTERVAL_DELTA.total_seconds()),
+    int(DEFAULT_LOOKBACK_CAP.total_seconds()),
+)
+
+# (canonical, delta, lookback cap, delta seconds, lookback seconds) per
+# accepted spelling, built once so each getter is a single dict lookup.
+# Keyed by every CANONICAL_INTERVALS key and its upper-case form; other
+# mixed-case spellings fall back to .lower().
+_IntervalInfo = Tuple[str, timedelta, timedelta, int, int]
+_INTERVAL_INFO: Dict[str, _IntervalInfo] = {}
+for _raw, _canonical in CANONICAL_INTERVALS.items():
+    _INTERVAL_INFO[_raw] = _INTERVAL_INFO[_raw.upper()] = (
+        _canonical,
+        INTERVAL_DELTAS.get(_canonical, DEFAULT_INTERVAL_DELTA),
+        LOOKBACK_CAPS.get(_canonical, DEFAULT_LOOKBACK_CAP),
+        INTERVAL_SECONDS.get(_canonical, _DEFAULTS[2]),
+        LOOKBACK_SECONDS.get(_canonical, _DEFAULTS[3]),
+    )
+
+
+def _interval_info(interval: str) -> _IntervalInfo:
+    info = _INTERVAL_INFO.get(interval)
+    if info is None:
+        lowered = interval.lower()
+        info = _INTERVAL_INFO.get(lowered) or (lowered, *_DEFAULTS)
+    return info
+
 def get_canonical_interval(interval: str) -> str:
-    return CANONICAL_INTERVALS.get(interval.lower(), interval.lower())
+    return _interval_info(interval)[0]
 
 def get_interval_delta(interval: str) -> timedelta:
-    canonical = get_canonical_interval(interval)
-    return INTERVAL_DELTAS.get(canonical, timedelta(days=1))
+    return _interval_info(interval)[1]
 
 def get_lookback_cap(interval: str) -> timedelta:
-    canonical = get_canonical_interval(interval)
-    return LOOKBACK_CAPS.get(canonical, timedelta(days=365))
+    return _interval_info(interval)[2]
+
+def get_interval_seconds(interval: str) -> int:
+    return _interval_info(interval)[3]
+
+def get_lookback_cap_seconds(interval: str) -> int:
+    return _interval_info(interval)[4]
@@ -63,6 +63,17 @@ class PerformanceSettings(BaseSettings):
     )
 
 
+# Global settings instance
+performance_settings = PerformanceSettings()
+
+# Bound once so the per-operation helpers below are plain dict lookups
+# rather than attribute access on the settings model
+_OPERATION_THRESHOLDS = performance_settings.operation_thresholds
+_CACHE_TTL_BY_INTERVAL = performance_settings.cache_ttl_by_interval
+_DEFAULT_CACHE_TTL = performance_settings.default_cache_ttl
+_MAX_CONTRIBUTION_PERCENT = performance_settings.max_operation_contribution_percent
+
+
 def get_cache_ttl_for_interval(interval: str) -> int:
     """
     Get cache TTL for a specific interval.
@@ -73,32 +84,23 @@ def get_cache_ttl_for_interval(interval: str) -> int:
     Returns:
         TTL in seconds for the interval
     """
-    return performance_settings.cache_ttl_by_interval.get(
-        interval,
-        performance_settings.default_cache_ttl
-    )
-
-
-# Global settings instance
-performance_settings = PerformanceSettings()
+    return _CACHE_TTL_BY_INTERVAL.get(interval, _DEFAULT_CACHE_TTL)
 
 
 def get_threshold(operation: str) -> int | None:
     """Get the threshold for an operation, or None if not defined."""
-    return performance_settings.operation_thresholds.get(operation)
+    return _OPERATION_THRESHOLDS.get(operation)
 
 
 def is_threshold_exceeded(operation: str, duration_ms: float) -> bool:
     """Check if an operation duration exceeds its threshold."""
-    threshold = get_threshold(operation)
-    if threshold is None:
-        return False
-    return duration_ms > threshold
+    return duration_ms > _OPERATION_THRESHOLDS.get(operation, float('inf'))
 
 
 def exceeds_contribution_limit(duration_ms: float, total_duration_ms: float) -> bool:
     """Check if an operation's contribution exceeds the allowed percentage."""
-    if total_duration_ms == 0:
-        return False
-    contribution = (duration_ms / total_duration_ms) * 100
-    return contribution > performance_settings.max_operation_contribution_percent
+    # (duration / total) * 100 > limit, rearranged to avoid the division
+    return (
+        total_duration_ms != 0
+        and duration_ms * 100 > _MAX_CONTRIBUTION_PERCENT * total_duration_ms
+    )
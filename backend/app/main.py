@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import ORJSONResponse, Response
 from app.core.config import settings
 from app.api.api import api_router
@@ -39,11 +40,16 @@ app.add_middleware(
     allow_headers=["*", "Authorization"],  # Explicitly include Authorization
 )
 
+# Indicator/candle JSON (long float arrays, many nulls) compresses ~10x; a
+# moderate level keeps the encoder from becoming the bottleneck.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 
 logger = logging.getLogger(__name__)
 
-# Initialize WorkerManager
+# Initialize WorkerManager (exposed on app.state so routes avoid importing app.main)
 worker_manager = WorkerManager()
+app.state.worker_manager = worker_manager
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -144,6 +150,15 @@ async def startup_event():
     load_registered_indicators(registry)
     print("User-defined indicator configurations loaded")
 
+    # Load ticker_universe into memory so symbol search doesn't scan it per keystroke
+    from app.services.search import ticker_index
+    try:
+        async with AsyncSessionLocal() as db:
+            await ticker_index.load(db)
+        print("Ticker search index loaded")
+    except Exception as e:
+        print(f"WARNING: Ticker search index not loaded, search will query the database: {e}")
+
     # Create singleton orchestrator (shared across all requests for locks and provider caching)
     from app.services.orchestrator import DataOrchestrator
     from app.services.candles import CandleService
@@ -190,6 +205,16 @@ async def shutdown_event():
 
     await worker_manager.stop_all(timeout=5.0)
 
+    # Persist any notification deliveries still waiting to be batched
+    from app.services.delivery_log_buffer import delivery_log_buffer
+    await delivery_log_buffer.flush()
+
+    from app.services.cache import close_shared_cache
+    await close_shared_cache()
+
+    from app.services.telegram_service import close_telegram_client
+    await close_telegram_client()
+
 # Include API router AFTER CORS middleware
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
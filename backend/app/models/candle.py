@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.sql import func
 from app.db.base_class import Base
 
@@ -14,4 +14,6 @@ class Candle(Base):
 
     __table_args__ = (
         UniqueConstraint('symbol_id', 'timestamp', 'interval', name='uix_candle_symbol_timestamp_interval'),
+        # Backward index scan for "latest N candles for symbol/interval" lookups
+        Index('ix_candles_symbol_interval_ts_desc', 'symbol_id', 'interval', timestamp.desc()),
     )
@@ -5,7 +5,7 @@ Each user can have their own list of symbols with custom sort order.
 """
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, ARRAY, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects import postgresql
 from app.db.base_class import Base
@@ -60,6 +60,16 @@ class UserWatchlist(Base):
         onupdate=lambda: datetime.now(timezone.utc)
     )
 
+    __table_args__ = (
+        # Serves the "primary watchlist" lookup (largest, then most recent per user)
+        Index(
+            'ix_user_watchlists_user_primary',
+            'user_id',
+            func.coalesce(func.array_length(symbols, 1), 0).desc(),
+            updated_at.desc(),
+        ),
+    )
+
     # Relationship to User
     user = relationship("User", back_populates="user_watchlists")
 
@@ -17,6 +17,11 @@ BATCH_EVALUATION_THRESHOLD = 1000
 # T110a: Minimum cooldown to prevent rapid signal oscillations (in seconds)
 # Note: Frontend sends cooldown in minutes, backend converts to seconds for internal use
 MINIMUM_COOLDOWN_SECONDS = 60  # 1 minute minimum
+# Trigger modes that fire at most once per bar (stored as plain strings on Alert)
+_PER_BAR_TRIGGER_MODES = frozenset({
+    AlertTriggerMode.ONCE_PER_BAR.value,
+    AlertTriggerMode.ONCE_PER_BAR_CLOSE.value,
+})
 
 
 class AlertEngine:
@@ -94,7 +99,7 @@ class AlertEngine:
                         continue
 
                     # "once_per_bar" and "once_per_bar_close" modes: skip if already triggered for this bar
-                    if trigger_mode in [AlertTriggerMode.ONCE_PER_BAR.value, AlertTriggerMode.ONCE_PER_BAR_CLOSE.value]:
+                    if trigger_mode in _PER_BAR_TRIGGER_MODES:
                         if bar_timestamp and alert.last_triggered_bar_timestamp == bar_timestamp:
                             logger.debug(f"Alert {alert.id} already triggered for this bar, skipping")
                             continue
@@ -210,7 +215,7 @@ class AlertEngine:
                                 logger.info(f"Alert {alert.id} disabled (once mode)")
 
                             # Bar modes: track bar timestamp
-                            if trigger_mode in [AlertTriggerMode.ONCE_PER_BAR.value, AlertTriggerMode.ONCE_PER_BAR_CLOSE.value]:
+                            if trigger_mode in _PER_BAR_TRIGGER_MODES:
                                 if bar_timestamp:
                                     alert.last_triggered_bar_timestamp = bar_timestamp
                         # Skip the default trigger creation below since we handle it with direction info
@@ -245,7 +250,7 @@ class AlertEngine:
                                 logger.info(f"Alert {alert.id} disabled (once mode)")
 
                             # Bar modes: track bar timestamp
-                            if trigger_mode in [AlertTriggerMode.ONCE_PER_BAR.value, AlertTriggerMode.ONCE_PER_BAR_CLOSE.value]:
+                            if trigger_mode in _PER_BAR_TRIGGER_MODES:
                                 if bar_timestamp:
                                     alert.last_triggered_bar_timestamp = bar_timestamp
                         # Skip the default trigger creation below since we handle it with direction info
@@ -268,7 +273,7 @@ class AlertEngine:
                             logger.info(f"Alert {alert.id} disabled (once mode)")
 
                         # Bar modes: track bar timestamp
-                        if trigger_mode in [AlertTriggerMode.ONCE_PER_BAR.value, AlertTriggerMode.ONCE_PER_BAR_CLOSE.value]:
+                        if trigger_mode in _PER_BAR_TRIGGER_MODES:
                             if bar_timestamp:
                                 alert.last_triggered_bar_timestamp = bar_timestamp
 
@@ -367,7 +372,7 @@ class AlertEngine:
                 continue
 
             # "once_per_bar" and "once_per_bar_close" modes: skip if already triggered for this bar
-            if trigger_mode in [AlertTriggerMode.ONCE_PER_BAR.value, AlertTriggerMode.ONCE_PER_BAR_CLOSE.value]:
+            if trigger_mode in _PER_BAR_TRIGGER_MODES:
                 if bar_timestamp and alert.last_triggered_bar_timestamp == bar_timestamp:
                     continue
 
@@ -425,7 +430,7 @@ class AlertEngine:
                     alert.is_active = False
 
                 # Bar modes: track bar timestamp
-                if trigger_mode in [AlertTriggerMode.ONCE_PER_BAR.value, AlertTriggerMode.ONCE_PER_BAR_CLOSE.value]:
+                if trigger_mode in _PER_BAR_TRIGGER_MODES:
                     if bar_timestamp:
                         alert.last_triggered_bar_timestamp = bar_timestamp
 
@@ -20,10 +20,15 @@ Public endpoints (no auth):
         ...
 """
 import logging
-from typing import Dict, Any
-from fastapi import Depends, HTTPException, status
+from typing import Dict, Any, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.session import get_db
+from app.models.user import User
+from app.services.cache import LRUCache
 from app.services.firebase_admin import verify_firebase_token
 from app.services.error_messages import (
     AUTHENTICATION_FAILED,
@@ -89,3 +94,65 @@ async def get_current_user(
     #     )
 
     return decoded
+
+
+# Firebase uid -> users.id. The mapping never changes for an existing user,
+# so only positive lookups are cached (new users resolve as soon as they exist).
+_user_id_cache = LRUCache(max_size=1024, ttl_seconds=300)
+
+
+async def resolve_user_id(db: AsyncSession, firebase_uid: str) -> Optional[int]:
+    """Return the users.id for a Firebase uid, or None if no profile exists."""
+    user_id = _user_id_cache.get(firebase_uid)
+    if user_id is not None:
+        return user_id
+
+    result = await db.execute(
+        select(User.id).where(User.firebase_uid == firebase_uid)
+    )
+    user_id = result.scalar_one_or_none()
+    if user_id is not None:
+        _user_id_cache.set(firebase_uid, user_id)
+    return user_id
+
+
+async def get_current_user_id(
+    user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Optional[int]:
+    """
+    Resolve the authenticated user's users.id (None if no profile exists yet).
+
+    Builds on get_current_user, so token verification is unchanged.
+    """
+    return await resolve_user_id(db, user['uid'])
+
+
+async def get_current_user_profile(
+    request: Request,
+    user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """
+    Load the authenticated user's User row (404 if no profile exists yet).
+
+    The row is kept on request.state.db_user so anything else handling the
+    same request reuses it instead of querying users again.
+    """
+    db_user = getattr(request.state, "db_user", None)
+    if db_user is not None:
+        return db_user
+
+    result = await db.execute(
+        select(User).where(User.firebase_uid == user['uid'])
+    )
+    db_user = result.scalar_one_or_none()
+    if db_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+
+    request.state.db_user = db_user
+    _user_id_cache.set(user['uid'], db_user.id)
+    return db_user
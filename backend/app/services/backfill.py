@@ -18,9 +18,9 @@ class BackfillService:
     for watchlist functionality.
     """
 
-    def __init__(self, db: AsyncSession = None):
+    def __init__(self, db: AsyncSession = None, provider: Optional[YFinanceProvider] = None):
         self.db = db
-        self.provider = YFinanceProvider()
+        self.provider = provider or YFinanceProvider()
 
     async def backfill_historical(
         self,
@@ -8,10 +8,11 @@ In-memory LRU cache for expensive operations (indicator calculations, etc.)
 import time
 import hashlib
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+from ..core.config import settings
 from ..core.performance_config import (
     performance_settings,
 )
@@ -305,6 +306,7 @@ def generate_indicator_cache_key(
     params: Dict[str, Any],
     from_ts: Optional[datetime] = None,
     to_ts: Optional[datetime] = None,
+    params_key: Optional[Tuple[Tuple[str, Any], ...]] = None,
 ) -> str:
     """
     Generate a cache key for indicator calculations.
@@ -320,12 +322,13 @@ def generate_indicator_cache_key(
         params: Indicator parameters
         from_ts: Start date (for zooming/scrolling) - INCLUDED in key for backfill support
         to_ts: End date (for zooming/scrolling) - INCLUDED in key for backfill support
+        params_key: Pre-sorted params items; skips re-sorting when the caller has one
 
     Returns:
         A cache key
     """
     # Sort params for consistency
-    sorted_params = sorted(params.items())
+    sorted_params = params_key if params_key is not None else sorted(params.items())
 
     # Create param string - include date range for backfill support
     param_str = ",".join(f"{k}={v}" for k, v in sorted_params)
@@ -347,7 +350,21 @@ def generate_indicator_cache_key(
 indicator_cache = LRUCache(
     max_size=performance_settings.max_cache_entries,
     ttl_seconds=performance_settings.default_cache_ttl,
-    memory_budget_bytes=performance_settings.cache_memory_budget // 2,  # Half for indicators
+    memory_budget_bytes=performance_settings.cache_memory_budget // 4,  # Half for indicators, split 2:1:1
+)
+
+# Serialized response bodies and series keyed by their input candles are kept
+# apart from indicator_cache so its hit/miss stats keep counting requests
+indicator_body_cache = LRUCache(
+    max_size=performance_settings.max_cache_entries,
+    ttl_seconds=performance_settings.default_cache_ttl,
+    memory_budget_bytes=performance_settings.cache_memory_budget // 8,
+)
+
+indicator_series_cache = LRUCache(
+    max_size=performance_settings.max_cache_entries,
+    ttl_seconds=performance_settings.default_cache_ttl,
+    memory_budget_bytes=performance_settings.cache_memory_budget // 8,
 )
 
 candle_cache = LRUCache(
@@ -364,9 +381,10 @@ def get_indicator_result(
     params: Dict[str, Any],
     from_ts: Optional[datetime] = None,
     to_ts: Optional[datetime] = None,
+    params_key: Optional[Tuple[Tuple[str, Any], ...]] = None,
 ) -> Optional[Any]:
     """Get a cached indicator calculation result."""
-    key = generate_indicator_cache_key(symbol, interval, indicator_name, params, from_ts, to_ts)
+    key = generate_indicator_cache_key(symbol, interval, indicator_name, params, from_ts, to_ts, params_key)
     return indicator_cache.get(key)
 
 
@@ -378,16 +396,104 @@ def cache_indicator_result(
     result: Any,
     from_ts: Optional[datetime] = None,
     to_ts: Optional[datetime] = None,
+    params_key: Optional[Tuple[Tuple[str, Any], ...]] = None,
 ) -> None:
     """Cache an indicator calculation result."""
-    key = generate_indicator_cache_key(symbol, interval, indicator_name, params, from_ts, to_ts)
+    key = generate_indicator_cache_key(symbol, interval, indicator_name, params, from_ts, to_ts, params_key)
     indicator_cache.set(key, result, symbol=symbol)
 
 
+def get_indicator_body(
+    symbol: str,
+    interval: str,
+    indicator_name: str,
+    params: Dict[str, Any],
+    from_ts: Optional[datetime] = None,
+    to_ts: Optional[datetime] = None,
+    params_key: Optional[Tuple[Tuple[str, Any], ...]] = None,
+) -> Optional[bytes]:
+    """Get the cached serialized JSON body of an indicator response."""
+    key = generate_indicator_cache_key(symbol, interval, indicator_name, params, from_ts, to_ts, params_key)
+    return indicator_body_cache.get(key)
+
+
+def cache_indicator_body(
+    symbol: str,
+    interval: str,
+    indicator_name: str,
+    params: Dict[str, Any],
+    body: bytes,
+    from_ts: Optional[datetime] = None,
+    to_ts: Optional[datetime] = None,
+    params_key: Optional[Tuple[Tuple[str, Any], ...]] = None,
+) -> None:
+    """Cache the serialized JSON body of an indicator response."""
+    key = generate_indicator_cache_key(symbol, interval, indicator_name, params, from_ts, to_ts, params_key)
+    indicator_body_cache.set(key, body, symbol=symbol)
+
+
+def generate_indicator_series_key(
+    symbol_id: int,
+    interval: str,
+    indicator_name: str,
+    params_key: Tuple[Tuple[str, Any], ...],
+    last_candle: Dict[str, Any],
+    n_candles: int,
+    window: Tuple[Any, ...] = (),
+) -> str:
+    """
+    Generate a cache key for indicator series from the candles they came from.
+
+    The last candle (its timestamp plus close/volume, which still move while
+    the bar is open) and the candle count identify the input, so a new or
+    updated bar produces a new key without explicit invalidation.
+
+    Args:
+        symbol_id: Symbol primary key
+        interval: Time interval
+        indicator_name: Name of the indicator
+        params_key: Sorted, validated parameter items
+        last_candle: Most recent candle dict the series were computed from
+        n_candles: Number of candles the series were computed from
+        window: Output slicing arguments (limit, from_ts, to_ts)
+
+    Returns:
+        A cache key
+    """
+    return generate_cache_key(
+        "series",
+        symbol_id,
+        interval,
+        indicator_name,
+        ",".join(f"{k}={v}" for k, v in params_key),
+        last_candle["timestamp"],
+        last_candle.get("close"),
+        last_candle.get("volume"),
+        n_candles,
+        *window,
+    )
+
+
+def get_indicator_series(key: str) -> Optional[Tuple[List[int], Dict[str, List[Optional[float]]]]]:
+    """Get cached (timestamps, data) series for a key from generate_indicator_series_key."""
+    return indicator_series_cache.get(key)
+
+
+def cache_indicator_series(
+    key: str,
+    series: Tuple[List[int], Dict[str, List[Optional[float]]]],
+    symbol: Optional[str] = None,
+) -> None:
+    """Cache already JSON-cleaned (timestamps, data) series."""
+    indicator_series_cache.set(key, series, symbol=symbol)
+
+
 def invalidate_symbol(symbol: str) -> None:
     """Invalidate all cache entries for a symbol."""
     # Use the new symbol-based invalidation
     indicator_cache.invalidate_by_symbol(symbol)
+    indicator_body_cache.invalidate_by_symbol(symbol)
+    indicator_series_cache.invalidate_by_symbol(symbol)
     candle_cache.invalidate_by_symbol(symbol)
 
 
@@ -395,6 +501,8 @@ def get_all_cache_stats() -> Dict[str, Any]:
     """Get statistics for all caches."""
     return {
         'indicator_cache': indicator_cache.get_stats(),
+        'indicator_body_cache': indicator_body_cache.get_stats(),
+        'indicator_series_cache': indicator_series_cache.get_stats(),
         'candle_cache': candle_cache.get_stats(),
     }
 
@@ -487,3 +595,95 @@ def cache_candle_data(
     finally:
         # Restore original TTL
         candle_cache._ttl_seconds = original_ttl
+
+
+# =============================================================================
+# Shared (Redis) response cache
+# =============================================================================
+# Optional second tier shared by all worker processes, holding serialized
+# indicator responses. Enabled only when settings.REDIS_URL is set; any Redis
+# error is logged and treated as a cache miss.
+
+_redis_client = None
+
+
+def _get_redis():
+    """Return the lazily created Redis client, or None if not configured."""
+    global _redis_client
+    if _redis_client is None and settings.REDIS_URL:
+        import redis.asyncio as redis_asyncio
+        _redis_client = redis_asyncio.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.25,
+            socket_timeout=0.25,
+        )
+    return _redis_client
+
+
+def generate_shared_indicator_key(
+    symbol: str,
+    interval: str,
+    indicator_name: str,
+    params: Dict[str, Any],
+    from_ts: Optional[datetime],
+    to_ts: Optional[datetime],
+    bucket: int,
+) -> str:
+    """
+    Generate a Redis key for a serialized indicator response.
+
+    Args:
+        symbol: Stock symbol
+        interval: Time interval
+        indicator_name: Name of the indicator
+        params: Indicator parameters
+        from_ts: Requested start (None for open range)
+        to_ts: Requested end (None for "latest")
+        bucket: Index of the current candle period, so "latest" responses
+                roll over when a new candle starts
+
+    Returns:
+        A namespaced sha1 key
+    """
+    param_str = ",".join(f"{k}={v}" for k, v in sorted(params.items()))
+    key_string = "|".join([
+        symbol,
+        interval,
+        indicator_name,
+        param_str,
+        from_ts.isoformat() if from_ts else "",
+        to_ts.isoformat() if to_ts else "",
+        str(bucket),
+    ])
+    return "indicator:" + hashlib.sha1(key_string.encode()).hexdigest()
+
+
+async def get_shared_response(key: str) -> Optional[bytes]:
+    """Get a serialized response from Redis, or None on miss/unavailable."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        logger.warning(f"Shared cache get failed: {e}")
+        return None
+
+
+async def set_shared_response(key: str, body: bytes, ttl_seconds: int) -> None:
+    """Store a serialized response in Redis with a TTL (no-op if unavailable)."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, body, ex=ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Shared cache set failed: {e}")
+
+
+async def close_shared_cache() -> None:
+    """Close the Redis connection pool, if one was opened."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
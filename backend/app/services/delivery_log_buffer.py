@@ -0,0 +1,131 @@
+"""
+Buffered notification delivery logging.
+
+Bursts of notifications (the alert engine calling /send once per triggered
+symbol) used to issue one INSERT + COMMIT per delivery. DeliveryLogBuffer
+collects delivery rows for a few milliseconds and writes them with a single
+executemany INSERT on its own session. If that INSERT fails, the batch's rows
+are retried one at a time so each caller only sees its own row's error.
+
+Usage:
+    from app.services.delivery_log_buffer import delivery_log_buffer
+
+    await delivery_log_buffer.add(row)              # wait until persisted
+    await delivery_log_buffer.add(row, wait=False)  # fire-and-forget
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import insert
+
+from app.db.session import AsyncSessionLocal
+from app.models.notification_delivery import NotificationDelivery
+
+logger = logging.getLogger(__name__)
+
+# Flush when this many rows are pending, or after FLUSH_INTERVAL seconds
+MAX_BATCH_SIZE = 100
+FLUSH_INTERVAL = 0.01
+
+
+class DeliveryLogBuffer:
+    """
+    Coalesces NotificationDelivery inserts into batched executemany writes.
+
+    A flusher task is started on demand and exits once the buffer is drained,
+    so nothing runs while there is no notification traffic.
+    """
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
+        self._session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[Tuple[Dict[str, Any], Optional[asyncio.Future]]] = []
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def add(self, row: Dict[str, Any], wait: bool = True) -> None:
+        """
+        Queue a notification_deliveries row for insertion.
+
+        Args:
+            row: Column values for NotificationDelivery (id included)
+            wait: If True, return only after the row's batch is committed and
+                re-raise the batch's error on failure
+
+        Raises:
+            Exception: Whatever the batched INSERT raised (only when wait=True)
+        """
+        future = asyncio.get_running_loop().create_future() if wait else None
+        self._pending.append((row, future))
+
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run(), name="delivery_log_flush")
+
+        if future is not None:
+            # Shield so a cancelled request doesn't cancel the shared batch
+            await asyncio.shield(future)
+
+    async def flush(self) -> None:
+        """Wait for every row queued so far to be written."""
+        while self._flusher is not None and not self._flusher.done():
+            await self._flusher
+
+    async def _run(self) -> None:
+        while self._pending:
+            if len(self._pending) < self.max_batch_size:
+                await asyncio.sleep(self.flush_interval)
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            await self._write(batch)
+
+    async def _write(self, batch: List[Tuple[Dict[str, Any], Optional[asyncio.Future]]]) -> None:
+        try:
+            await self._insert([row for row, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                row, future = batch[0]
+                self._settle_failed(row, future, e)
+                return
+            # One bad row must not lose the others: retry them one by one
+            logger.warning(
+                "Batched insert of %d notification delivery rows failed, retrying individually",
+                len(batch),
+            )
+            for row, future in batch:
+                try:
+                    await self._insert([row])
+                except Exception as e:
+                    self._settle_failed(row, future, e)
+                else:
+                    self._settle(future)
+        else:
+            for _, future in batch:
+                self._settle(future)
+
+    async def _insert(self, rows: List[Dict[str, Any]]) -> None:
+        async with self._session_factory() as db:
+            await db.execute(insert(NotificationDelivery), rows)
+            await db.commit()
+
+    @staticmethod
+    def _settle(future: Optional[asyncio.Future]) -> None:
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    @staticmethod
+    def _settle_failed(
+        row: Dict[str, Any], future: Optional[asyncio.Future], error: Exception
+    ) -> None:
+        logger.error("Failed to write notification delivery row %s: %s", row.get("id"), error)
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+
+delivery_log_buffer = DeliveryLogBuffer()
@@ -21,6 +21,10 @@ from app.services.indicator_registry.registry import (
     get_registry,
     register_indicator,
 )
+from app.services.indicator_registry.lookup import (
+    resolve_indicator,
+    validate_indicator_params,
+)
 
 # Import calculation functions from the standalone indicators.py module for backward compatibility
 from app.services import indicators as indicators_module
@@ -41,6 +45,8 @@ __all__ = [
     'AlertTemplate',
     'get_registry',
     'register_indicator',
+    'resolve_indicator',
+    'validate_indicator_params',
     'calculate_sma',
     'calculate_tdfi',
     'calculate_crsi',
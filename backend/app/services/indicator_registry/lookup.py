@@ -0,0 +1,69 @@
+"""Indicator lookup and parameter validation shared by the API routers.
+
+Both the indicator calculation endpoints and the indicator-config CRUD
+endpoints resolve indicators by name and validate user-supplied
+parameters against the registry; the helpers live here so neither
+router has to import from the other.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from app.services.indicator_registry.registry import Indicator, get_registry
+
+
+@lru_cache(maxsize=128)
+def _resolve_indicator(indicator_name: str, registry_version: int) -> Optional[Indicator]:
+    """Registry lookup by instance name, then base name; cached per registry version."""
+    registry = get_registry()
+    indicator = registry.get(indicator_name)
+    if not indicator:
+        indicator = registry.get_by_base_name(indicator_name)
+    return indicator
+
+
+def resolve_indicator(indicator_name: str) -> Optional[Indicator]:
+    """Resolve an indicator by instance name, then base name (memoized)."""
+    return _resolve_indicator(indicator_name, get_registry().version)
+
+
+def validate_indicator_params(indicator_name: str, params: Dict[str, Any]) -> None:
+    """
+    Validate indicator parameters against the indicator registry.
+
+    Rejects invalid configs with 400 error (FR-009). Valid values are
+    coerced to their declared types in place.
+
+    Args:
+        indicator_name: Indicator type name
+        params: Parameter values to validate
+
+    Raises:
+        HTTPException: 400 if parameters are invalid
+    """
+    indicator = resolve_indicator(indicator_name)
+    if indicator is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Indicator '{indicator_name}' not found in registry"
+        )
+
+    # Check for unknown parameters
+    unknown_params = params.keys() - indicator.param_names
+    if unknown_params:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown parameters for {indicator_name}: {sorted(unknown_params)}. "
+                   f"Valid parameters: {sorted(indicator.param_names)}"
+        )
+
+    # Coerce and range-check, collecting every problem into one 400
+    try:
+        indicator.validate_params(params, coerce=True)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 try:
     import pandas_ta as pta
 except:
@@ -330,9 +331,70 @@ DEFAULT_PARAMS: Dict[str, Dict[str, Any]] = {
 # Utility Functions
 # ============================================================================
 
+def _rolling_dot(close: pd.Series, weights: np.ndarray) -> pd.Series:
+    """Fixed-weight rolling dot product as one sliding_window_view matmul.
+
+    Same result as close.rolling(n, min_periods=n).apply(np.dot-with-weights,
+    raw=True), without a Python callback per bar.
+    """
+    length = len(weights)
+    values = close.to_numpy(dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) >= length:
+        out[length - 1:] = sliding_window_view(values, length) @ weights
+    return pd.Series(out, index=close.index)
+
+
+def _finish_overlap(result: pd.Series, offset: Any, name: str, **kwargs) -> pd.Series:
+    """Apply pandas-ta's offset/fill/naming conventions to an overlap result."""
+    offset = int(offset) if isinstance(offset, int) else 0
+    if offset != 0:
+        result = result.shift(offset)
+    if "fillna" in kwargs:
+        result = result.fillna(kwargs["fillna"])
+    if kwargs.get("fill_method") in ("ffill", "pad"):
+        result = result.ffill()
+    elif kwargs.get("fill_method") in ("bfill", "backfill"):
+        result = result.bfill()
+    result.name = name
+    result.category = "overlap"
+    return result
+
+
+def _wma(close, length=None, asc=None, talib=None, offset=None, **kwargs):
+    """Weighted Moving Average (WMA)"""
+    length = int(length) if length and length > 0 else 10
+    if close is None or len(close) < length:
+        return None
+    result = _rolling_dot(close, np.arange(1, length + 1, dtype=np.float64))
+    result = result / (0.5 * length * (length + 1))
+    return _finish_overlap(result, offset, f"WMA_{length}", **kwargs)
+
+
+def _sinwma(close, length=None, offset=None, **kwargs):
+    """Sine Weighted Moving Average (SINWMA)"""
+    length = int(length) if length and length > 0 else 14
+    if close is None or len(close) < length:
+        return None
+    sines = np.sin(np.arange(1, length + 1) * np.pi / (length + 1))
+    result = _rolling_dot(close, sines / sines.sum())
+    return _finish_overlap(result, offset, f"SINWMA_{length}", **kwargs)
+
+
+# Closed-form weighted moving averages that pandas-ta computes with a
+# per-bar rolling().apply() callback; these vectorized versions replace them
+_NATIVE_FUNCTIONS: Dict[str, Callable] = {
+    "wma": _wma,
+    "sinwma": _sinwma,
+}
+
+
 def get_pandas_ta_function(name: str) -> Optional[Callable]:
-    """Get a pandas-ta function by name."""
-    return getattr(pta, name, None)
+    """Get a pandas-ta function by name (or its vectorized native equivalent)."""
+    func = getattr(pta, name, None)
+    if func is not None and name in _NATIVE_FUNCTIONS:
+        return _NATIVE_FUNCTIONS[name]
+    return func
 
 
 def is_valid_indicator(name: str, func: Callable) -> bool:
@@ -679,8 +741,8 @@ class PandasTAIndicator(Indicator):
         if result is None:
             # Return a DataFrame with NaN columns for the indicator
             df_copy = df.copy()
-            for series_meta in self.metadata.series_metadata:
-                df_copy[series_meta.field] = pd.NA
+            for field in self.series_fields:
+                df_copy[field] = pd.NA
             return df_copy
 
         # Convert result to DataFrame if it's a Series
@@ -33,8 +33,10 @@ in your calculate() method:
 This ensures your indicator works with the alert engine out of the box.
 """
 
-from typing import Callable, Dict, Any, Optional, List, List as ListType
+import math
+from typing import Callable, Dict, Any, Optional, List, List as ListType, Tuple
 from dataclasses import dataclass, field
+from functools import cached_property
 from abc import ABC, abstractmethod
 from enum import Enum
 
@@ -50,6 +52,8 @@ except ImportError:
     ParameterDefinition = None
     IndicatorInfo = None
 
+import numpy as np
+import orjson
 import pandas as pd
 
 
@@ -81,6 +85,94 @@ class AlertTemplate:
         self.requires_threshold = requires_threshold
 
 
+@dataclass(slots=True, frozen=True)
+class ParamRule:
+    """Flattened validation rule for a single indicator parameter.
+
+    Built once per indicator from its ParameterDefinition so request-time
+    validation is a plain loop over tuples instead of re-reading definitions.
+
+    Attributes:
+        name: Parameter name
+        type_label: Human-readable type used in error messages
+        coercer: Converts a value to the parameter's type (e.g. "20" -> 20),
+            raising TypeError/ValueError if it can't, or None for no check
+        strict_types: Types accepted as-is when coercion is off
+        min_v: Inclusive lower bound, or None
+        max_v: Inclusive upper bound, or None
+    """
+    name: str
+    type_label: str
+    coercer: Optional[Callable[[Any], Any]]
+    strict_types: Tuple[type, ...]
+    min_v: Optional[float]
+    max_v: Optional[float]
+
+
+def _to_int(value: Any) -> int:
+    """Integer parameter: ints, integral finite floats and their strings."""
+    if isinstance(value, bool):
+        raise TypeError("bool is not an integer")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            return int(value)
+        except ValueError:
+            value = float(value)
+    if isinstance(value, float):
+        if not math.isfinite(value) or not value.is_integer():
+            raise ValueError(f"{value} is not an integer")
+        return int(value)
+    raise TypeError(f"{type(value).__name__} is not an integer")
+
+
+def _to_float(value: Any) -> float:
+    """Float parameter: finite ints, floats and numeric strings."""
+    if isinstance(value, bool):
+        raise TypeError("bool is not a number")
+    if isinstance(value, str):
+        value = value.strip()
+    elif not isinstance(value, (int, float)):
+        raise TypeError(f"{type(value).__name__} is not a number")
+    result = float(value)
+    if not math.isfinite(result):
+        raise ValueError(f"{value} is not a finite number")
+    return result
+
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "off"})
+
+
+def _to_bool(value: Any) -> bool:
+    """Boolean parameter: bools and true/false style strings."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def _to_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"{type(value).__name__} is not a string")
+    return value
+
+
+_PARAM_TYPE_RULES: Dict[str, Tuple[str, Callable[[Any], Any], Tuple[type, ...]]] = {
+    "integer": ("an integer", _to_int, (int,)),
+    "float": ("a number", _to_float, (int, float)),
+    "boolean": ("a boolean", _to_bool, (bool,)),
+    "string": ("a string", _to_str, (str,)),
+}
+
+
 class Indicator(ABC):
     """Base class for all indicators.
 
@@ -110,6 +202,10 @@ class Indicator(ABC):
             return result_df
     """
 
+    # Indicators that set this implement calculate_arrays(); the API then
+    # skips the DataFrame round-trip for them
+    supports_array_io: bool = False
+
     def __init__(self, **default_params):
         """Initialize indicator with optional default parameters.
 
@@ -229,6 +325,21 @@ class Indicator(ABC):
         """
         pass
 
+    def calculate_arrays(self, columns: Dict[str, np.ndarray], **kwargs) -> Dict[str, np.ndarray]:
+        """Calculate the indicator on raw OHLCV column arrays.
+
+        Only called when supports_array_io is True.
+
+        Args:
+            columns: 'open', 'high', 'low', 'close', 'volume' float64 arrays
+                (whichever are available), all the same length
+            **kwargs: Indicator-specific parameters
+
+        Returns:
+            Dict of series field name to array aligned with the input columns
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support array I/O")
+
     @property
     def metadata(self) -> IndicatorMetadata:
         """Return the indicator metadata for frontend rendering.
@@ -249,6 +360,20 @@ class Indicator(ABC):
             "This is required for generic frontend rendering."
         )
 
+    @cached_property
+    def cached_metadata(self) -> IndicatorMetadata:
+        """Return metadata, built once per indicator instance.
+
+        metadata only depends on the instance's construction parameters, so
+        hot paths use this instead of rebuilding it on every request.
+        """
+        return self.metadata
+
+    @cached_property
+    def series_fields(self) -> Tuple[str, ...]:
+        """Return the field names from metadata.series_metadata, in order."""
+        return tuple(s.field for s in self.cached_metadata.series_metadata)
+
     @property
     def alert_templates(self) -> List[AlertTemplate]:
         """Return alert condition templates for this indicator.
@@ -261,61 +386,85 @@ class Indicator(ABC):
         """
         return []
 
-    def validate_params(self, params: Dict[str, Any]) -> None:
+    def validate_params(self, params: Dict[str, Any], coerce: bool = False) -> None:
         """Validate parameters against their definitions.
 
+        With coerce=True (request parameters, e.g. parsed from a query
+        string) values are converted to their declared type in place, so
+        "20" or 20.0 become 20 and "true" becomes True. Otherwise values
+        must already have the declared type.
+
         Args:
             params: Parameter values to validate
+            coerce: Convert values to their declared type, updating params
 
         Raises:
-            ValueError: If any parameter is invalid (out of bounds, wrong type, etc.)
+            ValueError: If any parameter is invalid (unknown, wrong type or
+                out of bounds); the message lists every problem
         """
-        param_defs = self.parameter_definitions
+        unknown = params.keys() - self.param_names
+        if unknown:
+            raise ValueError(
+                f"Invalid parameter '{sorted(unknown)[0]}' for indicator '{self.base_name}'. "
+                f"Valid parameters: {list(self.parameter_definitions.keys())}"
+            )
 
-        for param_name, param_value in params.items():
-            if param_name not in param_defs:
-                raise ValueError(
-                    f"Invalid parameter '{param_name}' for indicator '{self.base_name}'. "
-                    f"Valid parameters: {list(param_defs.keys())}"
-                )
+        errors = []
+        for rule in self.compiled_param_spec:
+            if rule.name not in params:
+                continue
+
+            value = params[rule.name]
+
+            # Type validation / coercion
+            if rule.coercer is not None:
+                if not coerce and (
+                    not isinstance(value, rule.strict_types)
+                    or (isinstance(value, bool) and bool not in rule.strict_types)
+                ):
+                    errors.append(f"Parameter '{rule.name}' must be {rule.type_label}, got {type(value).__name__}")
+                    continue
+                try:
+                    value = rule.coercer(value)
+                except (TypeError, ValueError, OverflowError):
+                    errors.append(f"Parameter '{rule.name}' must be {rule.type_label}, got {value!r}")
+                    continue
+                if coerce:
+                    params[rule.name] = value
+
+            # Range validation
+            if rule.min_v is not None and value < rule.min_v:
+                errors.append(f"Parameter '{rule.name}' must be >= {rule.min_v}, got {value}")
+            elif rule.max_v is not None and value > rule.max_v:
+                errors.append(f"Parameter '{rule.name}' must be <= {rule.max_v}, got {value}")
 
-            param_def = param_defs[param_name]
-
-            # Type validation
-            expected_type = param_def.type
-            if expected_type == "integer":
-                if not isinstance(param_value, int):
-                    raise ValueError(
-                        f"Parameter '{param_name}' must be an integer, got {type(param_value).__name__}"
-                    )
-            elif expected_type == "number":
-                if not isinstance(param_value, (int, float)):
-                    raise ValueError(
-                        f"Parameter '{param_name}' must be a number, got {type(param_value).__name__}"
-                    )
-            elif expected_type == "boolean":
-                if not isinstance(param_value, bool):
-                    raise ValueError(
-                        f"Parameter '{param_name}' must be a boolean, got {type(param_value).__name__}"
-                    )
-            elif expected_type == "string":
-                if not isinstance(param_value, str):
-                    raise ValueError(
-                        f"Parameter '{param_name}' must be a string, got {type(param_value).__name__}"
-                    )
-
-            # Min/max validation for numeric types
-            if hasattr(param_def, 'min') and param_def.min is not None:
-                if isinstance(param_value, (int, float)) and param_value < param_def.min:
-                    raise ValueError(
-                        f"Parameter '{param_name}' must be >= {param_def.min}, got {param_value}"
-                    )
-
-            if hasattr(param_def, 'max') and param_def.max is not None:
-                if isinstance(param_value, (int, float)) and param_value > param_def.max:
-                    raise ValueError(
-                        f"Parameter '{param_name}' must be <= {param_def.max}, got {param_value}"
-                    )
+        if errors:
+            raise ValueError("; ".join(errors))
+
+    @cached_property
+    def compiled_param_spec(self) -> Tuple[ParamRule, ...]:
+        """Return parameter_definitions compiled into ParamRule tuples.
+
+        Computed once per indicator instance; IndicatorRegistry.register()
+        builds it eagerly so requests never pay for it.
+        """
+        rules = []
+        for param_name, param_def in self.parameter_definitions.items():
+            type_label, coercer, strict_types = _PARAM_TYPE_RULES.get(param_def.type, ("", None, ()))
+            rules.append(ParamRule(
+                name=param_name,
+                type_label=type_label,
+                coercer=coercer,
+                strict_types=strict_types,
+                min_v=getattr(param_def, 'min', None),
+                max_v=getattr(param_def, 'max', None),
+            ))
+        return tuple(rules)
+
+    @cached_property
+    def param_names(self) -> frozenset:
+        """Return the set of accepted parameter names."""
+        return frozenset(rule.name for rule in self.compiled_param_spec)
 
     def serialize_params(self) -> str:
         """Serialize indicator parameters to JSON string.
@@ -385,6 +534,14 @@ class SMAIndicator(Indicator):
         price_col = kwargs.get('price_col', 'close')
         return indicators_module.calculate_sma(df, period=period, price_col=price_col)
 
+    supports_array_io = True
+
+    def calculate_arrays(self, columns: Dict[str, np.ndarray], **kwargs) -> Dict[str, np.ndarray]:
+        from app.services import indicators as indicators_module
+        period = kwargs.get('period', self._period)
+        price_col = kwargs.get('price_col', 'close')
+        return {"sma": indicators_module.rolling_mean(columns[price_col], period)}
+
     @property
     def metadata(self) -> IndicatorMetadata:
         from app.schemas.indicator import (
@@ -535,6 +692,17 @@ class TDFIIndicator(Indicator):
             filter_low=filter_low
         )
 
+    supports_array_io = True
+
+    def calculate_arrays(self, columns: Dict[str, np.ndarray], **kwargs) -> Dict[str, np.ndarray]:
+        from app.services import indicators as indicators_module
+        return indicators_module.calculate_tdfi_np(
+            columns['close'],
+            lookback=kwargs.get('lookback', self._lookback),
+            filter_high=kwargs.get('filter_high', self._filter_high),
+            filter_low=kwargs.get('filter_low', self._filter_low)
+        )
+
     @property
     def metadata(self) -> IndicatorMetadata:
         from app.schemas.indicator import (
@@ -996,6 +1164,14 @@ class EMAIndicator(Indicator):
         df_copy['ema'] = df_copy[price_col].ewm(span=period, adjust=False).mean()
         return df_copy
 
+    supports_array_io = True
+
+    def calculate_arrays(self, columns: Dict[str, np.ndarray], **kwargs) -> Dict[str, np.ndarray]:
+        from app.services import indicators as indicators_module
+        period = kwargs.get('period', self._period)
+        price_col = kwargs.get('price_col', 'close')
+        return {"ema": indicators_module.calculate_ema_np(columns[price_col], period=period)}
+
     @property
     def metadata(self) -> IndicatorMetadata:
         from app.schemas.indicator import (
@@ -1639,10 +1815,23 @@ class IndicatorRegistry:
 
     def __init__(self):
         self._indicators: Dict[str, Indicator] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every registration.
+
+        Callers that cache data derived from the registry include this in
+        their cache key so registrations invalidate stale entries.
+        """
+        return self._version
 
     def register(self, indicator: Indicator) -> None:
         """Register an indicator."""
         self._indicators[indicator.name] = indicator
+        self._version += 1
+        # Precompile parameter coercers/bounds at load time
+        indicator.compiled_param_spec
 
     def get(self, name: str) -> Optional[Indicator]:
         """Get an indicator by name."""
@@ -1711,7 +1900,7 @@ class IndicatorRegistry:
                 description = ind.description
                 category = ind.category
                 parameters = ind.parameter_definitions
-                metadata = ind.metadata
+                metadata = ind.cached_metadata
                 alert_templates = [
                     {
                         "condition_type": t.condition_type,
@@ -1735,9 +1924,9 @@ class IndicatorRegistry:
                 }
 
                 # Try to serialize the result to catch serialization issues early
-                import json
                 try:
-                    json.dumps(result_item, default=str)  # Use default=str to handle unserializable objects
+                    # default=str handles unserializable objects; non-str keys are allowed as in json.dumps
+                    orjson.dumps(result_item, default=str, option=orjson.OPT_NON_STR_KEYS)
                 except TypeError as e:
                     logger.error(f"Serialization error for indicator '{name}': {e}")
                     continue
@@ -10,8 +10,9 @@ Pattern: registry.get(indicator_name).calculate(df, **params)
 """
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -23,6 +24,41 @@ from app.models.alert import Alert
 
 logger = logging.getLogger(__name__)
 
+CANDLE_VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def candles_to_frame(candles_data: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build the indicator input DataFrame column-by-column from candle dicts.
+
+    Avoids the list-of-dicts constructor's per-row key inference. Only the
+    timestamp and OHLCV columns are kept; missing prices become NaN.
+    """
+    columns: Dict[str, Any] = {
+        "timestamp": pd.to_datetime([c["timestamp"] for c in candles_data], cache=True)
+    }
+    columns.update(_candle_value_arrays(candles_data))
+    return pd.DataFrame(columns, copy=False)
+
+
+def candles_to_arrays(candles_data: List[Dict[str, Any]]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Array counterpart of candles_to_frame, for indicators with array I/O.
+
+    Returns:
+        (naive-UTC datetime64[ns] timestamps, float64 OHLCV columns)
+    """
+    timestamps = pd.to_datetime([c["timestamp"] for c in candles_data], cache=True)
+    return timestamps.to_numpy(dtype="datetime64[ns]"), _candle_value_arrays(candles_data)
+
+
+def _candle_value_arrays(candles_data: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    first = candles_data[0]
+    return {
+        key: np.array([c[key] for c in candles_data], dtype=np.float64)
+        for key in CANDLE_VALUE_COLUMNS
+        if key in first
+    }
+
+
 # Baseline candle count to ensure sufficient historical data
 # This is the minimum number of candles we load for any indicator calculation
 BASELINE_CANDLE_COUNT = 500
@@ -175,11 +211,9 @@ class IndicatorService:
         if not candles_data:
             raise ValueError(f"No candles found for {ticker} ({interval})")
         
-        # 2. Convert to DataFrame
-        df = pd.DataFrame(candles_data)
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df = df.sort_values("timestamp")
-        df = df.drop_duplicates(subset=["timestamp"], keep="first")
+        # 2. Convert to DataFrame (get_candles already returns rows ordered by
+        # timestamp and unique per the candle table's unique constraint)
+        df = candles_to_frame(candles_data)
         
         # 3. Get indicator from registry
         registry = get_registry()
@@ -1,9 +1,53 @@
 import pandas as pd
 import numpy as np
-from typing import Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Optional
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the recursive loops below run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
 # Removed: from stock_indicators import indicators # Import from stock_indicators
 
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Array-native SMA, equivalent to Series.rolling(window=period).mean().
+
+    Leading positions without a full window (or with a NaN in it) are NaN.
+    """
+    out = np.full(len(values), np.nan)
+    if 0 < period <= len(values):
+        out[period - 1:] = sliding_window_view(values, period).mean(axis=1)
+    return out
+
+
+def rolling_quantiles(values: np.ndarray, window: int, quantiles) -> np.ndarray:
+    """
+    Several rolling quantiles from one sort of each window.
+
+    Equivalent to Series.rolling(window, min_periods=window).quantile(q)
+    (linear interpolation) for every q; returns a (len(quantiles), n) array.
+    Windows that are incomplete or contain a NaN are NaN.
+    """
+    out = np.full((len(quantiles), len(values)), np.nan)
+    if not 0 < window <= len(values):
+        return out
+    windows = np.sort(sliding_window_view(values, window), axis=1)
+    for row, q in enumerate(quantiles):
+        pos = q * (window - 1)
+        lo = int(np.floor(pos))
+        hi = min(lo + 1, window - 1)
+        out[row, window - 1:] = windows[:, lo] + (windows[:, hi] - windows[:, lo]) * (pos - lo)
+    # NaN sorts to the end of a window, so a NaN in the last slot marks it
+    out[:, window - 1:][:, np.isnan(windows[:, -1])] = np.nan
+    return out
+
+
 def calculate_sma(df: pd.DataFrame, period: int = 20, price_col: str = 'close') -> pd.DataFrame:
     """
     Calculate Simple Moving Average (SMA).
@@ -21,6 +65,13 @@ def calculate_sma(df: pd.DataFrame, period: int = 20, price_col: str = 'close')
     return df
 
 
+def ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Array-native EMA, equivalent to Series.ewm(span=span, adjust=False).mean().
+    """
+    return pd.Series(values, copy=False).ewm(span=span, adjust=False).mean().to_numpy()
+
+
 def calculate_ema(df: pd.DataFrame, period: int = 20, price_col: str = 'close') -> pd.DataFrame:
     """
     Calculate Exponential Moving Average (EMA).
@@ -34,10 +85,17 @@ def calculate_ema(df: pd.DataFrame, period: int = 20, price_col: str = 'close')
         DataFrame with EMA column added
     """
     df = df.copy()
-    df['ema'] = df[price_col].ewm(span=period, adjust=False).mean()
+    df['ema'] = calculate_ema_np(df[price_col].to_numpy(), period=period)
     return df
 
 
+def calculate_ema_np(close: np.ndarray, period: int = 20) -> np.ndarray:
+    """
+    Array version of calculate_ema; returns the EMA of close as float64.
+    """
+    return ewm_mean(np.ascontiguousarray(close, dtype=np.float64), period)
+
+
 def calculate_tdfi(
     df: pd.DataFrame, 
     lookback: int = 13,
@@ -49,31 +107,55 @@ def calculate_tdfi(
     Calculates the Trend Direction Force Index (TDFI) based on the provided Pine Script.
     """
     df = df.copy()
-    price = df[price_col] * 1000
+    result = calculate_tdfi_np(
+        df[price_col].to_numpy(),
+        lookback=lookback,
+        filter_high=filter_high,
+        filter_low=filter_low,
+    )
+    df['TDFI'] = result['TDFI']
+    df['TDFI_Signal'] = result['TDFI_Signal']
+
+    return df
+
 
-    mma = price.ewm(span=lookback, adjust=False).mean()
-    smma = mma.ewm(span=lookback, adjust=False).mean()
+def calculate_tdfi_np(
+    close: np.ndarray,
+    lookback: int = 13,
+    filter_high: float = 0.05,
+    filter_low: float = -0.05,
+) -> Dict[str, np.ndarray]:
+    """
+    Array version of calculate_tdfi.
 
-    impetmma = mma - mma.shift(1)
-    impetsmma = smma - smma.shift(1)
-    divma = abs(mma - smma)
+    Returns:
+        Dict with the 'TDFI' (float64) and 'TDFI_Signal' (-1/0/1) arrays
+    """
+    price = np.ascontiguousarray(close, dtype=np.float64) * 1000
+
+    mma = ewm_mean(price, lookback)
+    smma = ewm_mean(mma, lookback)
+
+    impetmma = np.empty_like(mma)
+    impetmma[:1] = np.nan
+    np.subtract(mma[1:], mma[:-1], out=impetmma[1:])
+    impetsmma = np.empty_like(smma)
+    impetsmma[:1] = np.nan
+    np.subtract(smma[1:], smma[:-1], out=impetsmma[1:])
+    divma = np.abs(mma - smma)
     averimpet = (impetmma + impetsmma) / 2
 
-    number = averimpet
-    pow_val = 3
-    result = number.pow(pow_val) # Simplified from loop
+    tdf = divma * averimpet ** 3
 
-    tdf = divma * result
-    
     # Avoid division by zero and handle very small values
-    rolling_max = tdf.abs().rolling(window=lookback * 3, min_periods=1).max()
-    ntdf = tdf / rolling_max
-    ntdf = ntdf.fillna(0).clip(-1, 1) # Ensure within -1 to 1 range
-    
-    df['TDFI'] = ntdf
-    df['TDFI_Signal'] = np.where(df['TDFI'] > filter_high, 1, np.where(df['TDFI'] < filter_low, -1, 0))
+    rolling_max = pd.Series(np.abs(tdf), copy=False).rolling(window=lookback * 3, min_periods=1).max().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ntdf = tdf / rolling_max
+    ntdf[np.isnan(ntdf)] = 0
+    np.clip(ntdf, -1, 1, out=ntdf)  # Ensure within -1 to 1 range
 
-    return df
+    signal = np.where(ntdf > filter_high, 1, np.where(ntdf < filter_low, -1, 0))
+    return {'TDFI': ntdf, 'TDFI_Signal': signal}
 
 def rma(series, length):
     alpha = 1 / length
@@ -124,15 +206,27 @@ def calculate_crsi(
     # Vectorized dynamic bands using rolling quantile
     aperc = leveling / 100.0
 
-    # Use rolling window with min_periods to handle initial values
-    upper_band = crsi.rolling(window=cyclicmemory, min_periods=cyclicmemory).quantile(1 - aperc)
-    lower_band = crsi.rolling(window=cyclicmemory, min_periods=cyclicmemory).quantile(aperc)
+    # Both bands come from a single sort of each cyclicmemory-wide window
+    upper_band, lower_band = rolling_quantiles(
+        crsi.to_numpy(dtype=np.float64), cyclicmemory, (1 - aperc, aperc)
+    )
 
     df['cRSI_UpperBand'] = upper_band
     df['cRSI_LowerBand'] = lower_band
 
     return df
 
+@njit(cache=True)
+def _adxvma_recursion(close: np.ndarray, vindex: np.ndarray, k: float) -> np.ndarray:
+    """Variable-coefficient EMA: out[i] = (1 - k*vindex[i]) * out[i-1] + k*vindex[i] * close[i]."""
+    out = np.empty_like(close)
+    out[0] = close[0]
+    for i in range(1, len(close)):
+        vi = vindex[i]
+        out[i] = (1 - k * vi) * out[i - 1] + k * vi * close[i]
+    return out
+
+
 def calculate_adxvma(df: pd.DataFrame, adxvma_period: int = 15) -> pd.DataFrame:
     """
     Vectorized implementation of ADXVMA (Average Directional Index Volatility Moving Average).
@@ -186,20 +280,11 @@ def calculate_adxvma(df: pd.DataFrame, adxvma_period: int = 15) -> pd.DataFrame:
     # Calculate vIndex
     vIndex = np.where((hhv - llv) > 0.0, (index_vals - llv) / (hhv - llv), 0.0)
 
-    # Calculate ADXVMA using vectorized operations
-    # For first period, use close; for rest, use EMA formula
-    adxvma = pd.Series(index=df.index, dtype=float)
-    adxvma.iloc[0] = close.iloc[0]
-
-    # Vectorized EMA for adxvma: adxvma[i] = (1 - k * vIndex) * adxvma[i-1] + k * vIndex * close[i]
-    # This is a variable-coefficient EMA, need to compute iteratively but can optimize
-    # Using numpy for the iterative part is still much faster than .iloc loops
-    adxvma_vals = np.zeros(len(df))
-    adxvma_vals[0] = close.iloc[0]
-
-    for i in range(1, len(df)):
-        vi = vIndex[i]
-        adxvma_vals[i] = (1 - k * vi) * adxvma_vals[i-1] + k * vi * close.iloc[i]
+    # Calculate ADXVMA: for first period, use close; for rest, use EMA formula
+    # adxvma[i] = (1 - k * vIndex) * adxvma[i-1] + k * vIndex * close[i]
+    # This is a variable-coefficient EMA, so it is computed iteratively on raw
+    # numpy arrays (compiled with numba when it is installed)
+    adxvma_vals = _adxvma_recursion(close.to_numpy(dtype=np.float64), vIndex, k)
 
     adxvma = pd.Series(adxvma_vals, index=df.index)
 
@@ -7,6 +7,7 @@ within tolerance, prefers the cloud version (deterministic tiebreaker).
 This is a single shared implementation used by all merge operations
 (alerts, watchlists, layouts) to prevent inconsistent behavior.
 """
+import uuid
 from datetime import datetime, timezone, timedelta
 from typing import List, Type, TypeVar, Generic, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -48,6 +49,21 @@ def should_update(guest_updated: datetime, cloud_updated: datetime) -> bool:
     return False
 
 
+async def _existing_by_uuid(db: AsyncSession, model, user_id: int, uuids: List[Any]) -> Dict[str, Any]:
+    """
+    Load the user's existing rows for a batch of UUIDs in one query.
+
+    Returns a dict keyed by the canonical UUID string.
+    """
+    result = await db.execute(
+        select(model).where(
+            model.user_id == user_id,
+            model.uuid.in_(uuids)
+        )
+    )
+    return {str(row.uuid): row for row in result.scalars().all()}
+
+
 async def upsert_alert(
     db: AsyncSession,
     user_id: int,
@@ -71,18 +87,16 @@ async def upsert_alert(
     if not guest_alerts:
         return stats
 
+    # Look up every existing alert in one query instead of one per guest alert
+    existing_alerts = await _existing_by_uuid(
+        db, Alert, user_id, [guest_alert['uuid'] for guest_alert in guest_alerts]
+    )
+
     for guest_alert in guest_alerts:
         guest_uuid = guest_alert['uuid']
         guest_updated_at = datetime.fromisoformat(guest_alert['updated_at'].replace('Z', '+00:00'))
 
-        # Check if alert exists in cloud
-        result = await db.execute(
-            select(Alert).where(
-                Alert.user_id == user_id,
-                Alert.uuid == guest_uuid
-            )
-        )
-        existing_alert = result.scalar_one_or_none()
+        existing_alert = existing_alerts.get(str(uuid.UUID(guest_uuid)))
 
         if existing_alert is None:
             # Create new alert
@@ -100,6 +114,7 @@ async def upsert_alert(
                 updated_at=guest_updated_at,
             )
             db.add(new_alert)
+            existing_alerts[str(uuid.UUID(guest_uuid))] = new_alert
             stats['added'] += 1
         else:
             # Check if we should update based on timestamps
@@ -231,18 +246,16 @@ async def upsert_layouts(
     if not guest_layouts:
         return stats
 
+    # Look up every existing layout in one query instead of one per guest layout
+    existing_layouts = await _existing_by_uuid(
+        db, Layout, user_id, [guest_layout['uuid'] for guest_layout in guest_layouts]
+    )
+
     for guest_layout in guest_layouts:
         guest_uuid = guest_layout['uuid']
         guest_updated_at = datetime.fromisoformat(guest_layout['updated_at'].replace('Z', '+00:00'))
 
-        # Check if layout exists in cloud
-        result = await db.execute(
-            select(Layout).where(
-                Layout.user_id == user_id,
-                Layout.uuid == guest_uuid
-            )
-        )
-        existing_layout = result.scalar_one_or_none()
+        existing_layout = existing_layouts.get(str(uuid.UUID(guest_uuid)))
 
         if existing_layout is None:
             # Create new layout
@@ -255,6 +268,7 @@ async def upsert_layouts(
                 updated_at=guest_updated_at,
             )
             db.add(new_layout)
+            existing_layouts[str(uuid.UUID(guest_uuid))] = new_layout
             stats['added'] += 1
         else:
             # Check if we should update based on timestamps
@@ -295,33 +309,34 @@ async def upsert_indicator_configs(
         Dict with counts: {added: int, updated: int, skipped: int}
     """
     from app.models.indicator_config import IndicatorConfig
-    import uuid
 
     stats = {'added': 0, 'updated': 0, 'skipped': 0}
 
     if not guest_indicators:
         return stats
 
+    # Parse UUIDs up front; invalid ones are skipped
+    parsed = []
     for guest_indicator in guest_indicators:
-        guest_uuid = guest_indicator['uuid']
-        guest_updated_at = datetime.fromisoformat(guest_indicator['updatedAt'].replace('Z', '+00:00'))
-
-        # Parse UUID
         try:
-            guest_uuid_parsed = uuid.UUID(guest_uuid)
+            parsed.append((guest_indicator, uuid.UUID(guest_indicator['uuid'])))
         except ValueError:
+            parsed.append((guest_indicator, None))
+
+    # Look up every existing indicator in one query instead of one per guest indicator
+    existing_indicators = await _existing_by_uuid(
+        db, IndicatorConfig, user_id, [uuid_ for _, uuid_ in parsed if uuid_ is not None]
+    )
+
+    for guest_indicator, guest_uuid_parsed in parsed:
+        if guest_uuid_parsed is None:
             # Invalid UUID - skip this indicator
             stats['skipped'] += 1
             continue
 
-        # Check if indicator exists in cloud
-        result = await db.execute(
-            select(IndicatorConfig).where(
-                IndicatorConfig.user_id == user_id,
-                IndicatorConfig.uuid == guest_uuid_parsed
-            )
-        )
-        existing_indicator = result.scalar_one_or_none()
+        guest_updated_at = datetime.fromisoformat(guest_indicator['updatedAt'].replace('Z', '+00:00'))
+
+        existing_indicator = existing_indicators.get(str(guest_uuid_parsed))
 
         if existing_indicator is None:
             # Create new indicator
@@ -338,6 +353,7 @@ async def upsert_indicator_configs(
                 updated_at=guest_updated_at,
             )
             db.add(new_indicator)
+            existing_indicators[str(guest_uuid_parsed)] = new_indicator
             stats['added'] += 1
         else:
             # Check if we should update based on timestamps
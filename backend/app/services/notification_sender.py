@@ -36,7 +36,7 @@ from app.schemas.notification import NotificationType as SchemaNotificationType
 from app.services.notification_service import (
     get_user_preference,
     get_alert_notification_settings,
-    log_notification_delivery,
+    record_notification_delivery,
     get_telegram_config,
 )
 from app.services.telegram_service import (
@@ -46,6 +46,11 @@ from app.services.telegram_service import (
 
 logger = logging.getLogger(__name__)
 
+# Schema enum member -> model enum member, built once instead of per send
+_MODEL_NOTIFICATION_TYPES = {
+    member: NotificationType(member.value) for member in SchemaNotificationType
+}
+
 
 async def send_notification_internal(
     db: AsyncSession,
@@ -73,7 +78,10 @@ async def send_notification_internal(
         ValueError: If notification type is not supported
     """
     # Convert notification type enum
-    nt = NotificationType(notification_type.value)
+    try:
+        nt = _MODEL_NOTIFICATION_TYPES[notification_type]
+    except KeyError:
+        raise ValueError(f"Unsupported notification type: {notification_type}") from None
 
     # Fetch alert_id if not provided
     if not alert_id:
@@ -100,8 +108,7 @@ async def send_notification_internal(
         elif notification_type == SchemaNotificationType.TOAST:
             # Toast notifications are handled by the frontend via WebSocket/polling
             # We just log the delivery
-            delivery = await log_notification_delivery(
-                db=db,
+            delivery = await record_notification_delivery(
                 alert_id=alert_id,
                 trigger_id=alert_trigger_id,
                 user_id=user_id,
@@ -113,8 +120,7 @@ async def send_notification_internal(
         elif notification_type == SchemaNotificationType.SOUND:
             # Sound notifications are handled by the frontend
             # We just log the delivery
-            delivery = await log_notification_delivery(
-                db=db,
+            delivery = await record_notification_delivery(
                 alert_id=alert_id,
                 trigger_id=alert_trigger_id,
                 user_id=user_id,
@@ -132,8 +138,7 @@ async def send_notification_internal(
         logger.error(f"Failed to send {notification_type.value} notification: {e}")
 
         # Log the failed delivery
-        await log_notification_delivery(
-            db=db,
+        await record_notification_delivery(
             alert_id=alert_id,
             trigger_id=alert_trigger_id,
             user_id=user_id,
@@ -175,15 +180,16 @@ async def _send_telegram_notification(
             text=formatted_message,
         )
 
-        # Log successful delivery
-        delivery = await log_notification_delivery(
-            db=db,
+        # Log successful delivery in the background so the caller returns as
+        # soon as Telegram has accepted the message
+        delivery = await record_notification_delivery(
             alert_id=alert_id,
             trigger_id=alert_trigger_id,
             user_id=user_id,
             notification_type=NotificationType.TELEGRAM,
             status=DeliveryStatus.SENT,
             message=message,
+            wait=False,
         )
 
         logger.info(
@@ -19,7 +19,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.encryption import encrypt, decrypt, EncryptionError
@@ -32,6 +32,7 @@ from app.schemas.notification import (
     DeliveryStatus,
 )
 from app.services.audit import notification_audit_log
+from app.services.delivery_log_buffer import delivery_log_buffer
 
 logger = logging.getLogger(__name__)
 
@@ -222,13 +223,13 @@ async def get_notification_history(
     offset: int = 0,
 ) -> tuple[list[NotificationDelivery], int]:
     """Get user's notification history with pagination."""
-    # Get total count
+    # Get total count (counted in Postgres; only the page itself is loaded)
     count_result = await db.execute(
-        select(NotificationDelivery).where(
+        select(func.count()).where(
             NotificationDelivery.user_id == user_id
         )
     )
-    total = len(count_result.all())
+    total = count_result.scalar_one()
 
     # Get paginated results
     result = await db.execute(
@@ -282,6 +283,48 @@ async def log_notification_delivery(
     return delivery
 
 
+async def record_notification_delivery(
+    alert_id: UUID,
+    trigger_id: int,
+    user_id: int,
+    notification_type: NotificationType,
+    status: DeliveryStatus,
+    message: Optional[str] = None,
+    error_message: Optional[str] = None,
+    wait: bool = True,
+) -> NotificationDelivery:
+    """Queue a NotificationDelivery record on the batched delivery log.
+
+    Unlike log_notification_delivery, the row is written by the shared
+    DeliveryLogBuffer with other deliveries in one INSERT. The returned
+    object is transient (not attached to any session). With wait=False the
+    row is persisted in the background and write errors are only logged.
+    """
+    row = dict(
+        id=uuid4(),
+        alert_trigger_id=trigger_id,
+        alert_id=alert_id,
+        user_id=user_id,
+        notification_type=notification_type.value,
+        status=status.value,
+        triggered_at=datetime.utcnow(),
+        message=message,
+        error_message=error_message,
+    )
+    await delivery_log_buffer.add(row, wait=wait)
+
+    # Audit log
+    notification_audit_log.log_notification_delivery(
+        alert_id=alert_id,
+        trigger_id=trigger_id,
+        notification_type=notification_type.value,
+        status=status.value,
+        delivery_id=row["id"],
+    )
+
+    return NotificationDelivery(**row)
+
+
 async def delete_notification_preference(
     db: AsyncSession,
     user_id: int,
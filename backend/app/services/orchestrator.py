@@ -10,6 +10,30 @@ from app.services.gap_detector import GapDetector
 
 logger = logging.getLogger(__name__)
 
+
+def _candle_dicts(
+    rows, symbol_id: int, ticker: str, interval: str
+) -> List[Dict[str, Any]]:
+    """Convert (timestamp, open, high, low, close, volume) rows to candle dicts.
+
+    interval and symbol_id are the query's own filters, so they are filled in
+    from the arguments rather than selected per row.
+    """
+    return [
+        {
+            "timestamp": timestamp,
+            "open": float(open_) if open_ is not None else None,
+            "high": float(high) if high is not None else None,
+            "low": float(low) if low is not None else None,
+            "close": float(close) if close is not None else None,
+            "volume": int(volume) if (volume is not None and math.isfinite(volume)) else 0,
+            "interval": interval,
+            "ticker": ticker,
+            "symbol_id": symbol_id,
+        }
+        for timestamp, open_, high, low, close, volume in rows
+    ]
+
 class DataOrchestrator:
     def __init__(self, candle_service: CandleService, yf_provider: YFinanceProvider):
         self.candle_service = candle_service
@@ -28,6 +52,10 @@ class DataOrchestrator:
         """
         Main entry point for getting candles.
         Checks cache, identifies gaps, fetches missing segments, and returns merged result.
+
+        The result is ordered by timestamp ascending with at most one candle per
+        timestamp (ORDER BY in the query + uix_candle_symbol_timestamp_interval),
+        so callers can build time series from it without re-sorting.
         """
         import time
         total_start = time.time()
@@ -85,7 +113,10 @@ class DataOrchestrator:
         from app.core.intervals import get_interval_delta
 
         db_start = time.time()
-        stmt = select(Candle).where(
+        # Only the columns callers use: plain Row tuples, no ORM instances
+        stmt = select(
+            Candle.timestamp, Candle.open, Candle.high, Candle.low, Candle.close, Candle.volume
+        ).where(
             Candle.symbol_id == symbol_id,
             Candle.interval == interval,
             Candle.timestamp >= start,
@@ -93,24 +124,7 @@ class DataOrchestrator:
         ).order_by(Candle.timestamp.asc())
 
         result = await db.execute(stmt)
-        candles = result.scalars().all()
-
-        # Convert SQLAlchemy objects to dictionaries immediately to avoid lazy-loading issues
-        # This ensures all attributes are loaded while we're still in the async context
-        candles = [
-            {
-                "timestamp": c.timestamp,
-                "open": float(c.open) if c.open is not None else None,
-                "high": float(c.high) if c.high is not None else None,
-                "low": float(c.low) if c.low is not None else None,
-                "close": float(c.close) if c.close is not None else None,
-                "volume": int(c.volume) if (c.volume is not None and math.isfinite(c.volume)) else 0,
-                "interval": c.interval,
-                "ticker": ticker,
-                "symbol_id": c.symbol_id,
-            }
-            for c in candles
-        ]
+        candles = _candle_dicts(result.all(), symbol_id, ticker, interval)
 
         db_time = (time.time() - db_start) * 1000
         logger.info(f"[TIMING] Database query took {db_time:.0f}ms for {ticker} ({interval}), returned {len(candles)} candles")
@@ -169,23 +183,7 @@ class DataOrchestrator:
 
                         # Re-query DB after filling gaps to get fresh data
                         result = await db.execute(stmt)
-                        candles = result.scalars().all()
-                        
-                        # Convert SQLAlchemy objects to dictionaries immediately
-                        candles = [
-                            {
-                                "timestamp": c.timestamp,
-                                "open": float(c.open) if c.open is not None else None,
-                                "high": float(c.high) if c.high is not None else None,
-                                "low": float(c.low) if c.low is not None else None,
-                                "close": float(c.close) if c.close is not None else None,
-                                "volume": int(c.volume) if (c.volume is not None and math.isfinite(c.volume)) else 0,
-                                "interval": c.interval,
-                                "ticker": ticker,
-                                "symbol_id": c.symbol_id,
-                            }
-                            for c in candles
-                        ]
+                        candles = _candle_dicts(result.all(), symbol_id, ticker, interval)
                         logger.info(f"📊 After gap fill: {len(candles)} candles")
                     except asyncio.TimeoutError:
                         logger.error(f"Gap filling timed out for {ticker} ({interval})")
@@ -6,6 +6,7 @@ Provides search functionality for stock symbols with yfinance fallback.
 import asyncio
 import logging
 import re
+import time
 import traceback
 from typing import Optional
 import yfinance as yf
@@ -18,6 +19,80 @@ from app.services.providers import yf_limiter
 
 logger = logging.getLogger(__name__)
 
+# How long the in-memory ticker index is served before being reloaded
+TICKER_INDEX_MAX_AGE_SECONDS = 3600
+
+
+class TickerIndex:
+    """In-memory copy of ticker_universe for typeahead lookups.
+
+    ticker_universe is a few thousand rows that only change when the seed
+    scripts run, so it is loaded once at startup and matched in-process
+    instead of running ILIKE scans per keystroke. Until load() has been
+    called, SearchService keeps querying the table directly.
+    """
+
+    def __init__(self):
+        # (ticker, display_name, exchange, TICKER, DISPLAY NAME)
+        self._rows: list[tuple] = []
+        self._by_ticker: dict[str, tuple] = {}
+        self._loaded_at: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > TICKER_INDEX_MAX_AGE_SECONDS
+        )
+
+    async def load(self, db: AsyncSession) -> None:
+        """(Re)build the index from ticker_universe."""
+        result = await db.execute(
+            select(TickerUniverse.ticker, TickerUniverse.display_name, TickerUniverse.exchange)
+            .order_by(TickerUniverse.id)
+        )
+        rows = [
+            (ticker, display_name, exchange, ticker.upper(), (display_name or '').upper())
+            for ticker, display_name, exchange in result.all()
+        ]
+        self._rows = rows
+        self._by_ticker = {row[3]: row for row in rows}
+        self._loaded_at = time.monotonic()
+        logger.info(f"Ticker index loaded with {len(rows)} tickers")
+
+    async def refresh_if_stale(self, db: AsyncSession) -> None:
+        """Reload a loaded index once it is older than the max age."""
+        if not self.is_loaded or not self.is_stale():
+            return
+        # Claim the refresh up front so concurrent searches keep using the
+        # current rows instead of reloading in parallel
+        self._loaded_at = time.monotonic()
+        try:
+            await self.load(db)
+        except Exception as e:
+            logger.warning(f"Ticker index refresh failed, keeping previous index: {e}")
+
+    def exact(self, normalized: str) -> Optional[tuple]:
+        """(ticker, display_name, exchange) for an upper-cased ticker, or None."""
+        row = self._by_ticker.get(normalized)
+        return row[:3] if row else None
+
+    def matches(self, normalized: str, limit: int = 10) -> list[tuple]:
+        """Rows whose ticker or display name contains the upper-cased query."""
+        found = []
+        for row in self._rows:
+            if normalized in row[3] or normalized in row[4]:
+                found.append(row[:3])
+                if len(found) == limit:
+                    break
+        return found
+
+
+ticker_index = TickerIndex()
+
 
 class SearchService:
     """Service for searching ticker symbols in the ticker universe and existing symbols."""
@@ -54,17 +129,20 @@ class SearchService:
         normalized = query.upper()
 
         # First try ticker_universe (exact match on ticker)
-        stmt_universe = (
-            select(
-                TickerUniverse.ticker.label('symbol'),
-                TickerUniverse.display_name.label('display_name'),
-                TickerUniverse.exchange.label('exchange')
+        if ticker_index.is_loaded:
+            ticker = ticker_index.exact(normalized)
+        else:
+            stmt_universe = (
+                select(
+                    TickerUniverse.ticker.label('symbol'),
+                    TickerUniverse.display_name.label('display_name'),
+                    TickerUniverse.exchange.label('exchange')
+                )
+                .where(TickerUniverse.ticker == normalized)
+                .limit(1)
             )
-            .where(TickerUniverse.ticker == normalized)
-            .limit(1)
-        )
-        result_universe = await self.db.execute(stmt_universe)
-        ticker = result_universe.fetchone()
+            result_universe = await self.db.execute(stmt_universe)
+            ticker = result_universe.fetchone()
         if ticker:
             return {
                 'symbol': ticker[0],
@@ -101,24 +179,27 @@ class SearchService:
         pattern = f"%{query.upper()}%"
 
         # Search in ticker_universe table (US equities)
-        logger.debug(f"Searching ticker_universe for pattern: {pattern}")
-        stmt_universe = (
-            select(
-                TickerUniverse.ticker.label('symbol'),
-                TickerUniverse.display_name.label('display_name'),
-                TickerUniverse.exchange.label('exchange')
-            )
-            .where(
-                or_(
-                    TickerUniverse.ticker.ilike(pattern),
-                    TickerUniverse.display_name.ilike(pattern)
+        if ticker_index.is_loaded:
+            tickers_universe = ticker_index.matches(query.upper())
+        else:
+            logger.debug(f"Searching ticker_universe for pattern: {pattern}")
+            stmt_universe = (
+                select(
+                    TickerUniverse.ticker.label('symbol'),
+                    TickerUniverse.display_name.label('display_name'),
+                    TickerUniverse.exchange.label('exchange')
+                )
+                .where(
+                    or_(
+                        TickerUniverse.ticker.ilike(pattern),
+                        TickerUniverse.display_name.ilike(pattern)
+                    )
                 )
+                .limit(10)
             )
-            .limit(10)
-        )
 
-        result_universe = await self.db.execute(stmt_universe)
-        tickers_universe = result_universe.fetchall()
+            result_universe = await self.db.execute(stmt_universe)
+            tickers_universe = result_universe.fetchall()
         logger.debug(f"ticker_universe returned {len(tickers_universe)} results")
 
         # Search in symbol table (includes international tickers added to watchlist)
@@ -206,6 +287,8 @@ class SearchService:
             raise ValueError("Query must be between 1 and 10 characters")
 
         try:
+            await ticker_index.refresh_if_stale(self.db)
+
             # 1. Check exact match in local DB FIRST (early exit)
             exact = await self._find_exact_ticker(query)
             if exact:
@@ -20,6 +20,7 @@ Usage:
     message_id = await send_telegram_message(token, chat_id, "Hello!")
 """
 
+import asyncio
 import logging
 from typing import Optional, Tuple
 
@@ -29,6 +30,36 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Bot API requests across all callers, so a burst
+# of validations/sends can't open an unbounded number of connections.
+MAX_CONCURRENT_REQUESTS = 32
+_request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# One pooled client for every Bot API call: keep-alive connections skip the
+# TCP/TLS handshake per request. Timeouts are passed per call.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the lazily created shared Bot API client."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+            )
+        )
+    return _client
+
+
+async def close_telegram_client() -> None:
+    """Close the shared Bot API client, if one was opened."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class TelegramError(Exception):
     """Exception raised when Telegram API operations fail."""
@@ -60,9 +91,11 @@ async def validate_telegram_credentials(
     """
     try:
         # Test getMe endpoint to verify token
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with _request_slots:
+            client = _get_client()
             response = await client.get(
-                f"https://api.telegram.org/bot{token}/getMe"
+                f"https://api.telegram.org/bot{token}/getMe",
+                timeout=10.0,
             )
             data = response.json()
 
@@ -114,7 +147,8 @@ async def send_telegram_message(
         TelegramError: If the message fails to send
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with _request_slots:
+            client = _get_client()
             response = await client.post(
                 f"https://api.telegram.org/bot{token}/sendMessage",
                 json={
@@ -123,6 +157,7 @@ async def send_telegram_message(
                     "parse_mode": parse_mode,
                     "disable_web_page_preview": True,
                 },
+                timeout=30.0,
             )
             data = response.json()
 
@@ -182,7 +217,8 @@ async def send_telegram_photo(
         TelegramError: If the photo fails to send
     """
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with _request_slots:
+            client = _get_client()
             payload = {
                 "chat_id": chat_id,
                 "photo": photo_url,
@@ -194,6 +230,7 @@ async def send_telegram_photo(
             response = await client.post(
                 f"https://api.telegram.org/bot{token}/sendPhoto",
                 json=payload,
+                timeout=60.0,
             )
             data = response.json()
 
@@ -238,13 +275,15 @@ async def delete_telegram_message(
         TelegramError: If the deletion fails
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with _request_slots:
+            client = _get_client()
             response = await client.post(
                 f"https://api.telegram.org/bot{token}/deleteMessage",
                 json={
                     "chat_id": chat_id,
                     "message_id": message_id,
                 },
+                timeout=10.0,
             )
             data = response.json()
 
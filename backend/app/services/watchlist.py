@@ -7,6 +7,7 @@ historical data backfill.
 import asyncio
 import logging
 from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +16,7 @@ from sqlalchemy.exc import IntegrityError
 from app.models.watchlist import WatchlistEntry
 from app.models.symbol import Symbol
 from app.services.backfill import BackfillService
+from app.services.cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +88,50 @@ async def get_or_create_symbol(db: AsyncSession, ticker: str) -> Symbol | None:
     return symbol
 
 
+class SymbolRef(NamedTuple):
+    """Immutable (id, ticker) of a Symbol row, safe to share across sessions."""
+    id: int
+    ticker: str
+
+
+# Uppercased ticker -> SymbolRef for the read-only hot paths below. Only
+# symbols loaded from the DB are cached: newly created ones are not committed
+# yet, and misses are not cached so new tickers resolve as soon as they exist.
+# Plain values are cached rather than Symbol instances, which a rollback in
+# the session that loaded them would expire.
+_symbol_cache = LRUCache(max_size=4096, ttl_seconds=60)
+
+
+async def resolve_symbol(db: AsyncSession, ticker: str) -> SymbolRef | None:
+    """Cached get_or_create_symbol for callers that only need the id and ticker."""
+    return (await resolve_symbols(db, [ticker]))[ticker.upper()]
+
+
+async def resolve_symbols(db: AsyncSession, tickers: List[str]) -> Dict[str, SymbolRef | None]:
+    """Cached get_or_create_symbols; see resolve_symbol."""
+    symbols: Dict[str, SymbolRef | None] = {}
+    missing = []
+    for ticker in dict.fromkeys(ticker.upper() for ticker in tickers):
+        symbol = _symbol_cache.get(ticker)
+        if symbol is None:
+            missing.append(ticker)
+        else:
+            symbols[ticker] = symbol
+    if not missing:
+        return symbols
+
+    result = await db.execute(select(Symbol.id, Symbol.ticker).where(Symbol.ticker.in_(missing)))
+    for symbol_id, symbol_ticker in result.all():
+        symbol = SymbolRef(symbol_id, symbol_ticker)
+        symbols[symbol_ticker] = symbol
+        _symbol_cache.set(symbol_ticker, symbol)
+
+    for ticker in missing:
+        if ticker not in symbols:
+            created = await get_or_create_symbol(db, ticker)
+            symbols[ticker] = SymbolRef(created.id, created.ticker) if created else None
+    return symbols
+
 class WatchlistService:
     """Service for managing the global shared watchlist."""
 
@@ -683,6 +683,28 @@ async def test_query_params_override_json_params(mock_orchestrator):
     app.dependency_overrides.clear()
 
 
+@pytest.mark.asyncio
+async def test_shared_cache_key_uses_coerced_params(mock_orchestrator):
+    """Test: the shared (Redis) cache key is built from coerced params."""
+    app.dependency_overrides[get_db] = override_get_db
+
+    transport = ASGITransport(app=app)
+    with patch("app.services.cache.get_indicator_result", return_value=None), \
+         patch("app.services.cache.generate_shared_indicator_key", return_value="shared-key") as key_fn, \
+         patch("app.services.cache.get_shared_response", AsyncMock(return_value=b'{"cached": true}')):
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            # Legacy JSON params may carry 50.0 for an integer parameter
+            response = await ac.get("/api/v1/indicators/IBM/sma?interval=1d&params=%7B%22period%22%3A%2050.0%7D")
+
+    assert response.status_code == 200
+    assert response.json() == {"cached": True}
+    params = key_fn.call_args.kwargs["params"]
+    assert params == {"period": 50}
+    assert isinstance(params["period"], int)
+
+    app.dependency_overrides.clear()
+
+
 # ============================================================================
 # Feature 007: User Story 5 - Discovery Endpoint Tests
 # ============================================================================
@@ -1357,6 +1379,71 @@ async def test_uncached_indicator_p90_under_500ms(mock_orchestrator):
     app.dependency_overrides.clear()
 
 
+def test_streamed_indicator_json_matches_model_dump():
+    """Chunked encoding of a large IndicatorOutput decodes to the same document."""
+    import orjson
+    from datetime import datetime
+    from fastapi.responses import StreamingResponse
+    from app.api.v1.indicators import _indicator_response, _iter_indicator_json
+    from app.schemas.indicator import IndicatorOutput
+
+    n = 10_000
+    result = IndicatorOutput.model_construct(
+        symbol="IBM",
+        interval="1d",
+        timestamps=list(range(n)),
+        data={"a": [None if i % 7 == 0 else i * 0.5 for i in range(n)], "b": [1.0] * n},
+        metadata={"display_type": "pane"},
+        calculated_at=datetime(2024, 1, 1),
+        data_points=n,
+    )
+
+    body = b"".join(_iter_indicator_json(result))
+    assert orjson.loads(body) == orjson.loads(orjson.dumps(result.model_dump()))
+    assert isinstance(_indicator_response(result), StreamingResponse)
+
+
+@pytest.mark.asyncio
+async def test_publish_streamed_skips_bodies_over_cap():
+    """Streamed bodies are published only while they fit under the size cap."""
+    from app.api.v1.indicators import _publish_streamed
+
+    published = []
+
+    async def publish(body):
+        published.append(body)
+
+    chunks = [b"ab", b"cd", b"ef"]
+    assert [c async for c in _publish_streamed(iter(chunks), publish, max_bytes=6)] == chunks
+    assert published == [b"abcdef"]
+
+    published.clear()
+    assert [c async for c in _publish_streamed(iter(chunks), publish, max_bytes=5)] == chunks
+    assert published == []
+
+
+def test_array_io_indicator_skips_frame_with_same_output():
+    """Array-native indicators computed from candle dicts match the DataFrame route."""
+    import pandas as pd
+    from datetime import datetime, timezone
+    from app.api.v1.indicators import _compute_indicator_frame, _compute_indicator_sync
+    from app.services.indicator_registry.registry import TDFIIndicator
+    from app.services.indicator_service import candles_to_frame
+
+    timestamps = pd.date_range("2024-01-01", periods=120, freq="h", tz="UTC")
+    candles = [
+        {"timestamp": ts.to_pydatetime(), "open": 1.0, "high": 2.0, "low": 0.5, "close": 100.0 + (i % 9), "volume": 10}
+        for i, ts in enumerate(timestamps)
+    ]
+    window = (datetime(2024, 1, 2, tzinfo=timezone.utc), datetime(2024, 1, 4, tzinfo=timezone.utc))
+
+    indicator = TDFIIndicator()
+    direct = _compute_indicator_sync(candles, indicator, {}, 100, *window)
+    via_frame = _compute_indicator_frame(candles_to_frame(candles), indicator, {}, 100, *window)
+    assert direct[:2] == via_frame[:2]
+    assert len(direct[0]) == 49
+
+
 
 # =============================================================================
 # Feature 014: Phase 4 - Batch API Tests (T028-T041)
@@ -1611,6 +1698,15 @@ async def test_batch_endpoint_exceeds_max_size(mock_orchestrator):
     app.dependency_overrides.clear()
 
 
+def test_batch_endpoint_documents_request_schema():
+    """Test: the batch request body is documented in the OpenAPI schema."""
+    operation = app.openapi()["paths"]["/api/v1/indicators/batch"]["post"]
+    schema = operation["requestBody"]["content"]["application/json"]["schema"]
+
+    assert schema == {"$ref": "#/components/schemas/BatchIndicatorRequest"}
+    assert operation["requestBody"]["required"] is True
+
+
 @pytest.mark.asyncio
 async def test_batch_endpoint_handles_partial_failures(mock_orchestrator):
     """Test: batch endpoint continues processing when individual indicators fail."""
@@ -9,14 +9,24 @@ Tests the symbol search endpoint with yfinance fallback:
 - Empty results when no matches
 """
 
+import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import MagicMock, AsyncMock, patch
 from app.main import app
 from app.db.session import get_db
+from app.api.v1.search import _search_cache
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Each test mocks its own DB results, so don't serve earlier ones."""
+    _search_cache.clear()
+    yield
+    _search_cache.clear()
+
+
 def test_get_symbols_search_success():
     """
     T017 [US1] Integration test: GET /api/v1/symbols/search returns matching symbols
@@ -361,3 +371,33 @@ def test_get_symbols_search_exact_local_match_priority():
     assert data[0]['display_name'] == 'Apple Inc. Local'
     # yfinance should not have been called
     mock_thread.assert_not_called()
+
+
+def test_get_symbols_search_repeated_query_is_cached():
+    """Repeated queries (any case) are served from the search cache without touching the DB."""
+    mock_session = AsyncMock()
+    calls = []
+
+    async def mock_execute(*args, **kwargs):
+        calls.append(args)
+        result_mock = MagicMock()
+        result_mock.fetchone.return_value = ('ZZZQ', 'Test Corp', 'NMS')
+        return result_mock
+
+    mock_session.execute = mock_execute
+
+    def override_get_db():
+        yield mock_session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    first = client.get("/api/v1/symbols/search?q=zzzq")
+    second = client.get("/api/v1/symbols/search?q=ZZZQ")
+
+    app.dependency_overrides = {}
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json() == [
+        {'symbol': 'ZZZQ', 'display_name': 'Test Corp', 'exchange': 'NMS'}
+    ]
+    assert len(calls) == 1
@@ -1,4 +1,7 @@
-from app.core.intervals import get_canonical_interval, get_interval_delta, get_lookback_cap
+from app.core.intervals import (
+    get_canonical_interval, get_interval_delta, get_lookback_cap,
+    get_interval_seconds, get_lookback_cap_seconds,
+)
 from datetime import timedelta
 
 def test_canonical_mapping():
@@ -16,3 +19,8 @@ def test_lookback_caps():
     assert get_lookback_cap("1m") == timedelta(days=7)
     assert get_lookback_cap("1h") == timedelta(days=729)
     assert get_lookback_cap("1d") >= timedelta(days=365)
+
+def test_interval_seconds_match_deltas():
+    assert get_interval_seconds("60m") == 3600
+    assert get_interval_seconds("unknown") == 86400
+    assert get_lookback_cap_seconds("1m") == int(timedelta(days=7).total_seconds())
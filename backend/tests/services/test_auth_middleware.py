@@ -163,3 +163,64 @@ class TestGetCurrentUser:
             # Could be either generic or session-expired message
             detail = exc_info.value.detail.lower()
             assert 'auth' in detail or 'session' in detail or 'expired' in detail
+
+
+class TestGetCurrentUserId:
+    """Test suite for the users.id resolver built on get_current_user."""
+
+    @pytest.mark.asyncio
+    async def test_positive_lookups_are_cached(self):
+        """Known users resolve from the cache; unknown users are re-queried."""
+        from unittest.mock import AsyncMock
+        from app.services.auth_middleware import _user_id_cache, get_current_user_id
+
+        _user_id_cache.clear()
+        db = AsyncMock()
+        db.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=42))
+
+        assert await get_current_user_id({'uid': 'uid-cached'}, db) == 42
+        assert await get_current_user_id({'uid': 'uid-cached'}, db) == 42
+        assert db.execute.await_count == 1
+
+        db.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+        assert await get_current_user_id({'uid': 'uid-missing'}, db) is None
+        assert await get_current_user_id({'uid': 'uid-missing'}, db) is None
+        assert db.execute.await_count == 3
+        _user_id_cache.clear()
+
+
+class TestGetCurrentUserProfile:
+    """Test suite for the request-scoped User row dependency."""
+
+    @pytest.mark.asyncio
+    async def test_user_row_is_reused_within_a_request(self):
+        """The first lookup is stored on request.state; later calls skip the DB."""
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock
+        from app.services.auth_middleware import _user_id_cache, get_current_user_profile
+
+        _user_id_cache.clear()
+        db_user = Mock(id=7)
+        db = AsyncMock()
+        db.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=db_user))
+        request = SimpleNamespace(state=SimpleNamespace())
+
+        assert await get_current_user_profile(request, {'uid': 'uid-profile'}, db) is db_user
+        assert await get_current_user_profile(request, {'uid': 'uid-profile'}, db) is db_user
+        assert db.execute.await_count == 1
+        assert _user_id_cache.get('uid-profile') == 7
+        _user_id_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_missing_profile_is_404(self):
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock
+        from app.services.auth_middleware import get_current_user_profile
+
+        db = AsyncMock()
+        db.execute.return_value = Mock(scalar_one_or_none=Mock(return_value=None))
+        request = SimpleNamespace(state=SimpleNamespace())
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user_profile(request, {'uid': 'uid-none'}, db)
+        assert exc_info.value.status_code == 404
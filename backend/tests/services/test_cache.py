@@ -16,11 +16,18 @@ from app.services.cache import (
     get_candle_data,
     cache_candle_data,
     generate_indicator_cache_key,
+    generate_indicator_series_key,
     get_indicator_result,
     cache_indicator_result,
+    get_indicator_body,
+    cache_indicator_body,
     invalidate_symbol,
     candle_cache,
     indicator_cache,
+    indicator_body_cache,
+    generate_shared_indicator_key,
+    get_shared_response,
+    set_shared_response,
 )
 
 
@@ -195,6 +202,30 @@ class TestIndicatorCacheKeyGeneration:
 
         assert key1 == key2, "Cache keys should be identical regardless of param order"
 
+    def test_indicator_cache_key_precomputed_params_key(self):
+        """Test that a precomputed params_key yields the same cache key."""
+        params = {"b": 2, "a": 1}
+        key1 = generate_indicator_cache_key("SPY", "1d", "crsi", params)
+        key2 = generate_indicator_cache_key(
+            "SPY", "1d", "crsi", params, params_key=tuple(sorted(params.items()))
+        )
+
+        assert key1 == key2, "params_key should match the key built from params"
+
+    def test_indicator_series_key_tracks_last_candle(self):
+        """Test that a new or updated last bar changes the series key."""
+        ts = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        last = {"timestamp": ts, "close": 101.0, "volume": 500}
+        params_key = (("period", 20),)
+
+        key = generate_indicator_series_key(1, "1d", "sma", params_key, last, 300)
+
+        assert key == generate_indicator_series_key(1, "1d", "sma", params_key, dict(last), 300)
+        assert key != generate_indicator_series_key(1, "1d", "sma", params_key, {**last, "close": 102.0}, 300)
+        assert key != generate_indicator_series_key(
+            1, "1d", "sma", params_key, {**last, "timestamp": ts + timedelta(days=1)}, 301
+        )
+
 
 class TestIndicatorCacheSetAndGet:
     """Tests for T017: Indicator cache set and get operations."""
@@ -224,6 +255,20 @@ class TestIndicatorCacheSetAndGet:
         cached = get_indicator_result("INVALID", "1d", "sma", {"period": 20})
         assert cached is None, "Cache miss should return None"
 
+    def test_indicator_body_cached_beside_result(self):
+        """Test that the serialized body is cached apart from the result."""
+        indicator_body_cache.clear()
+        params = {"period": 20}
+        cache_indicator_result("AAPL", "1d", "sma", params, {"data_points": 1})
+        assert get_indicator_body("AAPL", "1d", "sma", params) is None
+
+        cache_indicator_body("AAPL", "1d", "sma", params, b'{"data_points":1}')
+        assert get_indicator_body("AAPL", "1d", "sma", params) == b'{"data_points":1}'
+        assert get_indicator_result("AAPL", "1d", "sma", params) == {"data_points": 1}
+
+        invalidate_symbol("AAPL")
+        assert get_indicator_body("AAPL", "1d", "sma", params) is None
+
 
 class TestIndicatorCacheInvalidation:
     """Tests for T018: Indicator cache invalidation."""
@@ -319,3 +364,31 @@ class TestCacheFailureHandling:
             assert True, "Invalidation on empty cache should not raise"
         except Exception as e:
             assert False, f"invalidate_symbol should not raise exceptions: {e}"
+
+
+class TestSharedIndicatorCache:
+    """Tests for the optional Redis-backed indicator response cache."""
+
+    def test_shared_key_params_order(self):
+        """Parameter order should not change the shared key."""
+        key1 = generate_shared_indicator_key("SPY", "1d", "tdfi", {"lookback": 13, "filter_high": 0.05}, None, None, 1)
+        key2 = generate_shared_indicator_key("SPY", "1d", "tdfi", {"filter_high": 0.05, "lookback": 13}, None, None, 1)
+
+        assert key1 == key2
+        assert key1.startswith("indicator:")
+
+    def test_shared_key_changes_with_bucket(self):
+        """A new candle period must produce a new key."""
+        key1 = generate_shared_indicator_key("SPY", "1d", "sma", {"period": 20}, None, None, 100)
+        key2 = generate_shared_indicator_key("SPY", "1d", "sma", {"period": 20}, None, None, 101)
+
+        assert key1 != key2
+
+    async def test_shared_cache_disabled_without_redis_url(self, monkeypatch):
+        """Without REDIS_URL the shared cache is a silent no-op."""
+        import app.services.cache as cache_module
+        monkeypatch.setattr(cache_module.settings, "REDIS_URL", None)
+        monkeypatch.setattr(cache_module, "_redis_client", None)
+
+        await set_shared_response("indicator:test", b"{}", 60)
+        assert await get_shared_response("indicator:test") is None
@@ -0,0 +1,60 @@
+import pytest
+import asyncio
+from app.services.delivery_log_buffer import DeliveryLogBuffer
+
+
+class FakeSession:
+    def __init__(self, calls, fail=False, bad_ids=()):
+        self.calls = calls
+        self.fail = fail
+        self.bad_ids = bad_ids
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt, rows):
+        if self.fail:
+            raise RuntimeError("db down")
+        if any(row["id"] in self.bad_ids for row in rows):
+            raise ValueError("bad row")
+        self.calls.append(list(rows))
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rows_are_written_in_batches():
+    calls = []
+    buffer = DeliveryLogBuffer(lambda: FakeSession(calls), max_batch_size=3)
+
+    await asyncio.gather(*[buffer.add({"id": i}) for i in range(5)])
+
+    assert [[row["id"] for row in batch] for batch in calls] == [[0, 1, 2], [3, 4]]
+
+
+@pytest.mark.asyncio
+async def test_write_errors_reach_waiting_callers_only():
+    buffer = DeliveryLogBuffer(lambda: FakeSession([], fail=True))
+
+    await buffer.add({"id": 1}, wait=False)
+    with pytest.raises(RuntimeError, match="db down"):
+        await buffer.add({"id": 2})
+    await buffer.flush()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_row_by_row():
+    calls = []
+    buffer = DeliveryLogBuffer(lambda: FakeSession(calls, bad_ids={1}))
+
+    results = await asyncio.gather(
+        *[buffer.add({"id": i}) for i in range(3)], return_exceptions=True
+    )
+
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], ValueError)
+    assert calls == [[{"id": 0}], [{"id": 2}]]
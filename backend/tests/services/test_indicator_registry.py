@@ -688,6 +688,106 @@ def test_load_test_100_plus_instances():
     print(f"✓ list_indicators_with_metadata: {elapsed_ms:.2f}ms for 150 indicators")
 
 
+def test_compiled_param_spec_matches_parameter_definitions():
+    """compiled_param_spec flattens parameter_definitions into ParamRules."""
+    tdfi = TDFIIndicator()
+    defs = tdfi.parameter_definitions
+    rules = {rule.name: rule for rule in tdfi.compiled_param_spec}
+
+    assert set(rules) == set(defs)
+    for name, param_def in defs.items():
+        rule = rules[name]
+        assert rule.min_v == param_def.min
+        assert rule.max_v == param_def.max
+        assert rule.coercer(param_def.default) == param_def.default
+
+    # Cached per instance
+    assert tdfi.compiled_param_spec is tdfi.compiled_param_spec
+
+
+def test_validate_params_coerces_request_values():
+    """validate_params(coerce=True) converts in place and reports every problem."""
+    import pytest
+
+    sma = SMAIndicator()
+
+    params = {"period": "50"}
+    sma.validate_params(params, coerce=True)
+    assert params["period"] == 50
+
+    params = {"period": 20.0}
+    sma.validate_params(params, coerce=True)
+    assert params["period"] == 20 and isinstance(params["period"], int)
+
+    with pytest.raises(ValueError, match="must be >= 2"):
+        sma.validate_params({"period": 1}, coerce=True)
+
+    for bad in ("abc", "inf", "1e400", float("inf"), float("nan"), 20.5, True):
+        with pytest.raises(ValueError, match="must be an integer"):
+            sma.validate_params({"period": bad}, coerce=True)
+
+    assert sma.param_names == frozenset(sma.parameter_definitions)
+
+    # Without coerce, values must already have the declared type
+    with pytest.raises(ValueError, match="must be an integer"):
+        sma.validate_params({"period": "50"})
+
+
+def test_boolean_param_coercion():
+    """Boolean parameters accept bools and true/false strings."""
+    from app.services.indicator_registry.registry import _PARAM_TYPE_RULES
+
+    _, to_bool, _ = _PARAM_TYPE_RULES["boolean"]
+    assert to_bool(True) is True
+    assert to_bool(" TRUE ") is True
+    assert to_bool("0") is False
+    with pytest.raises(ValueError):
+        to_bool("maybe")
+
+
+def test_sma_calculate_arrays_matches_calculate():
+    """SMA's array I/O path matches its DataFrame path."""
+    import numpy as np
+    import pandas as pd
+
+    sma = SMAIndicator()
+    assert sma.supports_array_io
+    assert not cRSIIndicator().supports_array_io
+
+    np.random.seed(42)
+    close = 100 + np.random.randn(100).cumsum()
+    close[30] = np.nan
+
+    expected = sma.calculate(pd.DataFrame({"close": close}), period=10)["sma"].to_numpy()
+    result = sma.calculate_arrays({"close": close}, period=10)["sma"]
+
+    np.testing.assert_allclose(result, expected, equal_nan=True)
+
+
+def test_ema_and_tdfi_calculate_arrays_match_calculate():
+    """EMA and TDFI array I/O paths match their DataFrame paths."""
+    import numpy as np
+    import pandas as pd
+
+    np.random.seed(7)
+    close = 100 + np.random.randn(200).cumsum()
+    df = pd.DataFrame({"close": close})
+
+    ema = EMAIndicator()
+    assert ema.supports_array_io
+    np.testing.assert_allclose(
+        ema.calculate_arrays({"close": close}, period=12)["ema"],
+        ema.calculate(df, period=12)["ema"].to_numpy(),
+    )
+
+    tdfi = TDFIIndicator()
+    assert tdfi.supports_array_io
+    expected = tdfi.calculate(df, lookback=5)
+    result = tdfi.calculate_arrays({"close": close}, lookback=5)
+    np.testing.assert_allclose(result["TDFI"], expected["TDFI"].to_numpy())
+    np.testing.assert_array_equal(result["TDFI_Signal"], expected["TDFI_Signal"].to_numpy())
+
+
 # =============================================================================
 # Feature 006: Parameter Serialization Tests (T052-T055)
 # =============================================================================
@@ -1269,6 +1369,31 @@ def test_auto_registered_indicator_calculation():
         assert len(output_cols) > 0, f"Indicator {name} has no output columns"
 
 
+def test_native_weighted_moving_averages_match_rolling_apply():
+    """Test that vectorized WMA/SINWMA match the rolling().apply() definition."""
+    import pandas as pd
+    import numpy as np
+    from app.services.indicator_registry import pandas_ta_wrapper
+
+    np.random.seed(42)
+    close = pd.Series(100 + np.random.randn(200).cumsum())
+    close[30] = np.nan
+
+    length = 10
+    linear = np.arange(1, length + 1) / (0.5 * length * (length + 1))
+    sines = np.sin(np.arange(1, length + 1) * np.pi / (length + 1))
+    cases = [("wma", "WMA_10", linear), ("sinwma", "SINWMA_10", sines / sines.sum())]
+
+    for name, column, weights in cases:
+        expected = close.rolling(length, min_periods=length).apply(
+            lambda x: np.dot(weights, x), raw=True
+        )
+        result = pandas_ta_wrapper.get_pandas_ta_function(name)(close=close, length=length)
+
+        assert result.name == column
+        pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
 def test_auto_registered_indicator_metadata():
     """Test that auto-registered indicators have valid metadata."""
     from app.services.indicator_registry import pandas_ta_wrapper
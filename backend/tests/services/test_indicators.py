@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from app.services.indicators import calculate_tdfi, calculate_crsi, calculate_adxvma, calculate_sma
+from app.services.indicators import calculate_tdfi, calculate_crsi, calculate_adxvma, calculate_sma, rolling_quantiles
 
 def test_calculate_tdfi_basic():
     # Example data (replace with realistic values for a proper test)
@@ -102,6 +102,18 @@ def test_sma_period_3():
     assert result['sma'].iloc[4] == pytest.approx(40.0)
 
 
+def test_rolling_quantiles_matches_pandas():
+    """rolling_quantiles agrees with Series.rolling().quantile(), NaN windows included."""
+    values = np.random.default_rng(0).normal(50, 10, 300)
+    values[120] = np.nan
+
+    upper, lower = rolling_quantiles(values, 40, (0.89, 0.11))
+
+    rolling = pd.Series(values).rolling(window=40, min_periods=40)
+    np.testing.assert_allclose(upper, rolling.quantile(0.89).to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(lower, rolling.quantile(0.11).to_numpy(), equal_nan=True)
+
+
 class TestInsufficientDataHandling:
     """T110b: Test insufficient data handling (partial null values)."""
 
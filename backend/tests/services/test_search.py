@@ -464,3 +464,31 @@ async def test_looks_like_ticker_validation():
     # Invalid - special chars
     assert service._looks_like_ticker("@#$%") is False
     assert service._looks_like_ticker("A@PL") is False
+
+
+@pytest.mark.asyncio
+async def test_ticker_index_matches_like_universe_query():
+    """TickerIndex answers exact and partial (ticker or name) lookups in memory."""
+    from app.services.search import TickerIndex
+
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_result = MagicMock()
+    mock_result.all.return_value = [
+        ('AAPL', 'Apple Inc.', 'NMS'),
+        ('MU', 'Micron Technology', 'NMS'),
+        ('MSFT', 'Microsoft Corporation', 'NMS'),
+    ]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    index = TickerIndex()
+    assert not index.is_loaded
+    await index.load(mock_session)
+
+    assert index.exact('AAPL') == ('AAPL', 'Apple Inc.', 'NMS')
+    assert index.exact('AAP') is None
+    assert index.matches('MICRO') == [
+        ('MU', 'Micron Technology', 'NMS'),
+        ('MSFT', 'Microsoft Corporation', 'NMS'),
+    ]
+    assert index.matches('M', limit=1) == [('MU', 'Micron Technology', 'NMS')]
+    assert not index.is_stale()
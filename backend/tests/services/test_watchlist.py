@@ -277,3 +277,29 @@ async def test_list_watchlist_empty():
         result = await service.list_watchlist()
 
         assert result == []
+
+
+@pytest.mark.asyncio
+async def test_resolve_symbols_caches_only_loaded_symbols():
+    """Existing symbols come from one query and are cached; created ones are not."""
+    from app.services.watchlist import SymbolRef, _symbol_cache, resolve_symbols
+
+    _symbol_cache.clear()
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_result = MagicMock()
+    mock_result.all.return_value = [(1, "AAPL")]
+    mock_session.execute.return_value = mock_result
+
+    created = MagicMock()
+    created.id = 2
+    created.ticker = "MSFT"
+    with patch("app.services.watchlist.get_or_create_symbol", AsyncMock(return_value=created)) as mock_create:
+        symbols = await resolve_symbols(mock_session, ["aapl", "MSFT", "AAPL"])
+        assert symbols == {"AAPL": SymbolRef(1, "AAPL"), "MSFT": SymbolRef(2, "MSFT")}
+        mock_session.execute.assert_called_once()
+        mock_create.assert_called_once_with(mock_session, "MSFT")
+
+        mock_session.execute.reset_mock()
+        assert await resolve_symbols(mock_session, ["AAPL"]) == {"AAPL": SymbolRef(1, "AAPL")}
+        mock_session.execute.assert_not_called()
+    _symbol_cache.clear()
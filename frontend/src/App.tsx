@@ -539,7 +539,9 @@ function AppContent({ symbol, setSymbol }: AppContentProps) {
     // Skip WS updates until initial REST data has loaded (prevents visual flicker).
     // Also checks prevCandles.length inside setCandles to prevent processing messages when REST failed/returned empty.
     if (lastMessage && !isInitialLoading) {
-      const newCandle = JSON.parse(lastMessage.data);
+      // WS payload is a positional array: [timestamp, open, high, low, close, volume]
+      const [timestamp, open, high, low, close, volume] = JSON.parse(lastMessage.data);
+      const newCandle = { timestamp, open, high, low, close, volume };
       setCandles(prevCandles => {
         // Skip processing if REST data hasn't loaded successfully (empty or failed)
         if (prevCandles.length === 0) {